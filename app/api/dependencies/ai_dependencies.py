@@ -50,7 +50,12 @@ async def get_vector_index(
             embedding_dimension=settings.EMBEDDING_DIMENSION,
         )
     elif vector_db_type == "faiss":
-        return FaissVectorIndex(dimension=settings.EMBEDDING_DIMENSION)
+        return FaissVectorIndex(
+            dimension=settings.EMBEDDING_DIMENSION,
+            quantization=settings.VECTOR_QUANTIZATION,
+            pq_subvectors=settings.PQ_SUBVECTORS,
+            pq_bits=settings.PQ_BITS,
+        )
     elif vector_db_type == "milvus":
         return MilvusVectorIndex(
             collection_name=settings.MILVUS_COLLECTION_NAME,
@@ -60,7 +65,12 @@ async def get_vector_index(
         )
     else:
         # Fallback to FAISS
-        return FaissVectorIndex(dimension=settings.EMBEDDING_DIMENSION)
+        return FaissVectorIndex(
+            dimension=settings.EMBEDDING_DIMENSION,
+            quantization=settings.VECTOR_QUANTIZATION,
+            pq_subvectors=settings.PQ_SUBVECTORS,
+            pq_bits=settings.PQ_BITS,
+        )
 
 def get_llm_service() -> LLMFactory:
     return LLMFactory()
@@ -63,7 +63,7 @@ async def create_document(
     return DocumentResponse(
         id=saved_doc.id,
         content=saved_doc.content,
-        metadata=saved_doc.document_metadata,  # Changed to match DB model
+        metadata=saved_doc.extra_metadata,
         created_at=saved_doc.created_at,
         updated_at=saved_doc.updated_at
     )
@@ -86,12 +86,12 @@ async def list_documents(
     List[DocumentResponse]
         A list of document responses.
     """
-    documents = await document_repository.get_all()
+    documents = await document_repository.get_all(with_embedding=False)
     return [
         DocumentResponse(
             id=doc.id,
             content=doc.content,
-            metadata=doc.document_metadata,  # Changed to match DB model
+            metadata=doc.extra_metadata,
             created_at=doc.created_at,
             updated_at=doc.updated_at
         )
@@ -124,14 +124,14 @@ async def get_document(
     HTTPException
         If the document is not found.
     """
-    document = await document_repository.get_by_id(document_id)
+    document = await document_repository.get_by_id(document_id, with_embedding=False)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
 
     return DocumentResponse(
         id=document.id,
         content=document.content,
-        metadata=document.document_metadata,  # Changed to match DB model
+        metadata=document.extra_metadata,
         created_at=document.created_at,
         updated_at=document.updated_at
     )
@@ -74,7 +74,7 @@ async def get_themes(
         # Add document count to each theme
         result = []
         for theme in themes:
-            document_ids = [doc.document_id for doc in theme.documents] if theme.documents else []
+            document_ids = [doc.id for doc in theme.documents] if theme.documents else []
             result.append({
                 "id": theme.id,
                 "name": theme.name,
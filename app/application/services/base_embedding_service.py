@@ -1,8 +1,8 @@
 # core/services/base_embedding_service.py
-from typing import List
+from typing import List, Optional
 
 from domain.entities.document import Document
-from domain.interfaces.embedding import EmbeddingInterface
+from domain.interfaces.embedding import EmbeddingInterface, EmbeddingMatrix, EmbeddingVector
 from utils.logger_util import get_logger
 
 logger = get_logger(__name__)
@@ -28,42 +28,59 @@ class BaseEmbeddingService(EmbeddingInterface):
         self.batch_size = batch_size
         logger.info(f"Initialized embedding service with model: {model_name}")
 
-    async def embed_text(self, text: str) -> List[float]:
+    async def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> EmbeddingMatrix:
+        """
+        Generate embeddings for a list of texts in batches.
+
+        This method must be implemented by concrete classes.
+        The base implementation raises NotImplementedError.
+
+        Args:
+            texts: List of text strings to embed
+            batch_size: Maximum number of texts per model call, defaults to `self.batch_size`
+
+        Returns:
+            Float32 matrix with one embedding row per input text
+
+        Raises:
+            NotImplementedError: This method must be implemented by subclasses
+        """
+        raise NotImplementedError("Subclasses must implement embed_batch")
+
+    async def embed_text(self, text: str) -> EmbeddingVector:
         """
         Generate an embedding for a text string.
 
-        Default implementation that calls get_embedding.
-        Concrete classes should override this if they have a more efficient implementation.
+        Thin wrapper over embed_batch; prefer embed_batch for multiple texts.
 
         Args:
             text: The text string to be embedded
 
         Returns:
-            Embedding vector as a list of floats
+            Float32 embedding vector
         """
         return await self.get_embedding(text)
 
-    async def get_embedding(self, text: str) -> List[float]:
+    async def get_embedding(self, text: str) -> EmbeddingVector:
         """
         Generate an embedding for a single text input.
 
-        Default implementation that calls get_embeddings.
-        Concrete classes should override this if they have a more efficient implementation.
+        Thin wrapper over embed_batch; prefer embed_batch for multiple texts.
 
         Args:
             text: The input text to embed
 
         Returns:
-            Embedding vector as a list of floats
+            Float32 embedding vector
         """
-        embeddings = await self.get_embeddings([text])
-        return embeddings[0] if embeddings else []
+        embeddings = await self.embed_batch([text])
+        return embeddings[0]
 
     async def embed_documents(self, documents: List[Document]) -> List[Document]:
         """
         Generate embeddings for a list of documents.
 
-        Default implementation that processes documents in batches.
+        Default implementation that embeds the documents `self.batch_size` at a time.
 
         Args:
             documents: A list of Document objects to be embedded
@@ -77,36 +94,31 @@ class BaseEmbeddingService(EmbeddingInterface):
         # Process documents in batches
         for i in range(0, len(documents), self.batch_size):
             batch = documents[i:i + self.batch_size]
-            texts = [doc.content for doc in batch]
 
-            # Generate embeddings
-            embeddings = await self.get_embeddings(texts)
+            # One model call per batch
+            embeddings = await self.embed_batch([doc.content for doc in batch])
 
             # Assign embeddings to documents
-            for j, doc in enumerate(batch):
-                doc.embedding = embeddings[j]
+            for doc, embedding in zip(batch, embeddings):
+                doc.embedding = embedding
 
         return documents
 
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings(self, texts: List[str]) -> EmbeddingMatrix:
         """
         Generate embeddings for a list of text inputs.
 
-        This method must be implemented by concrete classes.
-        The base implementation raises NotImplementedError.
+        Default implementation that calls embed_batch with the configured batch size.
 
         Args:
             texts: List of text strings to embed
 
         Returns:
-            List of embedding vectors for the input texts
-
-        Raises:
-            NotImplementedError: This method must be implemented by subclasses
+            Float32 matrix with one embedding row per input text
         """
-        raise NotImplementedError("Subclasses must implement get_embeddings")
+        return await self.embed_batch(texts)
 
-    async def embed_query(self, query: str) -> List[float]:
+    async def embed_query(self, query: str) -> EmbeddingVector:
         """
         Generate an embedding for a query string.
 
@@ -117,6 +129,6 @@ class BaseEmbeddingService(EmbeddingInterface):
             query: The query string to be embedded
 
         Returns:
-            Embedding vector as a list of floats
+            Float32 embedding vector
         """
         return await self.get_embedding(query)
\ No newline at end of file
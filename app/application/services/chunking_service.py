@@ -37,6 +37,37 @@ class ChunkingService:
         List[str]
             List of text chunks
         """
+        return [text[start:end] for start, end in self.chunk_text_offsets(text, chunk_size, chunk_overlap, separator)]
+
+    def chunk_text_offsets(
+            self,
+            text: str,
+            chunk_size: Optional[int] = None,
+            chunk_overlap: Optional[int] = None,
+            separator: Optional[str] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Compute the chunks of `chunk_text` as (start, end) character offsets into `text`.
+
+        Chunks are contiguous spans of the source, so callers can slice them
+        lazily or hand the offsets to a tokenizer run once over the whole text.
+
+        Parameters:
+        -----------
+        text : str
+            The text to split into chunks
+        chunk_size : int, optional
+            The maximum size of each chunk (in characters)
+        chunk_overlap : int, optional
+            The number of characters to overlap between chunks
+        separator : str, optional
+            The character(s) to use as potential split points
+
+        Returns:
+        --------
+        List[Tuple[int, int]]
+            Start (inclusive) and end (exclusive) offset of each chunk
+        """
         # Use defaults if not specified
         chunk_size = chunk_size or self.default_chunk_size
         chunk_overlap = chunk_overlap or self.default_chunk_overlap
@@ -44,63 +75,43 @@ class ChunkingService:
 
         # If text is shorter than chunk_size, return it as a single chunk
         if len(text) <= chunk_size:
-            return [text]
-
-        # Split the text by the separator
-        splits = text.split(separator)
+            return [(0, len(text))]
 
-        chunks = []
-        current_chunk = []
-        current_length = 0
+        offsets = []
+        chunk_start = 0
+        chunk_end = 0
 
-        for i, split in enumerate(splits):
-            # Add the separator back to the split (except for the first one)
-            if split and i > 0:
-                split_with_sep = separator + split
-            else:
-                split_with_sep = split
+        # Each split runs from one separator (included) up to the next
+        split_start = 0
+        split_end = text.find(separator)
+        while True:
+            if split_end == -1:
+                split_end = len(text)
 
             # If adding this split would exceed the chunk size, finalize the chunk
-            if current_length + len(split_with_sep) > chunk_size and current_chunk:
-                # Join the current chunk and add it to the list of chunks
-                chunks.append(''.join(current_chunk))
+            if (chunk_end - chunk_start) + (split_end - split_start) > chunk_size and chunk_end > chunk_start:
+                offsets.append((chunk_start, chunk_end))
 
-                # Find a good overlap point that doesn't cut in the middle of semantic units
+                # Start the overlap at the first separator inside the last `chunk_overlap`
+                # characters, so it does not cut in the middle of a semantic unit
                 if chunk_overlap > 0:
-                    # Calculate overlap starting point
-                    overlap_start_idx = max(0, len(''.join(current_chunk)) - chunk_overlap)
-
-                    # Find the closest separator after the overlap starting point
-                    overlap_text = ''.join(current_chunk)
-                    last_separator_pos = -1
-
-                    for sep_pos in [pos for pos in range(len(overlap_text)) if overlap_text.startswith(separator, pos)]:
-                        if sep_pos >= overlap_start_idx:
-                            last_separator_pos = sep_pos
-                            break
-
-                    # If we found a good separator position, use it; otherwise use character-based overlap
-                    if last_separator_pos >= 0:
-                        overlap_text = overlap_text[last_separator_pos:]
-                    else:
-                        overlap_text = overlap_text[overlap_start_idx:]
-
-                    current_chunk = [overlap_text] if overlap_text else []
-                    current_length = len(overlap_text)
+                    overlap_start = max(chunk_start, chunk_end - chunk_overlap)
+                    separator_pos = text.find(separator, overlap_start, chunk_end)
+                    chunk_start = separator_pos if separator_pos != -1 else overlap_start
                 else:
-                    current_chunk = []
-                    current_length = 0
+                    chunk_start = chunk_end
 
-            # Add the current split to the chunk
-            if split_with_sep:
-                current_chunk.append(split_with_sep)
-                current_length += len(split_with_sep)
+            chunk_end = split_end
+            if split_end == len(text):
+                break
+            split_start = split_end
+            split_end = text.find(separator, split_start + len(separator))
 
         # Add the final chunk if it's not empty
-        if current_chunk:
-            chunks.append(''.join(current_chunk))
+        if chunk_end > chunk_start:
+            offsets.append((chunk_start, chunk_end))
 
-        return chunks
+        return offsets
 
     def chunk_by_semantic_units(
             self,
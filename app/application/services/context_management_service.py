@@ -56,7 +56,7 @@ class ContextManagementService:
                 priority=priority
             )
             if metadata:
-                context.metadata_dict = metadata
+                context.conversation_metadata = metadata
             return await self.context_repo.create(context)
         except Exception as e:
             self.logger.error(f"Error creating context: {str(e)}", exc_info=True)
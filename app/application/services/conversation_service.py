@@ -176,9 +176,9 @@ class ConversationService:
         message = Message(conversation_id=conversation_id, role=role, content=content, tokens=tokens,
                           is_hidden=is_hidden)
         if references:
-            message.references_list = references
+            message.references = references
         if metadata:
-            message.metadata_dict = metadata
+            message.message_metadata = metadata
 
         # Track message count in conversation metadata
         if conversation.metadata_dict is None:
@@ -522,8 +522,8 @@ class ConversationService:
                 content=msg.content,
                 tokens=msg.tokens,
                 is_hidden=msg.is_hidden,
-                references=msg.references_list,
-                metadata=msg.metadata_dict
+                references=msg.references or [],
+                metadata=msg.message_metadata or {}
             )
             if new_msg:
                 new_messages.append(new_msg)
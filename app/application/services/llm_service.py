@@ -1,6 +1,8 @@
 # app/core/services/llm_service.py
 from typing import Dict, Any, List, Optional, Union, AsyncIterable
 from app.modules.llm.factory import LLMFactory
+from app.modules.llm.memoizing import MemoizingLLM
+from app.infrastructure.cache.redis_cache import get_redis_cache
 from domain.interfaces.llm import LLMInterface
 from app.config import settings
 from app.utils.logger_util import get_logger
@@ -91,41 +93,26 @@ class LLMService:
             **kwargs
     ):
         """
-        Generate streaming response if the model supports it.
-        Falls back to non-streaming if not supported.
+        Generate a streaming response through the model's `stream` method.
 
         Returns an async generator that yields partial responses.
         """
-        # Check if the model supports streaming
-        if hasattr(llm, "generate_streaming"):
-            # Use native streaming
-            async for chunk in llm.generate_streaming(
-                    prompt=prompt,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    top_p=top_p,
-                    stop_sequences=stop_sequences,
-                    **kwargs
-            ):
-                yield chunk
-        else:
-            # Fall back to non-streaming for models that don't support it
-            logger.warning(
-                f"Streaming requested but model {llm.model_name} doesn't support it. Falling back to non-streaming.")
-            result = await llm.generate(
-                prompt=prompt,
+        # Models without incremental decoding yield their whole output as one chunk
+        async for text in llm.stream(
+                prompt,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 top_p=top_p,
                 stop_sequences=stop_sequences,
                 **kwargs
-            )
-            yield result
+        ):
+            yield {"text": text, "model": llm.model_name}
 
     async def _get_llm_instance(self, model_name: str) -> LLMInterface:
         """
         Get or create an LLM instance for the specified model.
-        Caches instances for reuse.
+        Caches instances for reuse, wrapped in a Redis-backed memoizer when
+        Redis is configured.
 
         Parameters
         ----------
@@ -139,7 +126,13 @@ class LLMService:
         """
         if model_name not in self._llm_instances:
             # Create a new instance
-            self._llm_instances[model_name] = LLMFactory.get_llm(model_name)
+            llm = LLMFactory.get_llm(model_name)
+
+            # Memoize deterministic generations in Redis when it is configured
+            if settings.REDIS_URL and settings.LLM_CACHE_TTL > 0:
+                llm = MemoizingLLM(llm, await get_redis_cache(), ttl=settings.LLM_CACHE_TTL)
+
+            self._llm_instances[model_name] = llm
 
         return self._llm_instances[model_name]
 
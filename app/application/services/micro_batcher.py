@@ -0,0 +1,118 @@
+# app/application/services/micro_batcher.py
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+from utils.logger_util import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Coalesce concurrent single-item requests into batched calls.
+
+    Callers ``await submit(item)``; a background worker drains the pending
+    queue whenever ``max_batch_size`` items are waiting or ``max_wait_ms`` has
+    elapsed since the first item of the batch arrived, invokes ``batch_fn``
+    once with the stacked inputs and resolves each caller's future with its
+    own result.
+
+    The batcher only coalesces requests that share an instance, so it should
+    live as long as the service it wraps (e.g. one per application process).
+    """
+
+    def __init__(
+            self,
+            batch_fn: Callable[[List[T]], Awaitable[List[R]]],
+            max_batch_size: int = 32,
+            max_wait_ms: float = 10.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Coroutine function mapping a list of inputs to a list of
+                results in the same order.
+            max_batch_size: Maximum number of items per batched call.
+            max_wait_ms: Maximum time to wait for a batch to fill up.
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: T) -> R:
+        """
+        Submit a single item and wait for its result from the next batch.
+
+        Args:
+            item: The input to process.
+
+        Returns:
+            The result produced for this item by ``batch_fn``.
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._queue = None
+
+    def _ensure_worker(self) -> None:
+        """Start the worker lazily, inside the running event loop."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def _collect(self) -> List[Tuple[T, asyncio.Future]]:
+        """Wait for the first item, then gather more until size or time limit."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop: collect a batch, run it and fan results back out."""
+        while True:
+            batch = await self._collect()
+            items = [item for item, _ in batch]
+
+            try:
+                results: List[Any] = await self.batch_fn(items)
+                if len(results) != len(items):
+                    raise ValueError(
+                        f"Batch function returned {len(results)} results for {len(items)} inputs"
+                    )
+            except Exception as e:
+                logger.error(f"Batched call failed for {len(items)} item(s): {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -1,4 +1,5 @@
 # app/core/services/rag_context_retriever.py
+import inspect
 
 from domain.interfaces.reranking import RerankingService
 from app.modules.reranking.factory import RerankerFactory
@@ -40,6 +41,8 @@ class RAGContextRetriever:
                     documents=[doc.content for doc in initial_results],
                     metadata=[doc.metadata for doc in initial_results]
                 )
+                if inspect.isawaitable(reranked_results):
+                    reranked_results = await reranked_results
 
                 # Keep only top N results after reranking
                 semantic_results = reranked_results[:5]  # Adjust number as needed
@@ -0,0 +1,147 @@
+# app/application/services/semantic_response_cache.py
+import time
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from utils.logger_util import get_logger
+
+logger = get_logger(__name__)
+
+
+class SemanticResponseCache:
+    """
+    In-process cache of final RAG responses keyed by query embedding.
+
+    A lookup returns the stored response of the most similar cached query
+    when its cosine similarity reaches ``threshold``, so paraphrases of a
+    recent question skip retrieval, reranking and generation altogether.
+
+    Entries live in a fixed-size ring buffer of unit-normalized vectors and
+    are searched exhaustively with a single matrix-vector product; at the
+    default capacity this is well under a millisecond and, unlike a graph
+    index, lets entries expire and be overwritten in place. Each entry is
+    tagged with a scope (e.g. the theme filter) and only matches queries in
+    the same scope; callers put the version of the data an answer was built
+    from into its scope, so answers over changed documents stop matching.
+    Use `get_shared_response_cache` so every processor shares one buffer.
+    """
+
+    def __init__(
+            self,
+            capacity: int = 10_000,
+            threshold: float = 0.97,
+            ttl: float = 900.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            capacity: Maximum number of cached responses; the oldest is overwritten first.
+            threshold: Minimum cosine similarity for a cache hit.
+            ttl: Seconds a cached response stays valid.
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        # Allocated on first insert, once the embedding dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._expires = np.zeros(capacity, dtype=np.float64)
+        self._scopes = np.full(capacity, -1, dtype=np.int64)
+        # Ids of scopes with entries in the buffer; at most `capacity` of them
+        self._scope_ids: Dict[Hashable, int] = {}
+        self._next_scope_id = 0
+        self._entries: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._next_slot = 0
+
+    def get(self, embedding: Any, scope: Hashable = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response closest to `embedding`, if similar enough.
+
+        Args:
+            embedding: The query embedding.
+            scope: Scope the query runs in; only entries of the same scope match.
+
+        Returns:
+            The stored response, or None on a miss.
+        """
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None or self._vectors is None:
+            return None
+
+        valid = (self._scopes == scope_id) & (self._expires > time.monotonic())
+        if not valid.any():
+            return None
+
+        similarities = np.where(valid, self._vectors @ self._normalize(embedding), -1.0)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit (similarity {similarities[best]:.4f})")
+        return self._entries[best]
+
+    def put(self, embedding: Any, response: Dict[str, Any], scope: Hashable = None) -> None:
+        """
+        Store a response for the query embedding.
+
+        Args:
+            embedding: The query embedding.
+            response: The response to return for similar queries.
+            scope: Scope the query ran in.
+        """
+        vector = self._normalize(embedding)
+        if self._vectors is None:
+            self._vectors = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.capacity
+        self._scopes[slot] = -1
+
+        self._vectors[slot] = vector
+        self._scopes[slot] = self._scope_id(scope)
+        self._expires[slot] = time.monotonic() + self.ttl
+        self._entries[slot] = response
+
+    def _scope_id(self, scope: Hashable) -> int:
+        """
+        Return the id of `scope`, registering it if it is new.
+
+        Scopes (e.g. superseded data versions) are forgotten once none of
+        their entries is left in the buffer, so the registry never holds
+        more than `capacity` of them.
+        """
+        scope_id = self._scope_ids.get(scope)
+        if scope_id is None:
+            if len(self._scope_ids) >= self.capacity:
+                live = set(np.unique(self._scopes).tolist())
+                self._scope_ids = {key: value for key, value in self._scope_ids.items() if value in live}
+            scope_id = self._scope_ids[scope] = self._next_scope_id
+            self._next_scope_id += 1
+        return scope_id
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._expires[:] = 0.0
+        self._scopes[:] = -1
+        self._scope_ids.clear()
+        self._entries = [None] * self.capacity
+
+    @staticmethod
+    def _normalize(embedding: Any) -> np.ndarray:
+        """Return `embedding` as a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+
+# One cache per process, so every RAGQueryProcessor shares a single ring buffer
+_SHARED_CACHE: Optional[SemanticResponseCache] = None
+
+
+def get_shared_response_cache() -> SemanticResponseCache:
+    """Return the process-wide response cache, creating it on first use."""
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = SemanticResponseCache()
+    return _SHARED_CACHE
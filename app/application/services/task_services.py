@@ -1,5 +1,4 @@
 # app/core/services/task_manager.py
-import json
 import logging
 from datetime import datetime
 from typing import Callable, Any, Optional, List, Dict
@@ -8,7 +7,7 @@ from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.schemas.task import TaskTypeEnum, TaskStatusEnum
-from infrastructure.repositories.task_repository import TaskRepository
+from infrastructure.repositories.task_repository import LOG_TIMESTAMP_FORMAT, TaskRepository, log_entries
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +89,7 @@ class Task:
         """
         Add a log message with timestamp.
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = datetime.now().strftime(LOG_TIMESTAMP_FORMAT)
         self.logs.append({"timestamp": timestamp, "message": message})
 
     def set_steps(self, steps: List[str]):
@@ -205,7 +204,7 @@ class TaskManager:
             user_id=db_model.user_id,
             theme_id=db_model.theme_id,
             description=db_model.description,
-            metadata=json.loads(db_model.task_metadata or '{}')
+            metadata=db_model.task_metadata or {}
         )
         domain_task.id = db_model.id
         domain_task.status = TaskStatusEnum(db_model.status)
@@ -214,8 +213,8 @@ class TaskManager:
         domain_task.started_at = db_model.started_at
         domain_task.completed_at = db_model.completed_at
         domain_task.error_message = db_model.error_message
-        domain_task.logs = json.loads(db_model.logs or '[]')  # ✅ fixed
-        domain_task.steps = json.loads(db_model.steps or '[]')  # ✅ fixed
+        domain_task.logs = log_entries(db_model)
+        domain_task.steps = db_model.steps or []
         domain_task.current_step = db_model.current_step
         return domain_task
 
@@ -344,7 +343,7 @@ class TaskManager:
             user_id=db_model.user_id,
             theme_id=db_model.theme_id,
             description=db_model.description,
-            metadata=json.loads(db_model.task_metadata or '{}')  # fix here
+            metadata=db_model.task_metadata or {}
         )
         domain_task.id = db_model.id
         domain_task.status = TaskStatusEnum(db_model.status)
@@ -353,7 +352,7 @@ class TaskManager:
         domain_task.started_at = db_model.started_at
         domain_task.completed_at = db_model.completed_at
         domain_task.error_message = db_model.error_message
-        domain_task.logs = json.loads(db_model.logs or '[]')  # fix here
-        domain_task.steps = json.loads(db_model.steps or '[]')  # fix here
+        domain_task.logs = log_entries(db_model)
+        domain_task.steps = db_model.steps or []
         domain_task.current_step = db_model.current_step
         return domain_task
@@ -1,5 +1,5 @@
 # core/services/vector_index_services.py
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 import numpy as np
 
 
@@ -99,6 +99,55 @@ class VectorIndexService:
         # Return top results
         return results[:limit]
 
+    async def search_filtered(
+            self,
+            query_vector: Any,
+            top_k: int,
+            predicate: Union[Callable[[str], bool], Dict[str, Any]],
+            oversample: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Search only the vectors that pass a filter.
+
+        The filter is applied before scoring, so ineligible vectors are never
+        compared and selective filters make the search cheaper, not slower.
+        The exhaustive scan needs no oversampling; `oversample` is accepted
+        for compatibility with ANN-backed indexes.
+
+        Args:
+            query_vector: Vector to search for
+            top_k: Maximum number of results to return
+            predicate: Metadata filter criteria, or a callable over vector IDs
+            oversample: Candidate-list widening factor (unused)
+
+        Returns:
+            List of dictionaries containing vector ID, score, and metadata
+        """
+        if isinstance(predicate, dict):
+            eligible = [id for id in self.vectors if self._matches_filter(id, predicate)]
+        else:
+            eligible = [id for id in self.vectors if predicate(id)]
+        if not eligible:
+            return []
+
+        # Score all eligible vectors with one matrix-vector product
+        matrix = np.asarray([self.vectors[id] for id in eligible], dtype=np.float32)
+        query_np = np.asarray(query_vector, dtype=np.float32)
+        similarities = matrix @ query_np / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query_np))
+
+        top_k = min(top_k, len(eligible))
+        winners = np.argpartition(-similarities, top_k - 1)[:top_k]
+        winners = winners[np.argsort(-similarities[winners], kind="stable")]
+
+        return [
+            {
+                "id": eligible[i],
+                "score": float(similarities[i]),
+                "metadata": self.metadata.get(eligible[i], {})
+            }
+            for i in winners.tolist()
+        ]
+
     async def delete_vectors(self, ids: List[str]) -> int:
         """
         Delete vectors from the index.
@@ -121,6 +121,7 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 1800
     DB_ECHO: bool = False
+    DB_RAISELOAD: bool = False  # Dev/test only: fail on relationship access not loaded by the query
 
     # --- Redis ---
     REDIS_URL: Optional[str] = None
@@ -130,9 +131,13 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_DAYS: int = 30
+    EXPIRED_AUTH_CLEANUP_INTERVAL: int = 3600  # Seconds between deletes of expired tokens/sessions; 0 disables
 
     # --- Embeddings and Vector DB ---
     VECTOR_DB_TYPE: str = "faiss"
+    VECTOR_QUANTIZATION: str = "none"  # none, sq8, pq or binary (FAISS only)
+    PQ_SUBVECTORS: int = 16
+    PQ_BITS: int = 8
     EMBEDDING_SERVICE: str = "instructor"
     INSTRUCTOR_MODEL_NAME: str = "app/models/instructors/instructor-xl"
     EMBEDDING_INSTRUCTION: str = "Represent the document for retrieval:"
@@ -151,12 +156,15 @@ class Settings(BaseSettings):
     RERANKER_TYPE: str = "bm25"
     CROSS_ENCODER_MODEL: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
     RERANKER_MODEL: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    ONNX_RERANKER_MODEL_PATH: str = "app/models/rerankers/ms-marco-MiniLM-L-6-v2/model.onnx"
+    RERANKER_BATCH_SIZE: int = 32
     RERANKER_DEFAULT_TOP_K: int = 5
     SCORE_THRESHOLD: float = 0.3
 
     # --- LLM ---
     LLM_MODEL: str = os.getenv("LLM_MODEL", "zephyr:latest")
     MODELS_BASE_DIR: str = os.getenv("MODELS_BASE_DIR", str(BASE_DIR / "models/llm"))
+    LLM_CACHE_TTL: int = 86400  # Seconds to keep temperature-0 generations; 0 disables the cache
 
     # --- File Storage ---
     DOCUMENT_STORAGE_PATH: Path = Path("./data/processed")
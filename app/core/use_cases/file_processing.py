@@ -354,9 +354,8 @@ class FileProcessingUseCase:
                 )
 
             # For each chunk, treat it as a separate document
-            for chunk in chunks:
-                # Create a Document object for the chunk
-                chunk_doc = Document(
+            chunk_docs = [
+                Document(
                     content=chunk,
                     file_id=doc.file_id,
                     owner_id=doc.owner_id or doc.metadata.get("owner_id"),
@@ -367,11 +366,13 @@ class FileProcessingUseCase:
                         "parent_doc_id": doc.id,
                     }
                 )
-                # Store the chunk in the document store to get a doc_id
-                doc_id = await self.document_store.store_document(chunk_doc)
-                # We'll collect text for embedding
-                vectors_to_add.append(chunk)
-                vector_ids.append(doc_id)
+                for chunk in chunks
+            ]
+            # Store all chunks of the document in one batch to get their doc_ids
+            doc_ids = await self.document_store.store_documents(chunk_docs)
+            # We'll collect text for embedding
+            vectors_to_add.extend(chunks)
+            vector_ids.extend(doc_ids)
 
         if task_id:
             await self._send_task_update(
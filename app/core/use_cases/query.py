@@ -1,12 +1,167 @@
-from typing import List, Dict, Any, Optional
+import asyncio
+import copy
+import hashlib
+import heapq
+import inspect
+import io
+import re
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, FrozenSet, Tuple
+
+import numpy as np
+from cachetools import TTLCache
 
 from modules.storage.document_store import DocumentStore
 from domain.entities.document import Document
+from domain.entities.query import Query
 from domain.interfaces.reranking import RerankingService
 from application.services.rag_context_retriever import RAGContextRetriever
+from application.services.micro_batcher import MicroBatcher
+from application.services.semantic_response_cache import SemanticResponseCache, get_shared_response_cache
 from app.modules.reranking.factory import RerankerFactory
 from domain.interfaces.embedding import EmbeddingInterface
 from domain.interfaces.llm import LLMInterface
+from utils.logger_util import get_logger
+
+logger = get_logger(__name__)
+
+BASE_INSTRUCTIONS = (
+    "You are a helpful assistant that answers questions based on the provided information.",
+    "Always respond using only the information in the provided documents and conversation history.",
+    "If the answer is not in the provided information, say you don't have enough information.",
+    "Do not make up information.",
+)
+BASE_PROMPT = "\n".join(BASE_INSTRUCTIONS)
+
+# Byte-identical opening of every system prompt, so provider-side prompt caches
+# (vLLM prefix caching, OpenAI/Anthropic prompt caching) can reuse it across queries
+SYSTEM_PROMPT_PREFIX = BASE_PROMPT + "\n\n"
+
+# Scores of rerankers with independent scores, keyed by (reranker class, model,
+# query hash, document id); 15 minute TTL
+_RERANK_SCORE_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=900)
+
+# Cross-encoders truncate pairs to 512 tokens; ~2500 characters comfortably covers
+# that, so longer texts are cut before crossing into the tokenizer
+_RERANK_MAX_CHARS = 2500
+
+# Bi-encoder results this clear-cut are rarely reordered by the cross-encoder
+_DECISIVE_TOP_SCORE = 0.85
+_DECISIVE_SCORE_GAP = 0.10
+_DECISIVE_MIN_QUERY_TOKENS = 4
+
+# Fields read from every document when building the response payload
+_DOCUMENT_FIELDS = attrgetter("id", "source", "content", "metadata")
+
+# Marker for documents that carry no score attribute at all
+_NO_SCORE = object()
+
+# Literal lookups where the bi-encoder order is already as good as a rerank
+_LITERAL_QUERY_PATTERNS = (
+    ("quoted_phrase", re.compile(r'^\s*(?:"[^"]+"|\'[^\']+\')\s*$')),
+    ("filename", re.compile(r"^\s*[\w\-]+\.\w{1,5}\s*$")),
+    ("tag", re.compile(r"^\s*#[\w\-]+\s*$")),
+)
+
+
+@dataclass(slots=True)
+class DocumentResult:
+    """
+    One retrieved document in a query response.
+
+    Slotted to keep per-request allocations small; serializers such as
+    orjson encode dataclasses natively, and `to_dict` covers everything else.
+    """
+    id: str
+    title: str
+    source: str
+    snippet: str
+    score: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict, omitting fields that are None (e.g. a missing score)."""
+        return {name: value for name in self.__slots__ if (value := getattr(self, name)) is not None}
+
+
+def _literal_query_kind(text: str) -> Optional[str]:
+    """Return the kind of literal lookup `text` is (quoted phrase, filename, tag), or None."""
+    for kind, pattern in _LITERAL_QUERY_PATTERNS:
+        if pattern.match(text):
+            return kind
+    return None
+
+
+@lru_cache(maxsize=256)
+def _format_document_block(entries: Tuple[Tuple[str, str, Any, str], ...]) -> str:
+    """
+    Render (title, source, score, content) entries as the documents section of the prompt.
+
+    Memoized so repeated queries over the same top-k set skip the string assembly.
+    """
+    buffer = io.StringIO()
+    buffer.write("RELEVANT DOCUMENTS:")
+    for idx, (title, source, score, content) in enumerate(entries, start=1):
+        score_info = f" (Score: {score:.4f})" if score is not _NO_SCORE else ""
+        buffer.write(f"\n[Document {idx}: {title} (Source: {source}){score_info}]\n")
+        buffer.write(content)
+        buffer.write("\n")
+
+    return buffer.getvalue()
+
+
+def _query_terms(query: str) -> FrozenSet[str]:
+    """Significant (longer than two characters) lowercased terms of a query."""
+    return frozenset(word for word in query.lower().split() if len(word) > 2)
+
+
+def _find_all(text: str, term: str) -> List[int]:
+    """Start offsets of every (possibly overlapping) occurrence of `term` in `text`."""
+    found = []
+    find = text.find
+    pos = find(term)
+    while pos != -1:
+        found.append(pos)
+        pos = find(term, pos + 1)
+    return found
+
+
+# Below this many candidate windows the scalar scan beats NumPy's call overhead
+_VECTORIZED_MIN_WINDOWS = 32
+
+
+def _best_window_start(
+        term_positions: List[Tuple[List[int], int]],
+        window_starts: range,
+        half_window: int,
+) -> int:
+    """
+    Score all snippet windows at once and return the start of the best one.
+
+    Vectorized form of the scan in `RAGQueryProcessor._extract_snippet`: for
+    every term, the first occurrence at or after each window start is found
+    with one `searchsorted`; it earns 3 points if it ends in the first half of
+    the window and 1 point if it ends in the second half. Ties go to the
+    earliest window, as in the scalar scan.
+    """
+    starts = np.asarray(window_starts, dtype=np.int64)
+    if not len(starts):
+        return 0
+    scores = np.zeros(len(starts), dtype=np.int32)
+
+    for found, term_len in term_positions:
+        found_arr = np.asarray(found, dtype=np.int64)
+        idx = np.searchsorted(found_arr, starts, side="left")
+        present = idx < len(found_arr)
+        ends = np.where(present, found_arr[np.minimum(idx, len(found_arr) - 1)] + term_len, np.iinfo(np.int64).max)
+        offsets = ends - starts
+        scores += np.where(offsets <= half_window, 3, np.where(offsets <= 2 * half_window, 1, 0)).astype(np.int32)
+
+    best = int(np.argmax(scores))
+    return int(starts[best]) if scores[best] > 0 else 0
 
 
 class RAGQueryProcessor:
@@ -18,9 +173,11 @@ class RAGQueryProcessor:
 
     Methods:
         process_query: Asynchronously executes the RAG pipeline for a query.
+        process_query_stream: Same pipeline, streaming the LLM response.
         _format_documents: Formats retrieved documents for the system prompt.
         _generate_system_prompt: Builds the LLM system prompt using contexts.
         _extract_snippet: Extracts a relevant snippet from document content.
+        _make_snippet_extractor: Binds `_extract_snippet` to one parsed query.
         _rerank_documents: Reranks documents using a specified reranking service.
         extra_functionality: Placeholder for extending post-processing logic.
     """
@@ -34,6 +191,11 @@ class RAGQueryProcessor:
             rag_context_retriever: Optional[RAGContextRetriever] = None,
             top_k: int = 5,
             reranker_type: Optional[str] = None,
+            ef_search: int = 100,
+            embedding_batcher: Optional[MicroBatcher] = None,
+            embed_cache_size: int = 1024,
+            response_cache: Optional[SemanticResponseCache] = None,
+            retrieval_candidates: int = 50,
     ):
         self.document_store = document_store
         self.embedding_service = embedding_service
@@ -41,6 +203,21 @@ class RAGQueryProcessor:
         self.reranking_service = reranking_service or RerankerFactory.get_reranker(reranker_type)
         self.rag_context_retriever = rag_context_retriever
         self.top_k = top_k
+        self.ef_search = ef_search
+        self.retrieval_candidates = retrieval_candidates
+        # Coalesces query embeddings from concurrent requests into one forward pass
+        self.embedding_batcher = embedding_batcher or MicroBatcher(
+            embedding_service.get_embeddings, max_batch_size=32, max_wait_ms=10
+        )
+        # LRU of query embeddings (float16) keyed by the normalized query text
+        self.embed_cache_size = embed_cache_size
+        self._embed_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._embed_locks: Dict[bytes, asyncio.Lock] = {}
+        # Final responses of recent queries, matched by embedding similarity
+        self.response_cache = response_cache or get_shared_response_cache()
+        # Search results by (embedding hash, theme, theme version, pool size); the TTL
+        # bounds staleness from writes made by other processes
+        self._retrieval_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
 
     async def process_query(
             self,
@@ -63,31 +240,208 @@ class RAGQueryProcessor:
             A dict with:
                 - query: original query text
                 - response: generated LLM text
-                - documents: metadata and snippet for each retrieved document
+                - documents: a DocumentResult (title, source, snippet, score) per retrieved document
                 - metadata: flags about context usage and counts
         """
+        docs_task: Optional[asyncio.Task] = None
         try:
-            # 1. Embed Query
-            query_embedding = await self.embedding_service.get_embedding(query.text)
+            prepared = await self._prepare_generation(query, conversation_id, theme_id, reranker_type)
+            if prepared is None:
+                return self._no_documents_response(query.text)
+            if "cached_response" in prepared:
+                return prepared["cached_response"]
+
+            # 7. Call LLM, building the documents payload in a worker thread meanwhile
+            docs_task = asyncio.create_task(asyncio.to_thread(
+                self._build_documents_payload, prepared["relevant_docs"], query.text
+            ))
+            llm_response = await self.llm_provider.generate_text(
+                system_prompt=prepared["system_prompt"], user_prompt=query.text
+            )
+
+            # 8. Return all assembled information
+            result = {
+                "query": query.text,
+                "response": llm_response,
+                "documents": await docs_task,
+                "metadata": prepared["metadata"],
+            }
+            self._cache_response(prepared, result)
+            return result
+        except Exception as e:
+            if docs_task is not None:
+                docs_task.cancel()
+            return self._error_response(query.text, e)
+
+    async def process_query_stream(
+            self,
+            query: Query,
+            conversation_id: Optional[str] = None,
+            theme_id: Optional[str] = None,
+            reranker_type: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of `process_query`.
+
+        The retrieved documents are sent before any generated text: the
+        documents payload is built in a worker thread while the LLM computes
+        its first chunk, then tokens are forwarded as they are generated.
+
+        Args:
+            query: The Query entity containing text to process.
+            conversation_id: Optional conversation ID for context retrieval.
+            theme_id: Optional theme ID to filter document search.
+            reranker_type: Optional override for reranker type.
 
-            # 2. Retrieve documents via semantic search
-            initial_docs = await self.document_store.semantic_search(
-                query_embedding=query_embedding,
-                limit=self.top_k * 3,
-                theme_id=theme_id  # Larger pool of documents
+        Yields:
+            ``{"type": "documents", "query", "documents", "metadata"}`` once,
+            ``{"type": "token", "text": ...}`` for each generated chunk, then a
+            single ``{"type": "final", ...}`` event carrying the same fields as
+            the `process_query` result. When no documents are found or the
+            pipeline fails, only the final event is sent.
+        """
+        docs_task: Optional[asyncio.Task] = None
+        first_chunk: Optional[asyncio.Future] = None
+        stream: Optional[AsyncIterator[str]] = None
+        try:
+            prepared = await self._prepare_generation(query, conversation_id, theme_id, reranker_type)
+            if prepared is None:
+                yield {"type": "final", **self._no_documents_response(query.text)}
+                return
+            if "cached_response" in prepared:
+                cached = prepared["cached_response"]
+                yield {"type": "documents", "query": query.text,
+                       "documents": cached["documents"], "metadata": cached["metadata"]}
+                yield {"type": "token", "text": cached["response"]}
+                yield {"type": "final", **cached}
+                return
+
+            # 7. Assemble the documents payload off the event loop while the LLM
+            # works on its first chunk
+            docs_task = asyncio.create_task(asyncio.to_thread(
+                self._build_documents_payload, prepared["relevant_docs"], query.text
+            ))
+            stream = self.llm_provider.stream(
+                self._build_prompt(prepared["system_prompt"], query.text)
             )
+            first_chunk = asyncio.ensure_future(anext(stream, None))
+
+            documents = await docs_task
+            yield {"type": "documents", "query": query.text,
+                   "documents": documents, "metadata": prepared["metadata"]}
+
+            chunks: List[str] = []
+            chunk = await first_chunk
+            if chunk is not None:
+                chunks.append(chunk)
+                yield {"type": "token", "text": chunk}
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    yield {"type": "token", "text": chunk}
+
+            # 8. Return all assembled information
+            result = {
+                "query": query.text,
+                "response": "".join(chunks),
+                "documents": documents,
+                "metadata": prepared["metadata"],
+            }
+            self._cache_response(prepared, result)
+            yield {"type": "final", **result}
+        except Exception as e:
+            yield {"type": "final", **self._error_response(query.text, e)}
+        finally:
+            # Also runs when the consumer disconnects: GeneratorExit skips the
+            # except clause, and the LLM would otherwise keep generating
+            pending = [task for task in (docs_task, first_chunk) if task is not None and not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if stream is not None:
+                await stream.aclose()
+
+    @staticmethod
+    def _build_prompt(system_prompt: str, user_prompt: str) -> str:
+        """
+        Join the system prompt and the question into the single prompt `LLMInterface.stream` takes.
+
+        The system prompt comes first, so its shared prefix stays byte-identical.
+        """
+        return f"{system_prompt}\n\n{user_prompt}"
+
+    async def _prepare_generation(
+            self,
+            query: Query,
+            conversation_id: Optional[str],
+            theme_id: Optional[str],
+            reranker_type: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run retrieval, reranking and prompt assembly for a query.
+
+        Returns:
+            None when no documents were retrieved, ``{"cached_response": ...}``
+            when a semantically equivalent query was answered recently,
+            otherwise a dict with the selected ``relevant_docs``, the
+            ``system_prompt``, the response ``metadata`` and the response
+            cache key (``query_embedding``, ``cache_scope``).
+        """
+        # Themes confirmed empty skip the embedding call until a document is stored
+        if theme_id and self.document_store.is_theme_known_empty(theme_id):
+            return None
+
+        # 5. Conversation context depends only on the conversation and query text,
+        # so fetch it concurrently with embedding, search and reranking
+        context_task: Optional[asyncio.Task] = None
+        if conversation_id and self.rag_context_retriever:
+            context_task = asyncio.create_task(self.rag_context_retriever.get_context_for_query(
+                conversation_id=conversation_id, query=query.text
+            ))
+
+        try:
+            # 1. Embed Query
+            query_embedding = await self._embed_query(query.text)
+
+            # Both caches key on the theme version, which moves on every write to the
+            # theme's documents, so stale searches and answers are never served
+            theme_version = self.document_store.theme_version(theme_id)
+
+            # Answers that depend on conversation history are never shared
+            cache_scope = None if conversation_id else (theme_id, reranker_type, theme_version)
+            if cache_scope is not None:
+                cached = self.response_cache.get(query_embedding, scope=cache_scope)
+                if cached is not None:
+                    return {"cached_response": {
+                        **cached,
+                        "query": query.text,
+                        "metadata": {**cached["metadata"], "cache": "semantic"},
+                    }}
+
+            # 2. Retrieve documents via HNSW approximate search. The candidate pool is
+            # what gets reranked; recall is raised through ef_search, which must be at
+            # least the pool size for HNSW to return that many rows
+            candidate_limit = min(self.retrieval_candidates, self.top_k * 10)
+            retrieval_key = (
+                hashlib.blake2b(np.asarray(query_embedding, dtype=np.float16).tobytes(), digest_size=8).digest(),
+                theme_id,
+                theme_version,
+                candidate_limit,
+            )
+            initial_docs = self._retrieval_cache.get(retrieval_key)
+            if initial_docs is None:
+                initial_docs = await self.document_store.semantic_search(
+                    query_embedding=query_embedding,
+                    limit=candidate_limit,
+                    theme_id=theme_id,
+                    ef_search=max(self.ef_search, candidate_limit)
+                )
+                if initial_docs:
+                    self._retrieval_cache[retrieval_key] = initial_docs
 
             if not initial_docs:
-                return {
-                    "query": query.text,
-                    "response": "No relevant documents found.",
-                    "documents": [],
-                    "metadata": {
-                        "document_count": 0,
-                        "used_conversation_context": False,
-                        "reranking_used": False,
-                    },
-                }
+                if theme_id:
+                    await self.document_store.check_theme_empty(theme_id)
+                return None
 
             # 3. Reranking
             reranking_used = False
@@ -98,11 +452,22 @@ class RAGQueryProcessor:
 
             min_score_threshold = 0.3  # Define threshold as a constant
 
-            if reranker:
-                reranked_docs, scores = await self._rerank_documents(query.text, initial_docs, reranker)
-                # Filter weak documents
-                reranked_docs = [doc for doc in reranked_docs if doc.score >= min_score_threshold]
-                relevant_docs = reranked_docs[:self.top_k] if reranked_docs else initial_docs[:self.top_k]
+            # Exact-match lookups and clear-cut retrievals keep the retrieval order;
+            # skip the reranker call
+            literal_kind = _literal_query_kind(query.text)
+            if literal_kind:
+                skip_reason = f"literal_{literal_kind}"
+            elif self._retrieval_is_decisive(initial_docs, query.text):
+                skip_reason = "decisive_retrieval"
+            else:
+                skip_reason = None
+
+            if reranker and not skip_reason:
+                # Weak documents are filtered out during the ranking pass
+                reranked_docs, scores = await self._rerank_documents(
+                    query.text, initial_docs, reranker, top_k=self.top_k, min_score=min_score_threshold
+                )
+                relevant_docs = reranked_docs if reranked_docs else initial_docs[:self.top_k]
                 reranking_used = True
             else:
                 # Apply similar filtering to non-reranked documents if they have scores
@@ -112,65 +477,121 @@ class RAGQueryProcessor:
             # 4. Prepare Document Context
             document_context = self._format_documents(relevant_docs)
 
-            # 5. Optionally retrieve conversation context
+            # 5. Collect the conversation context fetched alongside steps 1-4
             conversation_context = ""
-            if conversation_id and self.rag_context_retriever:
-                context_data = await self.rag_context_retriever.get_context_for_query(
-                    conversation_id=conversation_id, query=query.text
-                )
+            if context_task is not None:
+                context_data = await context_task
                 conversation_context = self.rag_context_retriever.format_context_for_llm(context_data)
 
             # 6. Generate final prompt
-            system_prompt = self._generate_system_prompt(conversation_context, document_context)
-
-            # 7. Call LLM
-            llm_response = await self.llm_provider.generate_text(
-                system_prompt=system_prompt, user_prompt=query.text
-            )
-
-            # 8. Return all assembled information
             return {
-                "query": query.text,
-                "response": llm_response,
-                "documents": [
-                    {
-                        "id": doc.id,
-                        "title": doc.metadata.get("title", f"Document {idx + 1}"),
-                        "source": doc.source or "Unknown",
-                        "snippet": self._extract_snippet(doc.content, query.text),
-                        "score": getattr(doc, "score", None)
-                    }
-                    for idx, doc in enumerate(relevant_docs)
-                ],
+                "query_embedding": query_embedding,
+                "cache_scope": cache_scope,
+                "relevant_docs": relevant_docs,
+                "system_prompt": self._generate_system_prompt(conversation_context, document_context),
                 "metadata": {
                     "used_conversation_context": bool(conversation_context),
                     "document_count": len(relevant_docs),
                     "theme_id": theme_id,
                     "reranking_used": reranking_used,
-                    "reranker_type": getattr(reranker, "reranker_type", None) if reranking_used else None
-                },
-            }
-        except Exception as e:
-            # Proper error handling
-            import logging
-            logging.error(f"Error processing query: {str(e)}", exc_info=True)
-            return {
-                "query": query.text,
-                "response": "An error occurred while processing your query.",
-                "documents": [],
-                "metadata": {
-                    "error": str(e),
-                    "document_count": 0,
-                    "used_conversation_context": False,
-                    "reranking_used": False,
+                    "reranker_type": getattr(reranker, "reranker_type", None) if reranking_used else None,
+                    "reranking_skipped_reason": skip_reason if reranker else None
                 },
             }
+        finally:
+            # Early returns and failures leave the context fetch unused
+            if context_task is not None and not context_task.done():
+                context_task.cancel()
+
+    def _retrieval_is_decisive(self, documents: List[Document], query_text: str) -> bool:
+        """
+        Whether the bi-encoder ranking is clear-cut enough to skip the cross-encoder.
+
+        True when the best match is strong and the top-k are separated from the
+        next candidate by a wide similarity gap. Short queries are always
+        reranked: their embeddings are noisier and reranking helps them most.
+        """
+        if len(documents) <= self.top_k or len(query_text.split()) < _DECISIVE_MIN_QUERY_TOKENS:
+            return False
+
+        top_score = getattr(documents[0], "score", None)
+        last_kept = getattr(documents[self.top_k - 1], "score", None)
+        first_dropped = getattr(documents[self.top_k], "score", None)
+        if top_score is None or last_kept is None or first_dropped is None:
+            return False
+
+        return top_score >= _DECISIVE_TOP_SCORE and last_kept - first_dropped >= _DECISIVE_SCORE_GAP
+
+    async def _embed_query(self, text: str) -> np.ndarray:
+        """
+        Embed a query, reusing the vector of a recent identical query.
+
+        Queries are matched on their lowercased, whitespace-collapsed text.
+        Concurrent misses for the same query share one embedding call.
+        """
+        key = hashlib.sha1(" ".join(text.lower().split()).encode("utf-8")).digest()
+
+        embedding = self._embed_cache.get(key)
+        if embedding is not None:
+            self._embed_cache.move_to_end(key)
+            return embedding
+
+        lock = self._embed_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have filled the entry while we waited
+            embedding = self._embed_cache.get(key)
+            if embedding is None:
+                embedding = np.asarray(await self.embedding_batcher.submit(text), dtype=np.float16)
+                self._embed_cache[key] = embedding
+                if len(self._embed_cache) > self.embed_cache_size:
+                    self._embed_cache.popitem(last=False)
+        self._embed_locks.pop(key, None)
+
+        return embedding
+
+    def _cache_response(self, prepared: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Store a generated response in the semantic cache, if its scope allows sharing."""
+        if prepared["cache_scope"] is not None:
+            self.response_cache.put(prepared["query_embedding"], result, scope=prepared["cache_scope"])
+
+    @staticmethod
+    def _no_documents_response(query_text: str) -> Dict[str, Any]:
+        """Response returned when the search finds no documents."""
+        return {
+            "query": query_text,
+            "response": "No relevant documents found.",
+            "documents": [],
+            "metadata": {
+                "document_count": 0,
+                "used_conversation_context": False,
+                "reranking_used": False,
+            },
+        }
+
+    @staticmethod
+    def _error_response(query_text: str, error: Exception) -> Dict[str, Any]:
+        """Log a pipeline failure and build the error response."""
+        # Called from the except block, so the active traceback is attached
+        logger.exception("Error processing query: %s", error)
+        return {
+            "query": query_text,
+            "response": "An error occurred while processing your query.",
+            "documents": [],
+            "metadata": {
+                "error": str(error),
+                "document_count": 0,
+                "used_conversation_context": False,
+                "reranking_used": False,
+            },
+        }
 
     async def _rerank_documents(
             self,
             query: str,
             documents: List[Document],
-            reranking_service: RerankingService
+            reranking_service: RerankingService,
+            top_k: Optional[int] = None,
+            min_score: Optional[float] = None
     ) -> tuple[List[Document], List[float]]:
         """
         Rerank documents using the specified reranking service.
@@ -179,6 +600,8 @@ class RAGQueryProcessor:
             query: The query text
             documents: List of Document objects to rerank
             reranking_service: Service to use for reranking
+            top_k: Number of best documents to keep (all if None)
+            min_score: Drop documents scoring below this before ranking (keep all if None)
 
         Returns:
             Tuple of (reranked document list, scores)
@@ -186,31 +609,82 @@ class RAGQueryProcessor:
         if not documents:
             return [], []
 
-        document_texts = [doc.content for doc in documents]
-        scores = await reranking_service.rerank(
-            query=query,
-            documents=document_texts,
-            top_k=len(documents)
+        # Reuse scores for (query, document) pairs seen recently, for rerankers that
+        # score each pair on its own; the model keeps two models of a class apart
+        cache_scores = reranking_service.independent_scores
+        query_key = (
+            type(reranking_service).__name__,
+            getattr(reranking_service, "model_name", None) or getattr(reranking_service, "model_path", None),
+            hashlib.blake2s(query.encode("utf-8"), digest_size=8).digest(),
         )
-
-        # Match scores with documents
-        scored_docs = list(zip(documents, scores))
-        # Sort by score in descending order
-        scored_docs.sort(key=lambda x: x[1], reverse=True)
-
-        # Add score to document metadata and separate reranked docs from scores
+        if cache_scores:
+            scores: List[Optional[float]] = [_RERANK_SCORE_CACHE.get((*query_key, doc.id)) for doc in documents]
+        else:
+            scores = [None] * len(documents)
+        misses = [idx for idx, score in enumerate(scores) if score is None]
+
+        if misses:
+            # One call over the whole pool: BM25 scores depend on the other documents
+            # of the call, and the cross-encoders batch their forward passes themselves
+            results = reranking_service.rerank(
+                query=query,
+                documents=[(documents[idx].content or "")[:_RERANK_MAX_CHARS] for idx in misses],
+                metadata=[{"index": idx} for idx in misses],
+                top_k=len(misses)
+            )
+            if inspect.isawaitable(results):
+                results = await results
+
+            # Results come back sorted by score; map them to their documents by index
+            for result in results:
+                idx = result["metadata"]["index"]
+                scores[idx] = result["score"]
+                if cache_scores:
+                    _RERANK_SCORE_CACHE[(*query_key, documents[idx].id)] = result["score"]
+
+        # Threshold and select the best documents in one O(n log k) pass
+        candidates = zip(documents, scores)
+        if min_score is not None:
+            candidates = ((doc, score) for doc, score in candidates if score >= min_score)
+        scored_docs = heapq.nlargest(top_k or len(documents), candidates, key=itemgetter(1))
+
+        # Score detached shallow copies so documents shared with other requests
+        # (or a document cache) keep their own metadata and score untouched
         reranked_docs = []
         reranked_scores = []
 
         for doc, score in scored_docs:
-            doc.metadata = doc.metadata or {}
-            doc.metadata["rerank_score"] = score
-            doc.score = score  # Add score directly to document for easy access
-            reranked_docs.append(doc)
+            ranked = copy.copy(doc)
+            ranked.metadata = {**(doc.metadata or {}), "rerank_score": score}
+            ranked.score = score  # Add score directly to document for easy access
+            reranked_docs.append(ranked)
             reranked_scores.append(score)
 
         return reranked_docs, reranked_scores
 
+    def _build_documents_payload(self, documents: List[Document], query: str) -> List[DocumentResult]:
+        """
+        Build the per-document part of the response: id, title, source, snippet and score.
+
+        This is the CPU-bound snippet batch of a request: the query is parsed once
+        for all documents, and both entry points run it via `asyncio.to_thread` so
+        the event loop stays free while it works. It only reads the (detached,
+        reranked) documents, which makes running it off-loop safe.
+        """
+        extract_snippet = self._make_snippet_extractor(query)
+        return [
+            DocumentResult(
+                doc_id,
+                metadata.get("title", f"Document {idx}"),
+                source or "Unknown",
+                extract_snippet(content),
+                getattr(doc, "score", None),
+            )
+            for idx, (doc, (doc_id, source, content, metadata)) in enumerate(
+                zip(documents, map(_DOCUMENT_FIELDS, documents)), start=1
+            )
+        ]
+
     def _format_documents(self, documents: List[Document]) -> str:
         """
         Format a list of Document entities into a single string for the LLM.
@@ -220,16 +694,16 @@ class RAGQueryProcessor:
         if not documents:
             return "No relevant documents found."
 
-        parts: List[str] = ["RELEVANT DOCUMENTS:"]
-        for idx, doc in enumerate(documents, start=1):
-            title = doc.metadata.get("title", f"Document {idx}")
-            source = doc.source or "Unknown source"
-            score_info = f" (Score: {doc.score:.4f})" if hasattr(doc, "score") else ""
-            parts.append(f"[Document {idx}: {title} (Source: {source}){score_info}]")
-            parts.append(doc.content)
-            parts.append("")
-
-        return "\n".join(parts)
+        entries = tuple(
+            (
+                doc.metadata.get("title", f"Document {idx}"),
+                doc.source or "Unknown source",
+                getattr(doc, "score", _NO_SCORE),
+                doc.content,
+            )
+            for idx, doc in enumerate(documents, start=1)
+        )
+        return _format_document_block(entries)
 
     def _generate_system_prompt(
             self, conversation_context: str, document_context: str
@@ -237,49 +711,78 @@ class RAGQueryProcessor:
         """
         Assemble the system prompt including guidelines, conversation history,
         and document excerpts.
+
+        Blocks are ordered from most to least stable: the static prefix, then the
+        conversation history (shared by every turn of a conversation), then the
+        per-query documents, so cached prompt prefixes stay as long as possible.
         """
-        base_instructions = [
-            "You are a helpful assistant that answers questions based on the provided information.",
-            "Always respond using only the information in the provided documents and conversation history.",
-            "If the answer is not in the provided information, say you don't have enough information.",
-            "Do not make up information."
-        ]
         if conversation_context:
-            base_instructions.append("\nCONVERSATION HISTORY:")
-            base_instructions.append(conversation_context)
+            return "".join(
+                (SYSTEM_PROMPT_PREFIX, "CONVERSATION HISTORY:\n", conversation_context, "\n\n", document_context)
+            )
+        return SYSTEM_PROMPT_PREFIX + document_context
 
-        base_instructions.append("\n" + document_context)
-        return "\n".join(base_instructions)
+    def _make_snippet_extractor(self, query: str, max_length: int = 200) -> Callable[[str], str]:
+        """
+        Return a `text -> snippet` function for one query.
+
+        The query is tokenized once here and shared by every snippet of the response.
+        """
+        return partial(self._extract_snippet, query_terms=_query_terms(query), max_length=max_length)
 
-    def _extract_snippet(self, text: str, query: str, max_length: int = 200) -> str:
+    def _extract_snippet(self, text: str, query_terms: FrozenSet[str], max_length: int = 200) -> str:
         """
         Extract a relevant snippet up to `max_length` characters around query terms.
 
         Implements a sliding window to maximize query term coverage with better edge handling.
+        `query_terms` is the output of `_query_terms`; use `_make_snippet_extractor`
+        to compute it once per query.
         """
         if len(text) <= max_length:
             return text
 
-        query_terms = set(word.lower() for word in query.lower().split() if len(word) > 2)
-
         # If no significant query terms, return the beginning of the document
         if not query_terms:
             return text[:max_length] + ("..." if len(text) > max_length else "")
 
-        text_lower = text.lower()
         best_start = 0
         best_score = 0
         window = max_length * 2  # Double-sized window for searching
+        half_window = window // 2
         step = max(max_length // 4, 20)  # Smaller steps for better precision
 
-        # Find the chunk with highest query term density
-        for start in range(0, len(text_lower) - window + 1, step):
-            chunk = text_lower[start:start + window]
-            # Weight by both term presence and position in chunk
-            score = sum(3 if term in chunk[:window // 2] else 1 for term in query_terms if term in chunk)
-            if score > best_score:
-                best_score = score
-                best_start = start
+        # Locate term occurrences with C-level substring scans over one lowercased copy;
+        # far cheaper than a case-insensitive regex over the original text
+        text_lower = text.lower()
+        term_positions = [
+            (found, len(term)) for term in query_terms if (found := _find_all(text_lower, term))
+        ]
+
+        window_starts = range(0, len(text) - window + 1, step)
+        if len(window_starts) >= _VECTORIZED_MIN_WINDOWS:
+            best_start = _best_window_start(term_positions, window_starts, half_window)
+        else:
+            # Every present term near the start of the window: no later window can beat it
+            perfect_score = 3 * len(term_positions)
+
+            # Find the chunk with highest query term density
+            for start in window_starts:
+                # Weight by both term presence and position in chunk
+                score = 0
+                for found, term_len in term_positions:
+                    idx = bisect_left(found, start)
+                    if idx == len(found):
+                        continue
+                    end = found[idx] + term_len
+                    if end <= start + half_window:
+                        score += 3
+                    elif end <= start + window:
+                        score += 1
+                if score > best_score:
+                    best_score = score
+                    best_start = start
+                    if best_score == perfect_score:
+                        break
 
         # Fine-tune to avoid cutting words
         adjusted_start = best_start
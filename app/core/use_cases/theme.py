@@ -1,4 +1,5 @@
 # app/core/use_cases/theme.py
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -142,19 +143,30 @@ class ThemeUseCase:
             bool: True if deleted successfully, False otherwise
         """
         try:
-            # 1. Delete files from disk
             files = await self.theme_repository.get_files_by_theme(theme_id)
-            for file in files:
-                await self.file_manager.delete_file(file.file_path)
-
-            # 2. Delete documents from disk
             documents = await self.theme_repository.get_direct_documents_by_theme(theme_id)
-            for doc in documents:
-                self.document_store._delete_document_from_disk(
-                    document_id=doc.id,
-                    owner_id=doc.owner_id,
-                    theme_id=doc.theme_id
-                )
+
+            # 1-2. Delete files and cached documents from disk concurrently; the
+            # blocking document unlinks run in worker threads
+            results = await asyncio.gather(
+                *(self.file_manager.delete_file(file.file_path) for file in files),
+                *(
+                    asyncio.to_thread(
+                        self.document_store._delete_document_from_disk,
+                        document_id=doc.id,
+                        owner_id=doc.owner_id,
+                        theme_id=doc.theme_id
+                    )
+                    for doc in documents
+                ),
+                return_exceptions=True
+            )
+
+            # A failed unlink should not keep the theme alive; log it and carry on
+            targets = [file.file_path for file in files] + [f"document {doc.id}" for doc in documents]
+            for target, result in zip(targets, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to delete {target} of theme {theme_id}: {result}")
 
             # 3. Finally delete everything in DB
             return await self.theme_repository.delete_theme(theme_id)
@@ -205,14 +217,17 @@ class ThemeUseCase:
             List[Document]: List of document entities
         """
         document_ids = await self.theme_repository.get_theme_documents(theme_id)
+        if not document_ids:
+            return []
 
-        documents = []
-        for doc_id in document_ids:
-            document = await self.document_store.get_document(doc_id)
-            if document:
-                documents.append(document)
+        # One bulk lookup (disk cache, then a single IN query) instead of a query per document
+        theme = await self.theme_repository.get_theme(theme_id)
+        owner_id = theme.owner_id if theme else None
+        documents = await self.document_store.get_documents(document_ids, owner_id, theme_id)
 
-        return documents
+        # Keep the theme's document order
+        by_id = {document.id: document for document in documents if document}
+        return [by_id[doc_id] for doc_id in document_ids if doc_id in by_id]
 
     async def get_theme_files(self, theme_id: str) -> List[File]:
         """
@@ -1,6 +1,7 @@
 # core/entities/document.py
 from typing import Dict, List, Optional, Any
-import uuid
+
+from utils.ids import generate_uuid4
 
 
 class Document:
@@ -48,7 +49,7 @@ class Document:
             owner_id (str, optional): User ID. Defaults to None.
 
         """
-        self.id = id if id is not None else str(uuid.uuid4())
+        self.id = id if id is not None else generate_uuid4()
         self.content = content
         self.metadata = metadata or {}
         self.embedding = embedding
@@ -2,6 +2,8 @@
 from typing import Dict, List, Any, Optional
 import uuid
 
+import numpy as np
+
 
 class Query:
     """
@@ -13,12 +15,15 @@ class Query:
     Attributes:
         id (str): Unique identifier for the query.
         text (str): The query text.
-        embedding (List[float]): Vector embedding of the query.
+        embedding (np.ndarray): Vector embedding of the query (float32).
         metadata (Dict[str, Any]): Additional metadata about the query.
         user_id (str): ID of the user who made the query.
         created_at (str): Timestamp of when the query was created.
     """
 
+    # Fixed attribute layout: no per-instance __dict__ on the hot query path
+    __slots__ = ("id", "text", "embedding", "metadata", "user_id", "created_at")
+
     def __init__(
             self,
             text: str,
@@ -33,7 +38,8 @@ class Query:
 
         Args:
             text (str): The query text.
-            embedding (List[float], optional): Vector embedding. Defaults to None.
+            embedding (List[float] | np.ndarray, optional): Vector embedding, stored as a
+                contiguous float32 array. Defaults to None.
             metadata (Dict[str, Any], optional): Additional metadata. Defaults to None.
             user_id (str, optional): User ID. Defaults to None.
             id (str, optional): Unique identifier. If None, a UUID is generated. Defaults to None.
@@ -41,7 +47,7 @@ class Query:
         """
         self.id = id if id is not None else str(uuid.uuid4())
         self.text = text
-        self.embedding = embedding
+        self.embedding = np.asarray(embedding, dtype=np.float32) if embedding is not None else None
         self.metadata = metadata or {}
         self.user_id = user_id
         self.created_at = created_at
@@ -56,7 +62,7 @@ class Query:
         return {
             "id": self.id,
             "text": self.text,
-            "embedding": self.embedding,
+            "embedding": self.embedding.tolist() if self.embedding is not None else None,
             "metadata": self.metadata,
             "user_id": self.user_id,
             "created_at": self.created_at
@@ -6,7 +6,7 @@ from typing import Optional, List, Dict, Any
 from api.schemas.task import TaskTypeEnum, TaskStatusEnum
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     id: Optional[str]
     type: TaskTypeEnum
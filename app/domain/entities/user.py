@@ -1,6 +1,7 @@
 # core/entities/user.py
 from typing import Dict, Any, List, Optional
-import uuid
+
+from utils.ids import generate_uuid7
 
 
 class User:
@@ -22,6 +23,12 @@ class User:
         metadata (Dict[str, Any]): Additional metadata about the user.
     """
 
+    # No per-instance __dict__; also the field order used by to_dict
+    __slots__ = (
+        "id", "username", "email", "hashed_password", "is_active",
+        "is_admin", "created_at", "updated_at", "metadata",
+    )
+
     def __init__(
             self,
             username: str,
@@ -41,14 +48,14 @@ class User:
             username (str): Username for login.
             email (str): Email address of the user.
             hashed_password (str): Hashed password for authentication.
-            id (str, optional): Unique identifier. If None, a UUID is generated. Defaults to None.
+            id (str, optional): Unique identifier. If None, a time-ordered UUIDv7 is generated. Defaults to None.
             is_active (bool, optional): Account active status. Defaults to True.
             is_admin (bool, optional): Admin status. Defaults to False.
             created_at (str, optional): Creation timestamp. Defaults to None.
             updated_at (str, optional): Update timestamp. Defaults to None.
             metadata (Dict[str, Any], optional): Additional metadata. Defaults to None.
         """
-        self.id = id if id is not None else str(uuid.uuid4())
+        self.id = id if id is not None else generate_uuid7()
         self.username = username
         self.email = email
         self.hashed_password = hashed_password
@@ -65,17 +72,7 @@ class User:
         Returns:
             Dict[str, Any]: Dictionary representation of the user.
         """
-        return {
-            "id": self.id,
-            "username": self.username,
-            "email": self.email,
-            "hashed_password": self.hashed_password,
-            "is_active": self.is_active,
-            "is_admin": self.is_admin,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "metadata": self.metadata
-        }
+        return {attr: getattr(self, attr) for attr in self.__slots__}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'User':
@@ -3,15 +3,20 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class ChunkingServiceInterface(ABC):
     """Interface for text chunking services."""
 
-    @abstractmethod
     def chunk_text(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None,
                    separator: Optional[str] = None) -> List[str]:
+        return [text[start:end] for start, end in self.chunk_text_offsets(text, chunk_size, chunk_overlap, separator)]
+
+    @abstractmethod
+    def chunk_text_offsets(self, text: str, chunk_size: Optional[int] = None, chunk_overlap: Optional[int] = None,
+                           separator: Optional[str] = None) -> List[Tuple[int, int]]:
+        """Return each chunk as (start, end) character offsets into `text` instead of a copied substring."""
         pass
 
     @abstractmethod
@@ -1,7 +1,7 @@
 # core/interfaces/document_store.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from domain.entities.document import Document
 
 
@@ -12,6 +12,15 @@ class DocumentStoreInterface(ABC):
     async def store_document(self, document: Document) -> str:
         pass
 
+    async def store_documents(self, documents: List[Document]) -> List[str]:
+        """
+        Store many documents, returning their IDs in input order.
+
+        The default stores them one by one; stores backed by a database
+        override it to insert the whole batch at once.
+        """
+        return [await self.store_document(document) for document in documents]
+
     @abstractmethod
     async def get_document(self,document_id: str, owner_id: str, theme_id: str) -> Optional[Document]:
         pass
@@ -32,6 +41,20 @@ class DocumentStoreInterface(ABC):
     async def search_documents(self, query: str, limit: int = 5, owner_id: Optional[str] = None) -> List[Document]:
         pass
 
+    @abstractmethod
+    def iter_documents(
+            self,
+            filter_criteria: Optional[Dict[str, Any]] = None,
+            batch_size: int = 500
+    ) -> AsyncIterator[Document]:
+        """
+        Stream documents matching `filter_criteria`, fetching `batch_size` at a time.
+
+        Memory stays bounded regardless of how many documents match, so large
+        themes should be walked with `async for` rather than loaded as a list.
+        """
+        pass
+
     @abstractmethod
     async def count_documents(self, filter_criteria: Optional[Dict[str, Any]] = None) -> int:
         pass
@@ -1,28 +1,57 @@
 # core/interfaces/embedding.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
+
+import numpy as np
+
 from domain.entities.document import Document
 
+# Single embedding: shape (d,), float32
+EmbeddingVector = np.ndarray
+# Batch of embeddings: shape (n, d), float32, C-contiguous
+EmbeddingMatrix = np.ndarray
+
 
 class EmbeddingInterface(ABC):
-    """Interface for embedding services."""
+    """
+    Interface for embedding services.
+
+    `embed_batch` is the primary entry point: the model is invoked once per
+    slice of `batch_size` texts. Callers embedding many texts (e.g. the chunks
+    of several files) should accumulate them and make a single call rather
+    than embedding item by item; the single-text methods are thin wrappers
+    kept for convenience.
+
+    Embeddings are returned as float32 NumPy arrays (`EmbeddingVector` /
+    `EmbeddingMatrix`) so they can go straight into vector kernels and
+    indexes without per-element Python conversion.
+    """
+
+    @abstractmethod
+    async def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> EmbeddingMatrix:
+        """
+        Embed `texts`, running the model on at most `batch_size` texts at a time.
+
+        When `batch_size` is None the service's configured batch size is used.
+        """
+        pass
 
     @abstractmethod
     async def embed_documents(self, documents: List[Document]) -> List[Document]:
         pass
 
     @abstractmethod
-    async def embed_query(self, query: str) -> List[float]:
+    async def embed_query(self, query: str) -> EmbeddingVector:
         pass
 
     @abstractmethod
-    async def get_embedding(self, text: str) -> List[float]:
+    async def get_embedding(self, text: str) -> EmbeddingVector:
         pass
 
     @abstractmethod
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def get_embeddings(self, texts: List[str]) -> EmbeddingMatrix:
         pass
 
     @abstractmethod
-    async def embed_text(self, text: str) -> List[float]:
-        pass
\ No newline at end of file
+    async def embed_text(self, text: str) -> EmbeddingVector:
+        pass
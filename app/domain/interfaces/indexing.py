@@ -1,7 +1,10 @@
 # app/core/interfaces/indexing.py
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
 from domain.entities.document import Document
 
 
@@ -19,15 +22,25 @@ class IndexInterface(ABC):
         Asynchronously adds a list of documents to the index.
     search(query_embedding: List[float], k: int = 5) -> List[Dict[str, Any]]
         Asynchronously searches the index for documents similar to the query embedding.
+    search_batch(query_matrix: np.ndarray, k: int = 5) -> List[List[Dict[str, Any]]]
+        Asynchronously searches the index for every row of a (nq, d) query matrix in one call.
     delete_document(doc_id: str) -> None
         Asynchronously deletes a document from the index by its ID.
     save_index(path: str) -> None
         Asynchronously saves the current state of the index to disk.
     load_index(path: str) -> None
         Asynchronously loads the index state from disk.
+    add_vectors_from_ndarray(matrix: np.ndarray, document_ids: List[str],
+                             contents: List[str], metadata: List[Dict]) -> None
+        Asynchronously adds a C-contiguous float32 (n, d) matrix with metadata directly
+        to the index, without copying or converting the vectors.
     add_vectors(vectors: List[List[float]], document_ids: List[str],
                 contents: List[str], metadata: List[Dict]) -> None
-        Asynchronously adds raw vectors with metadata directly to the index.
+        Deprecated list-based variant of `add_vectors_from_ndarray`; converts the
+        vectors to a float32 matrix once and delegates to it.
+    train(training_matrix: np.ndarray) -> None
+        Asynchronously trains the index's quantizer (PQ, SQ8, ...) on sample vectors;
+        a no-op for indexes that store raw vectors or manage training themselves.
     """
 
     @abstractmethod
@@ -38,6 +51,10 @@ class IndexInterface(ABC):
     async def search(self, query_embedding: List[float], k: int = 5) -> List[Dict[str, Any]]:
         pass
 
+    @abstractmethod
+    async def search_batch(self, query_matrix: np.ndarray, k: int = 5) -> List[List[Dict[str, Any]]]:
+        pass
+
     @abstractmethod
     async def delete_document(self, doc_id: str) -> None:
         pass
@@ -51,6 +68,29 @@ class IndexInterface(ABC):
         pass
 
     @abstractmethod
-    async def add_vectors(self, vectors: List[List[float]], document_ids: List[str], contents: List[str],
-                          metadata: List[Dict]) -> None:
+    async def add_vectors_from_ndarray(self, matrix: np.ndarray, document_ids: List[str],
+                                       contents: Optional[List[str]] = None,
+                                       metadata: Optional[List[Dict]] = None) -> None:
+        pass
+
+    async def add_vectors(self, vectors: List[List[float]], document_ids: List[str],
+                          contents: Optional[List[str]] = None, metadata: Optional[List[Dict]] = None) -> None:
+        if len(vectors) == 0:
+            return
+
+        # No copy when the caller already holds a float32 matrix
+        await self.add_vectors_from_ndarray(
+            np.ascontiguousarray(vectors, dtype=np.float32), document_ids, contents, metadata
+        )
+
+    @staticmethod
+    def _check_matrix(matrix: np.ndarray) -> None:
+        """Reject matrices the backends would have to copy or convert."""
+        if matrix.dtype != np.float32 or not matrix.flags["C_CONTIGUOUS"] or matrix.ndim != 2:
+            raise ValueError(
+                f"Expected a C-contiguous float32 (n, d) matrix, got {matrix.dtype} with shape {matrix.shape}"
+            )
+
+    @abstractmethod
+    async def train(self, training_matrix: np.ndarray) -> None:
         pass
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 
 class LLMInterface(ABC):
@@ -15,3 +15,20 @@ class LLMInterface(ABC):
 
     async def generate_text(self, prompt: str) -> str:
         return await self.generate(prompt, context=[], max_tokens=None)
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream generated text for `prompt` chunk by chunk as the model produces it.
+
+        This is the only streaming entry point; the RAG pipeline and
+        `LLMService` both stream through it. Backends that can decode
+        incrementally override it so callers see the first tokens immediately;
+        the default yields the whole `generate` result as a single chunk, and
+        raises if the backend reported an error instead of streaming its text.
+        """
+        result = await self.generate(prompt, **kwargs)
+        if isinstance(result, dict):
+            if "error" in result:
+                raise RuntimeError(result["error"])
+            result = result["text"]
+        yield result
@@ -1,12 +1,85 @@
 # app/core/interfaces/reranking.py
+import inspect
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
 
 
 class RerankingService(ABC):
     """Interface for document reranking services."""
 
+    # True when a document's score depends only on the query and that document,
+    # so scores may be cached and compared across calls (not BM25, whose IDF
+    # depends on the other documents of the call)
+    independent_scores: bool = False
+
     @abstractmethod
     async def rerank(self, query: str, documents: List[str], metadata: Optional[List[Dict[str, Any]]] = None,
                top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         pass
+
+    async def rerank_batch(self, queries: List[str], documents: List[List[str]],
+                           top_k: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Rerank the document list of each query.
+
+        The default reranks the queries one after another; model-backed
+        rerankers override it to score every (query, document) pair in a
+        single forward pass.
+
+        Parameters
+        ----------
+        queries : List[str]
+            The query texts
+        documents : List[List[str]]
+            The documents to rerank for each query, aligned with `queries`
+        top_k : Optional[int], optional
+            Number of top results to return per query, by default None
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            Reranked documents with scores, one list per query
+        """
+        batch_results = []
+        for query, docs in zip(queries, documents):
+            results = self.rerank(query=query, documents=docs, top_k=top_k)
+            if inspect.isawaitable(results):
+                results = await results
+            batch_results.append(results)
+        return batch_results
+
+    @staticmethod
+    def _rank_results(
+            documents: List[str],
+            scores: Sequence[float],
+            metadata: Optional[List[Dict[str, Any]]] = None,
+            top_k: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build result dicts for the `top_k` best-scoring documents, best first.
+
+        Only the winners are sorted: a partition finds the `top_k`-th score in
+        O(n) when `top_k` is smaller than the number of documents. Documents
+        tied on that score are taken in input order, so the result is always a
+        prefix of the full ranking.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        if top_k and 0 < top_k < len(scores):
+            cutoff = np.partition(scores, -top_k)[-top_k]
+            above = np.flatnonzero(scores > cutoff)
+            tied = np.flatnonzero(scores == cutoff)[:top_k - len(above)]
+            winners = np.concatenate([above, tied])
+            order = winners[np.argsort(-scores[winners], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+
+        return [
+            {
+                "content": documents[i],
+                "score": float(scores[i]),
+                "metadata": metadata[i] if metadata else {}
+            }
+            for i in order.tolist()
+        ]
@@ -1,9 +1,26 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
 
 
 class VectorIndexInterface(ABC):
-    """Abstract interface for vector index implementations."""
+    """
+    Abstract interface for vector index implementations.
+
+    Implementations may store quantized codes (scalar, product or binary
+    quantization) instead of raw vectors; such indexes must be trained on a
+    representative sample via `train` before vectors are added.
+
+    Filtered search: `search_filtered` takes either a metadata filter dict or
+    a predicate over vector IDs. Implementations should apply it during the
+    ANN traversal (e.g. a FAISS ``IDSelectorBatch``, an HNSW filter callback
+    or a native backend filter) so ineligible vectors are never scored, and
+    widen the candidate list (``efSearch``, ``nprobe``) by `oversample` to
+    keep recall when the filter is selective. The default post-filters an
+    oversampled `search` and may return fewer than `top_k` results when few
+    candidates pass.
+    """
 
     @abstractmethod
     async def add_vectors(self, vectors: List[List[float]], ids: List[str]) -> List[str]:
@@ -14,6 +31,19 @@ class VectorIndexInterface(ABC):
     List[Dict[str, Any]]:
         pass
 
+    async def search_filtered(
+            self,
+            query_vector: Union[List[float], np.ndarray],
+            top_k: int,
+            predicate: Union[Callable[[str], bool], Dict[str, Any]],
+            oversample: int = 4
+    ) -> List[Dict[str, Any]]:
+        if isinstance(predicate, dict):
+            return await self.search(query_vector, top_k=top_k, filter_dict=predicate)
+
+        candidates = await self.search(query_vector, top_k=top_k * oversample)
+        return [candidate for candidate in candidates if predicate(candidate["id"])][:top_k]
+
     @abstractmethod
     async def delete_vectors(self, ids: List[str]) -> int:
         pass
@@ -21,3 +51,7 @@ class VectorIndexInterface(ABC):
     @abstractmethod
     async def count_vectors(self, filter_dict: Optional[Dict[str, Any]] = None) -> int:
         pass
+
+    @abstractmethod
+    async def train(self, training_matrix: np.ndarray) -> None:
+        pass
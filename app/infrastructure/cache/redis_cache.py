@@ -1,13 +1,98 @@
 # app/infrastructure/cache/redis_cache.py
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
-import aioredis
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Union
+from weakref import WeakValueDictionary
+import numpy as np
+import redis.asyncio as aioredis
+from cachetools import LRUCache
 from app.config import settings
 from utils.logger_util import get_logger
 
+# Optional fast JSON codec
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Embeddings are raw float32 bytes; the prefix names the encoding so a format
+# change never decodes old values under the new layout
+_EMBEDDING_PREFIX = "embedding:f32:"
+_EMBEDDING_ITEMSIZE = np.dtype(np.float32).itemsize
+# Key prefixes mirrored in-process under server-assisted client-side caching
+_TRACKED_PREFIXES = (_EMBEDDING_PREFIX, "query_results:")
+# Channel Redis publishes tracking invalidations on for redirected clients
+_INVALIDATION_CHANNEL = "__redis__:invalidate"
+# Placeholder for a mirrored key whose value is still being fetched
+_PENDING = object()
+
+# Connection pools shared by every RedisCache, keyed by URL and response decoding
+_POOLS: Dict[Tuple[str, bool], aioredis.BlockingConnectionPool] = {}
+_POOL_HEALTH_CHECKS: Dict[Tuple[str, bool], asyncio.Task] = {}
+_MAX_CONNECTIONS = 64
+_HEALTH_CHECK_INTERVAL = 30
+
+
+def _get_pool(redis_url: str, decode_responses: bool) -> aioredis.BlockingConnectionPool:
+    """
+    Return the process-wide pool for `redis_url`, creating it and its health check on first use.
+
+    The pool blocks when all connections are busy instead of failing, and a
+    background PING every `_HEALTH_CHECK_INTERVAL` seconds keeps it warm.
+    """
+    key = (redis_url, decode_responses)
+    pool = _POOLS.get(key)
+    if pool is None:
+        pool = _POOLS[key] = aioredis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=_MAX_CONNECTIONS,
+            decode_responses=decode_responses,
+            health_check_interval=_HEALTH_CHECK_INTERVAL
+        )
+
+    task = _POOL_HEALTH_CHECKS.get(key)
+    if task is None or task.done():
+        _POOL_HEALTH_CHECKS[key] = asyncio.create_task(_keep_pool_warm(pool))
+    return pool
+
+
+async def _keep_pool_warm(pool: aioredis.BlockingConnectionPool) -> None:
+    """PING through `pool` periodically so idle connections are checked and kept open."""
+    client = aioredis.Redis(connection_pool=pool)
+    while True:
+        await asyncio.sleep(_HEALTH_CHECK_INTERVAL)
+        try:
+            await client.ping()
+        except Exception as e:
+            logger.warning(f"Redis health check failed: {str(e)}")
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize objects the JSON codec does not handle natively."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value.__dict__
+
+
+def _dumps(value: Any) -> Union[str, bytes]:
+    """Serialize a value to JSON, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            value,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(value, default=_json_default)
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class RedisCache:
     """
@@ -15,30 +100,74 @@ class RedisCache:
 
     This class provides an interface for working with Redis as a cache.
     It handles serialization/deserialization of complex objects and
-    provides typed methods for different data structures.
+    provides typed methods for different data structures. Values are stored
+    as JSON; embeddings are stored as raw float32 bytes through a second,
+    binary-safe connection, and recently used embeddings are kept in an
+    in-process LRU so repeated lookups skip the network.
+
+    With client tracking enabled, keys under `_TRACKED_PREFIXES` are also
+    mirrored locally: Redis broadcasts every write or expiry of those
+    prefixes on the invalidation channel and the listener evicts the local
+    copy, so repeated reads are served from memory without going stale. If
+    tracking cannot be enabled or the listener drops, the mirror is cleared
+    and reads go to Redis again. Broadcasts also cover this instance's own
+    embedding writes; those are counted so the vector just stored locally
+    is not evicted by the echo of its own write.
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+            self,
+            redis_url: Optional[str] = None,
+            embedding_cache_size: int = 4096,
+            client_tracking: bool = True,
+            embedding_dimension: Optional[int] = None
+    ):
         """
         Initialize the Redis cache.
 
         Args:
             redis_url: Redis connection string. If None, uses setting from config.
+            embedding_cache_size: Number of embeddings (and mirrored values) kept in process.
+            client_tracking: Mirror tracked keys locally using Redis invalidation messages.
+            embedding_dimension: Expected vector length; cached vectors of another length are misses.
         """
         self.redis_url = redis_url or settings.REDIS_URL
         self.client = None
+        # Binary-safe client (no response decoding) for raw embedding bytes
+        self.binary_client = None
         self.connected = False
+        # In-process LRU of read-only embedding vectors, keyed by cache key
+        self._embedding_lru: LRUCache = LRUCache(maxsize=embedding_cache_size)
+        # One lock per key being fetched, so concurrent misses share a single Redis read
+        self._embedding_locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+        self._embedding_hits = 0
+        self._embedding_lookups = 0
+        self.embedding_dimension = embedding_dimension
+        # Client-side caching: serialized values of tracked keys, kept coherent by Redis
+        self.client_tracking = client_tracking
+        self._tracking = False
+        self._tracked_values: LRUCache = LRUCache(maxsize=embedding_cache_size)
+        # Embedding writes of this instance whose invalidation has not arrived yet, by key
+        self._own_writes: LRUCache = LRUCache(maxsize=embedding_cache_size)
+        self._tracking_client = None
+        self._listener = None
+        self._invalidations = None
+        self._invalidation_task: Optional[asyncio.Task] = None
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of embedding lookups served by the in-process LRU."""
+        return self._embedding_hits / self._embedding_lookups if self._embedding_lookups else 0.0
 
     async def connect(self) -> None:
         """Establish connection to Redis."""
         if not self.connected:
             try:
                 logger.info(f"Connecting to Redis at {self.redis_url}")
-                self.client = await aioredis.from_url(
-                    self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True
-                )
+                # Every instance draws from the same pools instead of opening its own
+                self.client = aioredis.Redis(connection_pool=_get_pool(self.redis_url, True))
+                self.binary_client = aioredis.Redis(connection_pool=_get_pool(self.redis_url, False))
+                await self.client.ping()
                 self.connected = True
                 logger.info("Successfully connected to Redis")
             except Exception as e:
@@ -46,10 +175,129 @@ class RedisCache:
                 self.connected = False
                 raise
 
+            if self.client_tracking:
+                await self._enable_tracking()
+
+    async def _enable_tracking(self) -> None:
+        """
+        Subscribe to tracking invalidations and start mirroring tracked prefixes.
+
+        A named pub/sub connection receives the invalidations; a dedicated
+        connection turns on broadcast tracking for the prefixes and redirects
+        its messages there. Needs Redis 6+; older servers keep the plain path.
+        """
+        listener_name = f"rag-cache-invalidations-{uuid.uuid4().hex[:12]}"
+        try:
+            self._listener = aioredis.from_url(self.redis_url, decode_responses=True, client_name=listener_name)
+            self._invalidations = self._listener.pubsub()
+            await self._invalidations.subscribe(_INVALIDATION_CHANNEL)
+
+            listener_id = next(
+                client["id"] for client in await self.client.client_list(_type="pubsub")
+                if client.get("name") == listener_name
+            )
+
+            # Tracking lives as long as this connection, so it gets one of its own
+            self._tracking_client = aioredis.from_url(self.redis_url, single_connection_client=True)
+            prefixes = [arg for prefix in _TRACKED_PREFIXES for arg in ("PREFIX", prefix)]
+            await self._tracking_client.execute_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", listener_id, "BCAST", *prefixes
+            )
+        except Exception as e:
+            logger.warning(f"Redis client-side caching unavailable, reading through: {str(e)}")
+            await self._disable_tracking()
+            return
+
+        self._tracking = True
+        self._invalidation_task = asyncio.create_task(self._listen_invalidations())
+        logger.info(f"Redis client-side caching enabled for prefixes {', '.join(_TRACKED_PREFIXES)}")
+
+    async def _listen_invalidations(self) -> None:
+        """Evict local copies of keys Redis reports as modified, expired or flushed."""
+        try:
+            async for message in self._invalidations.listen():
+                if message["type"] != "message":
+                    continue
+
+                keys = message["data"]
+                if not isinstance(keys, list):
+                    # FLUSHDB/FLUSHALL invalidate everything
+                    self._tracked_values.clear()
+                    self._embedding_lru.clear()
+                    self._own_writes.clear()
+                    continue
+
+                for key in keys:
+                    self._tracked_values.pop(key, None)
+                    if not self._consume_own_write(key):
+                        self._embedding_lru.pop(key, None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Redis invalidation listener stopped: {str(e)}")
+        finally:
+            # Without invalidations the mirror could go stale
+            self._tracking = False
+            self._tracked_values.clear()
+            self._own_writes.clear()
+
+    def _note_own_write(self, cache_key: str) -> None:
+        """Expect one broadcast invalidation for an embedding this instance is writing."""
+        if self._tracking:
+            self._own_writes[cache_key] = self._own_writes.get(cache_key, 0) + 1
+
+    def _forget_own_write(self, cache_key: str) -> None:
+        """Drop an expected invalidation whose write did not reach Redis."""
+        self._consume_own_write(cache_key)
+
+    def _consume_own_write(self, cache_key: str) -> bool:
+        """
+        Match an invalidation against this instance's pending writes of the key.
+
+        Invalidations arrive in write order, so an earlier write by another
+        client may consume the count instead; the echo of our own write then
+        evicts the fresh vector, which only costs a miss.
+        """
+        pending = self._own_writes.get(cache_key)
+        if not pending:
+            return False
+        if pending == 1:
+            del self._own_writes[cache_key]
+        else:
+            self._own_writes[cache_key] = pending - 1
+        return True
+
+    async def _disable_tracking(self) -> None:
+        """Stop mirroring tracked keys and release the tracking connections."""
+        self._tracking = False
+        self._tracked_values.clear()
+        self._own_writes.clear()
+
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except asyncio.CancelledError:
+                pass
+            self._invalidation_task = None
+
+        if self._invalidations is not None:
+            await self._invalidations.close()
+            self._invalidations = None
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+        if self._tracking_client is not None:
+            await self._tracking_client.close()
+            self._tracking_client = None
+
     async def disconnect(self) -> None:
-        """Close Redis connection."""
+        """Close Redis connection; the shared connection pools stay open for other instances."""
         if self.connected and self.client:
+            await self._disable_tracking()
             await self.client.close()
+            if self.binary_client:
+                await self.binary_client.close()
             self.connected = False
             logger.info("Disconnected from Redis")
 
@@ -72,19 +320,18 @@ class RedisCache:
         """
         await self.ensure_connected()
         try:
-            # Handle different data types
-            if isinstance(value, (list, dict, bool, int, float, str)) or value is None:
-                serialized = json.dumps(value)
-            else:
-                # Attempt to handle more complex objects
-                serialized = json.dumps(value, default=lambda o: o.__dict__)
+            # Complex objects fall back to their __dict__
+            serialized = _dumps(value)
+
+            # Drop the local copy now rather than waiting for the invalidation
+            self._tracked_values.pop(key, None)
 
             if ttl:
                 result = await self.client.setex(key, ttl, serialized)
             else:
                 result = await self.client.set(key, serialized)
 
-            return result == "OK"
+            return bool(result)
         except Exception as e:
             logger.error(f"Error setting cache key {key}: {str(e)}")
             return False
@@ -102,18 +349,116 @@ class RedisCache:
         """
         await self.ensure_connected()
         try:
-            value = await self.client.get(key)
+            if self._tracking and key.startswith(_TRACKED_PREFIXES):
+                value = await self._get_tracked(key)
+            else:
+                value = await self.client.get(key)
             if value is None:
                 return default
 
             try:
-                return json.loads(value)
+                return _loads(value)
             except json.JSONDecodeError:
                 return value
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {str(e)}")
             return default
 
+    async def _get_tracked(self, key: str) -> Optional[str]:
+        """
+        Read a tracked key's serialized value from the local mirror, filling it on a miss.
+        """
+        value = self._tracked_values.get(key)
+        if value is not None and value is not _PENDING:
+            return value
+
+        # An invalidation arriving during the read evicts the placeholder,
+        # so a value that is already stale is not mirrored
+        self._tracked_values[key] = _PENDING
+        value = await self.client.get(key)
+        if self._tracked_values.get(key) is _PENDING:
+            if value is None:
+                self._tracked_values.pop(key, None)
+            else:
+                self._tracked_values[key] = value
+        return value
+
+    async def mget(self, keys: List[str], default: Any = None) -> List[Any]:
+        """
+        Get several values from the cache in one round trip.
+
+        Args:
+            keys: Cache keys
+            default: Value returned for missing keys
+
+        Returns:
+            Cached values in the order of `keys`
+        """
+        if not keys:
+            return []
+
+        await self.ensure_connected()
+        try:
+            values = await self.client.mget(keys)
+        except Exception as e:
+            logger.error(f"Error getting {len(keys)} cache keys: {str(e)}")
+            return [default] * len(keys)
+
+        results = []
+        for value in values:
+            if value is None:
+                results.append(default)
+                continue
+            try:
+                results.append(_loads(value))
+            except json.JSONDecodeError:
+                results.append(value)
+        return results
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values in the cache in one round trip.
+
+        Args:
+            mapping: Values to store by cache key (will be JSON serialized)
+            ttl: Time-to-live in seconds
+
+        Returns:
+            bool: True if operation succeeded
+        """
+        if not mapping:
+            return True
+
+        await self.ensure_connected()
+        try:
+            serialized = {key: _dumps(value) for key, value in mapping.items()}
+            if not ttl:
+                return bool(await self.client.mset(serialized))
+
+            # MSET takes no expiry, so pipeline one SETEX per key instead
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in serialized.items():
+                pipe.setex(key, ttl, value)
+            return all(await pipe.execute())
+        except Exception as e:
+            logger.error(f"Error setting {len(mapping)} cache keys: {str(e)}")
+            return False
+
+    async def pipeline(self, transaction: bool = False):
+        """
+        Return a pipeline that sends its queued commands in one round trip.
+
+        Values are passed through unchanged, so callers serialize them themselves.
+
+        Args:
+            transaction: Wrap the commands in MULTI/EXEC
+
+        Returns:
+            The Redis pipeline; run it with `await pipe.execute()`
+        """
+        await self.ensure_connected()
+        return self.client.pipeline(transaction=transaction)
+
     async def delete(self, key: str) -> bool:
         """
         Delete a key from the cache.
@@ -126,6 +471,8 @@ class RedisCache:
         """
         await self.ensure_connected()
         try:
+            self._embedding_lru.pop(key, None)
+            self._tracked_values.pop(key, None)
             result = await self.client.delete(key)
             return result > 0
         except Exception as e:
@@ -192,6 +539,8 @@ class RedisCache:
         """
         await self.ensure_connected()
         try:
+            self._embedding_lru.clear()
+            self._tracked_values.clear()
             return await self.client.flushdb()
         except Exception as e:
             logger.error(f"Error flushing cache database: {str(e)}")
@@ -202,7 +551,7 @@ class RedisCache:
         """Set a hash field."""
         await self.ensure_connected()
         try:
-            serialized = json.dumps(value)
+            serialized = _dumps(value)
             return await self.client.hset(name, key, serialized) >= 0
         except Exception as e:
             logger.error(f"Error setting hash field {name}:{key}: {str(e)}")
@@ -215,7 +564,7 @@ class RedisCache:
             value = await self.client.hget(name, key)
             if value is None:
                 return default
-            return json.loads(value)
+            return _loads(value)
         except Exception as e:
             logger.error(f"Error getting hash field {name}:{key}: {str(e)}")
             return default
@@ -225,7 +574,7 @@ class RedisCache:
         await self.ensure_connected()
         try:
             result = await self.client.hgetall(name)
-            return {k: json.loads(v) for k, v in result.items()}
+            return {k: _loads(v) for k, v in result.items()}
         except Exception as e:
             logger.error(f"Error getting all hash fields for {name}: {str(e)}")
             return {}
@@ -235,7 +584,7 @@ class RedisCache:
         """Push values to the head of a list."""
         await self.ensure_connected()
         try:
-            serialized = [json.dumps(v) for v in values]
+            serialized = [_dumps(v) for v in values]
             return await self.client.lpush(name, *serialized)
         except Exception as e:
             logger.error(f"Error pushing to list {name}: {str(e)}")
@@ -245,7 +594,7 @@ class RedisCache:
         """Push values to the tail of a list."""
         await self.ensure_connected()
         try:
-            serialized = [json.dumps(v) for v in values]
+            serialized = [_dumps(v) for v in values]
             return await self.client.rpush(name, *serialized)
         except Exception as e:
             logger.error(f"Error pushing to list {name}: {str(e)}")
@@ -256,15 +605,15 @@ class RedisCache:
         await self.ensure_connected()
         try:
             result = await self.client.lrange(name, start, end)
-            return [json.loads(item) for item in result]
+            return [_loads(item) for item in result]
         except Exception as e:
             logger.error(f"Error getting range from list {name}: {str(e)}")
             return []
 
     # Specialized methods for embeddings
-    async def store_embedding(self, key: str, embedding: List[float], ttl: Optional[int] = None) -> bool:
+    async def store_embedding(self, key: str, embedding: Any, ttl: Optional[int] = None) -> bool:
         """
-        Store an embedding vector.
+        Store an embedding vector as raw float32 bytes.
 
         Args:
             key: Embedding identifier
@@ -274,10 +623,19 @@ class RedisCache:
         Returns:
             bool: Success status
         """
-        cache_key = f"embedding:{key}"
-        return await self.set(cache_key, embedding, ttl)
+        await self.ensure_connected()
+        cache_key = f"{_EMBEDDING_PREFIX}{key}"
+        try:
+            raw = np.asarray(embedding, dtype=np.float32).tobytes()
+            self._embedding_lru[cache_key] = np.frombuffer(raw, dtype=np.float32)
+            self._note_own_write(cache_key)
+            return bool(await self.binary_client.set(cache_key, raw, ex=ttl))
+        except Exception as e:
+            self._forget_own_write(cache_key)
+            logger.error(f"Error storing embedding {cache_key}: {str(e)}")
+            return False
 
-    async def get_embedding(self, key: str) -> Optional[List[float]]:
+    async def get_embedding(self, key: str) -> Optional[np.ndarray]:
         """
         Retrieve an embedding vector.
 
@@ -285,10 +643,128 @@ class RedisCache:
             key: Embedding identifier
 
         Returns:
-            List[float]: The embedding vector or None if not found
+            np.ndarray: Read-only float32 view of the stored vector or None if not found
         """
-        cache_key = f"embedding:{key}"
-        return await self.get(cache_key)
+        cache_key = f"{_EMBEDDING_PREFIX}{key}"
+        self._embedding_lookups += 1
+        embedding = self._embedding_lru.get(cache_key)
+        if embedding is not None:
+            self._embedding_hits += 1
+            return embedding
+
+        lock = self._embedding_locks.get(cache_key)
+        if lock is None:
+            lock = self._embedding_locks[cache_key] = asyncio.Lock()
+
+        async with lock:
+            # Another waiter may have fetched it while we queued on the lock
+            embedding = self._embedding_lru.get(cache_key)
+            if embedding is not None:
+                return embedding
+
+            await self.ensure_connected()
+            try:
+                raw = await self.binary_client.get(cache_key)
+                if raw is None:
+                    return None
+                embedding = self._decode_embedding(cache_key, raw)
+            except Exception as e:
+                logger.error(f"Error getting embedding {cache_key}: {str(e)}")
+                return None
+
+            if embedding is not None:
+                self._embedding_lru[cache_key] = embedding
+            return embedding
+
+    async def store_embeddings(self, embeddings: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Store several embedding vectors in one round trip.
+
+        Args:
+            embeddings: Vectors by embedding identifier
+            ttl: Time-to-live in seconds
+
+        Returns:
+            bool: Success status
+        """
+        if not embeddings:
+            return True
+
+        await self.ensure_connected()
+        noted = []
+        try:
+            pipe = self.binary_client.pipeline(transaction=False)
+            for key, embedding in embeddings.items():
+                cache_key = f"{_EMBEDDING_PREFIX}{key}"
+                raw = np.asarray(embedding, dtype=np.float32).tobytes()
+                self._embedding_lru[cache_key] = np.frombuffer(raw, dtype=np.float32)
+                self._note_own_write(cache_key)
+                noted.append(cache_key)
+                pipe.set(cache_key, raw, ex=ttl)
+            return all(await pipe.execute())
+        except Exception as e:
+            for cache_key in noted:
+                self._forget_own_write(cache_key)
+            logger.error(f"Error storing {len(embeddings)} embeddings: {str(e)}")
+            return False
+
+    async def get_embeddings(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Retrieve several embedding vectors in one round trip.
+
+        Args:
+            keys: Embedding identifiers
+
+        Returns:
+            Read-only float32 vectors in the order of `keys`, None where not found
+        """
+        if not keys:
+            return []
+
+        cache_keys = [f"{_EMBEDDING_PREFIX}{key}" for key in keys]
+        results = [self._embedding_lru.get(cache_key) for cache_key in cache_keys]
+        missing = [i for i, embedding in enumerate(results) if embedding is None]
+        self._embedding_lookups += len(keys)
+        self._embedding_hits += len(keys) - len(missing)
+        if not missing:
+            return results
+
+        await self.ensure_connected()
+        try:
+            values = await self.binary_client.mget([cache_keys[i] for i in missing])
+            for i, raw in zip(missing, values):
+                if raw is None:
+                    continue
+                embedding = self._decode_embedding(cache_keys[i], raw)
+                if embedding is not None:
+                    results[i] = self._embedding_lru[cache_keys[i]] = embedding
+        except Exception as e:
+            logger.error(f"Error getting {len(missing)} embeddings: {str(e)}")
+        return results
+
+    def _decode_embedding(self, cache_key: str, raw: bytes) -> Optional[np.ndarray]:
+        """
+        Decode stored float32 bytes, treating a value of the wrong size as a miss.
+
+        Args:
+            cache_key: Key the value was read from, for logging
+            raw: Stored bytes
+
+        Returns:
+            np.ndarray: Read-only float32 view of the bytes, or None if they are not a valid vector
+        """
+        if not raw or len(raw) % _EMBEDDING_ITEMSIZE:
+            logger.warning(f"Ignoring cached embedding {cache_key}: {len(raw)} bytes is not a float32 vector")
+            return None
+
+        embedding = np.frombuffer(raw, dtype=np.float32)
+        if self.embedding_dimension is not None and embedding.shape[0] != self.embedding_dimension:
+            logger.warning(
+                f"Ignoring cached embedding {cache_key}: dimension {embedding.shape[0]}, "
+                f"expected {self.embedding_dimension}"
+            )
+            return None
+        return embedding
 
     async def store_query_results(self, query_hash: str, results: Any, ttl: int = 300) -> bool:
         """
@@ -1,15 +1,45 @@
 # app/infrastructure/cleaners/html_cleaner.py
+import html
 import re
 from .base_cleaner import BaseCleaner
 
+# Optional imports - install these packages if needed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Compiled once at import instead of looked up on every call
+_TAG_RE = re.compile(r'<[^>]*>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Elements whose content is never readable text
+_NON_TEXT_SELECTOR = "script, style, noscript"
+
 
 class HtmlCleaner(BaseCleaner):
     """
     Cleaner for HTML text content.
 
-    Handles HTML-specific patterns to extract clean text.
+    Handles HTML-specific patterns to extract clean text. When selectolax is
+    installed the markup is parsed with the Lexbor HTML parser, which drops
+    script/style content and copes with '>' inside attribute values;
+    otherwise tags are stripped with a regular expression.
     """
 
+    def __init__(self, use_parser: bool = True):
+        """
+        Initialize the cleaner.
+
+        Parameters
+        ----------
+        use_parser : bool, optional
+            Parse markup with selectolax when available; False forces the
+            legacy regex path (e.g. to compare outputs), by default True.
+        """
+        self.use_parser = use_parser and SELECTOLAX_AVAILABLE
+
     def clean(self, text: str) -> str:
         """
         Clean HTML text.
@@ -27,24 +57,34 @@ class HtmlCleaner(BaseCleaner):
         if not text:
             return ""
 
+        if self.use_parser:
+            text = self._parse_text(text)
+        else:
+            text = self._strip_tags(text)
+
+        # Remove excessive whitespace (newlines included)
+        text = _WHITESPACE_RE.sub(' ', text)
+
+        return text.strip()
+
+    @staticmethod
+    def _parse_text(text: str) -> str:
+        """
+        Extract readable text with the Lexbor parser; entities are decoded by the parser.
+        """
+        tree = LexborHTMLParser(text)
+        for node in tree.css(_NON_TEXT_SELECTOR):
+            node.decompose()
+        return tree.text(separator=' ')
+
+    @staticmethod
+    def _strip_tags(text: str) -> str:
+        """
+        Legacy regex path: remove tags, then decode entities.
+        """
         # Remove any remaining HTML tags
-        text = re.sub(r'<[^>]*>', ' ', text)
-
-        # Convert HTML entities to characters
-        html_entities = {
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&#39;': "'"
-        }
-        for entity, char in html_entities.items():
-            text = text.replace(entity, char)
-
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Clean up any other HTML-specific artifacts
-        text = text.replace('\n\n', '\n')
-
-        return text.strip()
\ No newline at end of file
+        text = _TAG_RE.sub(' ', text)
+
+        # Convert HTML entities to characters in a single pass; runs after tag
+        # removal so escaped markup such as "&lt;b&gt;" is kept as text
+        return html.unescape(text)
@@ -1,21 +1,101 @@
 # app/models/db_models.py
 import json
 import uuid
+from functools import lru_cache
 
 import user_agents
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, LargeBinary, Text, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, LargeBinary, Text, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.types import BINARY, CHAR, TypeDecorator
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from sqlalchemy.orm import deferred, relationship
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy.types import JSON
+
+from app.utils.ids import generate_uuid4_hex, generate_uuid7
 Base = declarative_base()
 
 
 def generate_uuid():
-    """Generate a unique UUID string."""
-    return str(uuid.uuid4())
+    """
+    Generate a unique 128-bit random ID as 32 hex characters.
+
+    Primary keys default to gen_random_uuid() on the server; use this only
+    when the ID is needed before the row is inserted, e.g. to reference it
+    from another row in the same batch.
+    """
+    return generate_uuid4_hex()
+
+
+@lru_cache(maxsize=4096)
+def _parse_user_agent(user_agent):
+    """
+    Parse a User-Agent string, memoized by the string itself.
+
+    user_agents runs a long list of regexes per parse, and a handful of
+    browsers account for most sessions, so repeated strings are served from
+    the cache.
+    """
+    return user_agents.parse(user_agent)
+
+
+def describe_user_agent(user_agent):
+    """
+    Split a User-Agent string into the device, browser and os columns of Session.
+
+    Parameters
+    ----------
+    user_agent : Optional[str]
+        Raw User-Agent header value.
+
+    Returns
+    -------
+    dict
+        Values for `device`, `browser` and `os`; all None when the agent is unknown.
+    """
+    if not user_agent:
+        return {"device": None, "browser": None, "os": None}
+    ua = _parse_user_agent(user_agent)
+    return {
+        "device": ua.device.family,
+        "browser": f"{ua.browser.family} {ua.browser.version_string}",
+        "os": f"{ua.os.family} {ua.os.version_string}",
+    }
+
+
+class GUID(TypeDecorator):
+    """
+    Platform-independent UUID column type.
+
+    Stored as a native 16-byte UUID on PostgreSQL and as BINARY(16) on other
+    dialects, so keys and the indexes on them are fixed-width instead of
+    36-character strings. IDs stay strings in Python: any UUID spelling
+    (dashed or 32 hex characters) is accepted on the way in, and values are
+    returned as 32 hex characters, the format of `generate_uuid`.
+    """
+    impl = CHAR
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(UUID(as_uuid=True))
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(value)
+        return value if dialect.name == "postgresql" else value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.hex
+        return bytes(value).hex()
 
 
 class User(Base):
@@ -25,7 +105,7 @@ class User(Base):
     Attributes
     ----------
     id : str
-        Unique identifier for the user (UUID).
+        Unique identifier for the user (time-ordered UUIDv7).
     username : str
         Unique username.
     email : str
@@ -46,7 +126,8 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    # Time-ordered so new users append to the primary key index
+    id = Column(GUID(), primary_key=True, default=generate_uuid7)
     username = Column(String, unique=True, nullable=False)
     email = Column(String, unique=True, nullable=False)
     hashed_password = Column(String, nullable=False)
@@ -60,7 +141,7 @@ class User(Base):
     files = relationship("File", back_populates="owner")
     documents = relationship("Document", back_populates="owner")
     sessions = relationship("Session", back_populates="user", cascade="all, delete-orphan")
-    tokens = relationship("Token", backref="user", cascade="all, delete-orphan")
+    tokens = relationship("Token", back_populates="user", cascade="all, delete-orphan")
     activities = relationship("UserActivity", back_populates="user", cascade="all, delete-orphan")
     # Add this relationship to User class
     themes = relationship("Theme", back_populates="owner", cascade="all, delete-orphan")
@@ -85,15 +166,20 @@ class UserActivity(Base):
         The user associated with this activity (relationship).
     """
     __tablename__ = "user_activities"
+    __table_args__ = (
+        # Activity feed of a user, newest first, without a sort
+        Index("ix_user_activities_user_id_timestamp", "user_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)  # Primary key for the activity
-    user_id = Column(String, ForeignKey("users.id"))  # Foreign key linking to the User table
+    user_id = Column(GUID(), ForeignKey("users.id"))  # Foreign key linking to the User table
     activity_type = Column(String(50), nullable=False)  # Type of activity (e.g., login, update)
     description = Column(Text, nullable=False)  # Detailed description of the activity
     timestamp = Column(DateTime, default=func.now())  # Timestamp of the activity
 
     # Relationships
-    user = relationship("User", back_populates="activities")  # Link to the User model
+    # Selectin: an activity feed holds one user, fetched by one IN query
+    user = relationship("User", back_populates="activities", lazy="selectin")  # Link to the User model
 
 class File(Base):
     """File storage model.
@@ -120,21 +206,29 @@ class File(Base):
         Timestamp when the file was last updated.
     """
     __tablename__ = "files"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
+    __table_args__ = (
+        # Files of an owner, optionally narrowed to one theme
+        Index("ix_files_owner_id_theme_id", "owner_id", "theme_id"),
+        # Theme listings and theme deletes
+        Index("ix_files_theme_id", "theme_id"),
+    )
+
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
     filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False, unique=True)  # Path in file system
     content_type = Column(String, nullable=False)
     size = Column(Integer, nullable=False)
     is_public = Column(Boolean, default=False)
-    owner_id = Column(String, ForeignKey("users.id"), nullable=False)
-    theme_id = Column(String, ForeignKey("themes.id"), nullable=False)
+    owner_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    # A file belongs to at most one theme
+    theme_id = Column(GUID(), ForeignKey("themes.id"), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    owner = relationship("User", back_populates="files")
-    themes = relationship("ThemeFile", back_populates="file", cascade="all, delete-orphan")
+    owner = relationship("User", back_populates="files", lazy="joined")
+    theme = relationship("Theme", back_populates="files")
+    documents = relationship("Document", back_populates="file")
 
 
 class Document(Base):
@@ -146,34 +240,60 @@ class Document(Base):
         Unique identifier for the document.
     content : str
         Content of the document.
-    embedding : bytes
-        Embedding of the document stored as binary.
+    embedding : list
+        Embedding of the document, stored in half precision.
     owner_id : str
         ID of the user who owns the document.
+    extra_metadata : dict
+        Metadata of the document as a JSONB object.
     created_at : datetime
         Timestamp when the document was created.
     updated_at : datetime
         Timestamp when the document was last updated.
     """
     __tablename__ = "documents"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
-    content = Column(Text, nullable=False)
-    embedding = Column(Vector(768)) # Store embedding as binary
-    file_id = Column(String, ForeignKey("files.id"), nullable=False)
-    owner_id = Column(String, ForeignKey("users.id"), nullable=False)
-    theme_id = Column(String, ForeignKey("themes.id"), nullable=False)
+    __table_args__ = (
+        # HNSW graph index so `embedding <=> :query` ORDER BY ... LIMIT uses ANN traversal
+        Index(
+            "ix_documents_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        # Per-user listings; PostgreSQL does not index foreign keys on its own
+        Index("ix_documents_owner_id", "owner_id"),
+        # Theme listings and theme deletes, optionally narrowed to one owner
+        Index("ix_documents_theme_id_owner_id", "theme_id", "owner_id"),
+        # Containment filters (`extra_metadata @> {...}`) on metadata
+        Index("ix_documents_extra_metadata_gin", "extra_metadata", postgresql_using="gin"),
+    )
+
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    # Heavy columns are deferred: listings, ownership checks and deletes skip them,
+    # reads that need them load them with undefer()
+    content = deferred(Column(Text, nullable=False))
+    # Half precision: half the bytes per vector read during HNSW traversal
+    embedding = deferred(Column(HALFVEC(768)))
+    file_id = Column(GUID(), ForeignKey("files.id"), nullable=False)
+    owner_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    # A document belongs to at most one theme
+    theme_id = Column(GUID(), ForeignKey("themes.id"), nullable=True)
+    # Metadata is read with the row itself, no join or per-key rows
+    extra_metadata = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    owner = relationship("User", back_populates="documents")
+    owner = relationship("User", back_populates="documents", lazy="joined")
+    # Legacy key/value rows, kept for rollback; scripts/migrate_document_metadata.py
+    # folds them into extra_metadata
     document_metadata = relationship("DocumentMetadata", back_populates="document", cascade="all, delete-orphan")
-    file = relationship("File", backref="documents", lazy="selectin")
-    theme = relationship("Theme", back_populates="direct_documents", lazy="selectin")
+    file = relationship("File", back_populates="documents", lazy="selectin")
+    theme = relationship("Theme", back_populates="documents", lazy="selectin")
 
 class DocumentMetadata(Base):
-    """Metadata for Document.
+    """Metadata for Document, superseded by `Document.extra_metadata`.
 
     Attributes
     ----------
@@ -187,9 +307,13 @@ class DocumentMetadata(Base):
         Value of the metadata.
     """
     __tablename__ = "document_metadata"
+    __table_args__ = (
+        # Serves both the per-document IN loads and key lookups within a document
+        Index("ix_document_metadata_document_id_key", "document_id", "key"),
+    )
 
-    id = Column(String, primary_key=True, default=generate_uuid)
-    document_id = Column(String, ForeignKey("documents.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    document_id = Column(GUID(), ForeignKey("documents.id"), nullable=False)
     key = Column(String, nullable=False)
     value = Column(String, nullable=False)
 
@@ -221,85 +345,21 @@ class Theme(Base):
     """
     __tablename__ = "themes"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     is_public = Column(Boolean, default=False)
-    owner_id = Column(String, ForeignKey("users.id"), nullable=False)
+    owner_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     owner = relationship("User", back_populates="themes")
-    documents = relationship("ThemeDocument", back_populates="theme", cascade="all, delete-orphan")
-    files = relationship("ThemeFile", back_populates="theme", cascade="all, delete-orphan", passive_deletes=True)
+    documents = relationship("Document", back_populates="theme")
+    files = relationship("File", back_populates="theme")
 
     shared_with = relationship("ThemeShare", back_populates="theme", cascade="all, delete-orphan")
     tasks = relationship("ProcessingTask", back_populates="theme", cascade="all, delete-orphan")
-    direct_documents = relationship("Document", back_populates="theme", lazy="selectin")
-
-
-# Junction table for theme-document relationship
-class ThemeDocument(Base):
-    """
-    Junction table linking themes to documents.
-
-    This table establishes a many-to-many relationship between themes and documents,
-    allowing a document to belong to multiple themes and a theme to contain multiple documents.
-
-    Attributes
-    ----------
-    theme_id : str
-        The ID of the theme to which the document is linked.
-    document_id : str
-        The ID of the document linked to the theme.
-    added_at : datetime
-        The timestamp when the document was added to the theme.
-    theme : Theme
-        The theme associated with this link (relationship).
-    document : Document
-        The document associated with this link (relationship).
-    """
-    __tablename__ = "theme_documents"
-
-    theme_id = Column(String, ForeignKey("themes.id"), primary_key=True)
-    document_id = Column(String, ForeignKey("documents.id"), primary_key=True)
-    added_at = Column(DateTime(timezone=True), server_default=func.now())
-
-    # Relationships
-    theme = relationship("Theme", back_populates="documents")
-    document = relationship("Document")
-
-
-class ThemeFile(Base):
-    """
-    Junction table linking themes to files.
-
-    This table establishes a many-to-many relationship between themes and files,
-    allowing a file to belong to multiple themes and a theme to contain multiple files.
-
-    Attributes
-    ----------
-    theme_id : str
-        The ID of the theme to which the file is linked.
-    file_id : str
-        The ID of the file linked to the theme.
-    added_at : datetime
-        The timestamp when the file was added to the theme.
-    theme : Theme
-        The theme associated with this link (relationship).
-    file : File
-        The file associated with this link (relationship).
-    """
-    __tablename__ = "theme_files"
-
-    theme_id = Column(String, ForeignKey("themes.id", ondelete="CASCADE"), primary_key=True)
-    file_id = Column(String, ForeignKey("files.id", ondelete="CASCADE"), primary_key=True)
-    added_at = Column(DateTime(timezone=True), server_default=func.now())
-
-    # Relationships
-    theme = relationship("Theme", back_populates="files")
-    file = relationship("File", back_populates="themes")
 
 
 class ThemeShare(Base):
@@ -330,18 +390,23 @@ class ThemeShare(Base):
         The user with whom the theme is shared (relationship).
     """
     __tablename__ = "theme_shares"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
-    theme_id = Column(String, ForeignKey("themes.id"), nullable=False)
-    shared_by = Column(String, ForeignKey("users.id"), nullable=False)
-    shared_with = Column(String, ForeignKey("users.id"), nullable=False)
+    __table_args__ = (
+        # Themes shared with a user
+        Index("ix_theme_shares_shared_with", "shared_with"),
+    )
+
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    theme_id = Column(GUID(), ForeignKey("themes.id"), nullable=False)
+    shared_by = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    shared_with = Column(GUID(), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     permission = Column(String, default="read")  # "read" or "edit"
 
     # Relationships
     theme = relationship("Theme", back_populates="shared_with")
-    owner = relationship("User", foreign_keys=[shared_by])
-    recipient = relationship("User", foreign_keys=[shared_with])
+    # Shares are always shown with both users, so they come in the same query
+    owner = relationship("User", foreign_keys=[shared_by], lazy="joined")
+    recipient = relationship("User", foreign_keys=[shared_with], lazy="joined")
 class Token(Base):
     """Token model for authentication.
 
@@ -349,8 +414,8 @@ class Token(Base):
     ----------
     id : str
         Unique identifier for the token.
-    token : str
-        The token string.
+    token_hash : bytes
+        BLAKE2b-256 digest of the token string; the token itself is not stored.
     user_id : str
         ID of the user to whom the token belongs.
     expires_at : datetime
@@ -359,14 +424,25 @@ class Token(Base):
         Timestamp when the token was created.
     """
     __tablename__ = "tokens"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
-    token = Column(String, unique=True, nullable=False, index=True)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    expires_at = Column(DateTime, nullable=False)
+    __table_args__ = (
+        # Valid tokens of a user: equality on user_id, range on expires_at
+        Index("ix_tokens_user_id_expires_at", "user_id", "expires_at"),
+        # Unrevoked tokens of a user; the predicate matches `is_revoked.is_(False)`
+        Index("ix_tokens_user_id_active", "user_id", postgresql_where=text("is_revoked IS false")),
+    )
+
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    # Replaced the plaintext token column; scripts/migrate_token_hashes.py converts existing rows
+    token_hash = Column(LargeBinary(32), unique=True, nullable=False, index=True)
+    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    # Indexed on its own for the periodic delete of expired tokens
+    expires_at = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     is_revoked = Column(Boolean, default=False)  # ✅ new column
 
+    # Relationships
+    user = relationship("User", back_populates="tokens")
+
 
 # Modify in app/infrastructure/database/db_models.py
 
@@ -377,10 +453,13 @@ class ProcessingTask(Base):
     Allows for task persistence across server restarts and user sessions.
     """
     __tablename__ = "processing_tasks"
+    __table_args__ = (
+        Index("ix_processing_tasks_user_id", "user_id"),
+    )
 
-    id = Column(String, primary_key=True, default=generate_uuid)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    theme_id = Column(String, ForeignKey("themes.id"), nullable=True)
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
+    theme_id = Column(GUID(), ForeignKey("themes.id"), nullable=True)
     task_type = Column(String, nullable=False)  # Using TaskType enum values
     description = Column(String, nullable=True)
     status = Column(String, nullable=False)  # Using TaskStatus enum values
@@ -389,50 +468,51 @@ class ProcessingTask(Base):
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     error_message = Column(Text, nullable=True)
-    logs = Column(Text, nullable=True)  # Serialized JSON list of log entries
-    task_metadata = Column(Text, nullable=True)  # Changed from 'metadata' to 'task_metadata'
-    steps = Column(Text, nullable=True)  # Serialized JSON array of steps
+    # JSONB: parsed by the driver once per row instead of json.loads per access
+    task_metadata = Column(JSONB, nullable=True)  # Changed from 'metadata' to 'task_metadata'
+    steps = Column(JSONB, nullable=True)  # Array of steps
     current_step = Column(Integer, default=0)
 
     # Relationships
     user = relationship("User", back_populates="tasks")
     theme = relationship("Theme", back_populates="tasks")
+    log_entries = relationship(
+        "ProcessingTaskLog",
+        back_populates="task",
+        order_by="ProcessingTaskLog.seq",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
-    @property
-    def logs_list(self):
-        """Deserialize logs from JSON string to list."""
-        if self.logs:
-            return json.loads(self.logs)
-        return []
 
-    @logs_list.setter
-    def logs_list(self, value):
-        """Serialize logs from list to JSON string."""
-        self.logs = json.dumps(value)
+class ProcessingTaskLog(Base):
+    """
+    Log entry of a processing task.
 
-    @property
-    def metadata_dict(self):
-        """Deserialize metadata from JSON string to dict."""
-        if self.task_metadata:  # Use task_metadata instead of metadata
-            return json.loads(self.task_metadata)
-        return {}
+    Entries are append-only rows keyed by (task_id, seq), so logging a line
+    inserts one row instead of rewriting the whole log of the task.
 
-    @metadata_dict.setter
-    def metadata_dict(self, value):
-        """Serialize metadata from dict to JSON string."""
-        self.task_metadata = json.dumps(value)  # Use task_metadata instead of metadata
+    Attributes
+    ----------
+    task_id : str
+        ID of the task the entry belongs to.
+    seq : int
+        Position of the entry in the task log, starting at 0.
+    message : str
+        Log message.
+    logged_at : datetime
+        Time the entry was written.
+    """
+    __tablename__ = "processing_task_logs"
 
-    @property
-    def steps_list(self):
-        """Deserialize steps from JSON string to list."""
-        if self.steps:
-            return json.loads(self.steps)
-        return []
+    task_id = Column(GUID(), ForeignKey("processing_tasks.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)
+    message = Column(Text, nullable=False)
+    logged_at = Column(DateTime, nullable=False)
 
-    @steps_list.setter
-    def steps_list(self, value):
-        """Serialize steps from list to JSON string."""
-        self.steps = json.dumps(value)
+    # Relationships
+    task = relationship("ProcessingTask", back_populates="log_entries")
 
 class Session(Base):
     """
@@ -441,9 +521,12 @@ class Session(Base):
     Tracks login sessions, expiration, client info, and CSRF token per session.
     """
     __tablename__ = "sessions"
+    __table_args__ = (
+        Index("ix_sessions_browser", "browser"),
+    )
 
     id = Column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     username = Column(String, nullable=False)
 
     csrf_token = Column(String, nullable=False)
@@ -456,30 +539,14 @@ class Session(Base):
     user_agent = Column(String, nullable=True)  # Browser / platform
     ip_address = Column(String, nullable=True)  # Source IP address
 
+    # Parsed from user_agent once, when the session is created
+    device = Column(String, nullable=True)
+    browser = Column(String, nullable=True)
+    os = Column(String, nullable=True)
+
     # Relationship
     user = relationship("User", back_populates="sessions")
 
-    @hybrid_property
-    def device(self):
-        if self.user_agent:
-            ua = user_agents.parse(self.user_agent)
-            return ua.device.family
-        return None
-
-    @hybrid_property
-    def browser(self):
-        if self.user_agent:
-            ua = user_agents.parse(self.user_agent)
-            return f"{ua.browser.family} {ua.browser.version_string}"
-        return None
-
-    @hybrid_property
-    def os(self):
-        if self.user_agent:
-            ua = user_agents.parse(self.user_agent)
-            return f"{ua.os.family} {ua.os.version_string}"
-        return None
-
     @hybrid_property
     def location(self):
         # Placeholder for IP-based geolocation lookup
@@ -522,13 +589,13 @@ class Conversation(Base):
     """
     __tablename__ = "conversations"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
     title = Column(String, nullable=False, default="New Conversation")
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
     is_active = Column(Boolean, default=True)
-    theme_id = Column(String, ForeignKey("themes.id"), nullable=True)
+    theme_id = Column(GUID(), ForeignKey("themes.id"), nullable=True)
     model_id = Column(String, nullable=True)  # ID of the AI model used
     conversation_metadata = Column(Text, nullable=True)  # Column stays
 
@@ -572,49 +639,30 @@ class Message(Base):
         Number of tokens in the message (for quota tracking).
     is_hidden : bool
         Flag indicating if the message should be hidden from UI.
-    references : str
-        JSON string containing document references used for this message.
-    metadata : str
-        JSON string containing additional message metadata.
+    references : list
+        Document references used for this message.
+    message_metadata : dict
+        Additional message metadata.
     """
     __tablename__ = "messages"
+    __table_args__ = (
+        # `WHERE conversation_id = ? ORDER BY created_at` reads the index in order
+        Index("ix_messages_conversation_id_created_at", "conversation_id", "created_at"),
+    )
 
-    id = Column(String, primary_key=True, default=generate_uuid)
-    conversation_id = Column(String, ForeignKey("conversations.id"), nullable=False)
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    conversation_id = Column(GUID(), ForeignKey("conversations.id"), nullable=False)
     role = Column(String, nullable=False)  # user, assistant, system
     content = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     tokens = Column(Integer, default=0)  # Track token usage
     is_hidden = Column(Boolean, default=False)  # For system messages or internal context
-    references = Column(Text, nullable=True)  # JSON string for document references
-    message_metadata = Column(Text, nullable=True)  # JSON string for additional metadata
+    references = Column(JSONB, nullable=True)  # Document references
+    message_metadata = Column(JSONB, nullable=True)  # Additional metadata
 
     # Relationships
-    conversation = relationship("Conversation", back_populates="messages")
-
-    @property
-    def references_list(self):
-        """Deserialize references from JSON string to list."""
-        if self.references:
-            return json.loads(self.references)
-        return []
-
-    @references_list.setter
-    def references_list(self, value):
-        """Serialize references from list to JSON string."""
-        self.references = json.dumps(value)
-
-    @property
-    def metadata_dict(self):
-        """Deserialize metadata from JSON string to dict."""
-        if self.message_metadata:
-            return json.loads(self.message_metadata)
-        return {}
-
-    @metadata_dict.setter
-    def metadata_dict(self, value):
-        """Serialize metadata from dict to JSON string."""
-        self.message_metadata = json.dumps(value)
+    # Selectin: the messages of a page share one conversation, fetched by one IN query
+    conversation = relationship("Conversation", back_populates="messages", lazy="selectin")
 
 
 class ConversationContext(Base):
@@ -634,40 +682,41 @@ class ConversationContext(Base):
         Type of context (embedding, summary, key_points, etc.).
     content : str
         Textual content of the context.
-    embedding : Vector
-        Vector embedding of the context for semantic search.
+    embedding : list
+        Half-precision embedding of the context for semantic search.
     created_at : datetime
         Timestamp when the context was created.
     updated_at : datetime
         Timestamp when the context was last updated.
     priority : int
         Priority level for this context (higher is more important).
-    metadata : str
-        JSON string containing additional context metadata.
+    conversation_metadata : dict
+        Additional context metadata.
     """
     __tablename__ = "conversation_contexts"
-
-    id = Column(String, primary_key=True, default=generate_uuid)
-    conversation_id = Column(String, ForeignKey("conversations.id"), nullable=False)
+    __table_args__ = (
+        # HNSW graph index so `embedding <=> :query` ORDER BY ... LIMIT uses ANN traversal
+        Index(
+            "ix_conversation_contexts_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
+        ),
+        # Contexts of one conversation, by priority; lets the planner pre-filter
+        # a conversation exactly when it holds too few rows for the graph to pay off
+        Index("ix_conversation_contexts_conversation_id_priority", "conversation_id", "priority"),
+    )
+
+    id = Column(GUID(), primary_key=True, server_default=text("gen_random_uuid()"))
+    conversation_id = Column(GUID(), ForeignKey("conversations.id"), nullable=False)
     context_type = Column(String, nullable=False)  # embedding, summary, key_points, etc.
     content = Column(Text, nullable=True)  # Can be null for pure embedding contexts
-    embedding = Column(Vector(768), nullable=True)  # Vector embedding for semantic search
+    embedding = Column(HALFVEC(768), nullable=True)  # Vector embedding for semantic search
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     priority = Column(Integer, default=1)  # Higher priority contexts are more important
-    conversation_metadata = Column(Text, nullable=True)  # JSON string for additional metadata
+    conversation_metadata = Column(JSONB, nullable=True)  # Additional metadata
 
     # Relationships
-    conversation = relationship("Conversation", back_populates="contexts")
-
-    @property
-    def metadata_dict(self):
-        """Deserialize metadata from JSON string to dict."""
-        if self.conversation_metadata:
-            return json.loads(self.conversation_metadata)
-        return {}
-
-    @metadata_dict.setter
-    def metadata_dict(self, value):
-        """Serialize metadata from dict to JSON string."""
-        self.conversation_metadata = json.dumps(value)
\ No newline at end of file
+    conversation = relationship("Conversation", back_populates="contexts", lazy="selectin")
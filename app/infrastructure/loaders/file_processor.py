@@ -1,5 +1,4 @@
 # app/infrastructure/loaders/file_processor.py
-import uuid
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +10,7 @@ from domain.entities.document import Document
 from domain.entities.processed_file import ProcessedFile
 from infrastructure.repositories.file_repository import FileRepository
 
+from utils.ids import generate_uuid4
 from utils.logger_util import get_logger
 from infrastructure.files.readers.reader_factory import ReaderFactory
 from infrastructure.cleaners.cleaner_factory import CleanerFactory
@@ -117,7 +117,7 @@ class FileProcessor:
                 logger.error(f"Failed to process {file_path}: {e}")
                 # Create a processed file record for the failure
                 failed_file = ProcessedFile(
-                    id=str(uuid.uuid4()),
+                    id=generate_uuid4(),
                     filename=file_path.name,
                     content="",
                     is_readable=False,
@@ -210,7 +210,7 @@ class FileProcessor:
 
         # Create processed file entity
         return ProcessedFile(
-            id=str(uuid.uuid4()),
+            id=generate_uuid4(),
             filename=file_path.name,
             content=content,
             language=language,
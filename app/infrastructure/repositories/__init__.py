@@ -1,5 +1,6 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload, sessionmaker
 from typing import AsyncGenerator
 
 from app.utils.logger_util import get_logger
@@ -22,6 +23,27 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
+if settings.DB_RAISELOAD:
+    @event.listens_for(Session, "do_orm_execute")
+    def _raiseload_unloaded_relationships(orm_execute_state: ORMExecuteState) -> None:
+        """
+        Make every ORM SELECT raise on access to relationships it did not load.
+
+        Relationships must then be loaded explicitly with selectinload() or
+        joinedload() on the query, so N+1 lazy loads fail in development and
+        tests instead of surfacing in production. Options given on the query
+        take precedence over the wildcard.
+        """
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+    logger.warning("DB_RAISELOAD is enabled: unloaded relationships raise on access")
+
+
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency that provides an async SQLAlchemy session.
@@ -3,6 +3,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
 from app.infrastructure.database.db_models import ConversationContext
+from app.infrastructure.repositories.vector_search import (
+    ef_search_for_rows, estimated_row_count, vector_search_scope
+)
 
 class ConversationContextRepository:
     """
@@ -162,8 +165,11 @@ class ConversationContextRepository:
         """
         Perform semantic search on context embeddings for a conversation.
 
-        This is a placeholder - actual implementation will depend on your database's
-        vector similarity search capabilities.
+        Orders by pgvector cosine distance, which the HNSW index on the
+        embedding column serves. The conversation filter is selective, so the
+        scan runs with iterative_scan="strict_order": the graph walk continues
+        until `limit` rows of the conversation are found, instead of returning
+        fewer rows or falling back to a sequential scan.
 
         Parameters
         ----------
@@ -173,5 +179,23 @@ class ConversationContextRepository:
             The embedding vector to compare against.
         limit : int, optional
             Limit the number of returned results (default is 5).
+
+        Returns
+        -------
+        List[ConversationContext]
+            Context entries closest to the query embedding, closest first.
         """
-        pass
+        ef_search = ef_search_for_rows(
+            await estimated_row_count(self.db_session, ConversationContext.__tablename__)
+        )
+        async with vector_search_scope(self.db_session, ef_search=ef_search, iterative_scan="strict_order"):
+            result = await self.db_session.execute(
+                select(ConversationContext)
+                .where(
+                    ConversationContext.conversation_id == conversation_id,
+                    ConversationContext.embedding.isnot(None)
+                )
+                .order_by(ConversationContext.embedding.cosine_distance(query_embedding))
+                .limit(limit)
+            )
+        return result.scalars().all()
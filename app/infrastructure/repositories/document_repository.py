@@ -1,12 +1,45 @@
-from typing import Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import Float, insert, select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.infrastructure.database.db_models import Document, ThemeDocument
+from sqlalchemy.orm import undefer
+from app.infrastructure.database.db_models import GUID, Document, generate_uuid
+from app.infrastructure.repositories.vector_search import (
+    ef_search_for_rows, estimated_row_count, vector_search_scope
+)
 from app.utils.logger_util import get_logger
 
 logger = get_logger(__name__)
 
+# Dimension of the pgvector embedding column, used for casts in raw SQL
+EMBEDDING_DIMENSION = Document.__table__.c.embedding.type.dim
+
+
+def _with_payload(stmt, content: bool = True, embedding: bool = True):
+    """Load the deferred content/embedding columns with the documents selected by `stmt`."""
+    if content:
+        stmt = stmt.options(undefer(Document.content))
+    if embedding:
+        stmt = stmt.options(undefer(Document.embedding))
+    return stmt
+
+
+def _filter_conditions(filter_criteria: Dict[str, Any]) -> List[Any]:
+    """
+    Translate column/value pairs into WHERE conditions; unknown columns are ignored.
+
+    A "metadata" dict matches documents whose metadata contains all its pairs,
+    served by the GIN index on `extra_metadata`.
+    """
+    conditions = []
+    for key, value in filter_criteria.items():
+        if key == "metadata":
+            conditions.append(Document.extra_metadata.contains(value))
+        elif key in Document.__table__.c:
+            conditions.append(getattr(Document, key) == value)
+    return conditions
+
+
 class DocumentRepository:
     """
     Repository class for managing document-related database operations.
@@ -26,7 +59,9 @@ class DocumentRepository:
         """
         self.db = db
 
-    async def get_by_id(self, document_id: str) -> Optional[Document]:
+    async def get_by_id(
+            self, document_id: str, with_content: bool = True, with_embedding: bool = True
+    ) -> Optional[Document]:
         """
         Retrieve a document by its unique ID.
 
@@ -34,6 +69,10 @@ class DocumentRepository:
         ----------
         document_id : str
             The unique identifier of the document.
+        with_content : bool
+            Load the document content.
+        with_embedding : bool
+            Load the document embedding.
 
         Returns
         -------
@@ -41,7 +80,7 @@ class DocumentRepository:
             The Document object if found, otherwise None.
         """
         result = await self.db.execute(
-            select(Document).where(Document.id == document_id)
+            _with_payload(select(Document).where(Document.id == document_id), with_content, with_embedding)
         )
         return result.scalar_one_or_none()
 
@@ -60,7 +99,7 @@ class DocumentRepository:
             A list of Document objects owned by the user.
         """
         result = await self.db.execute(
-            select(Document).where(Document.owner_id == owner_id)
+            _with_payload(select(Document).where(Document.owner_id == owner_id))
         )
         return result.scalars().all()
 
@@ -81,12 +120,49 @@ class DocumentRepository:
 
         if "content" not in kwargs:
             raise ValueError("'content' are required.")
+        if "metadata" in kwargs:
+            kwargs["extra_metadata"] = kwargs.pop("metadata") or {}
         doc = Document(**kwargs)
         self.db.add(doc)
         await self.db.commit()
         await self.db.refresh(doc)
         return doc.id
 
+    async def create_documents(self, documents: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create many document records in one transaction.
+
+        Rows are sent as batched multi-row INSERTs (one round trip per batch
+        rather than per document). IDs are assigned here, so no RETURNING is
+        needed to report them.
+
+        Parameters
+        ----------
+        documents : List[Dict[str, Any]]
+            One dict of Document model fields per document; "metadata" is
+            stored as the document metadata.
+
+        Returns
+        -------
+        List[str]
+            IDs of the created documents, in input order.
+        """
+        if not documents:
+            return []
+
+        rows = []
+        for fields in documents:
+            if "content" not in fields:
+                raise ValueError("'content' are required.")
+            row = dict(fields)
+            row.setdefault("id", generate_uuid())
+            row["extra_metadata"] = row.pop("metadata", None) or row.get("extra_metadata") or {}
+            rows.append(row)
+
+        await self.db.execute(insert(Document), rows)
+        await self.db.commit()
+        return [row["id"] for row in rows]
+
     async def delete_document(self, document_id: str) -> bool:
         """
         Delete a document and its metadata by ID.
@@ -101,7 +177,7 @@ class DocumentRepository:
         bool
             True if the document was deleted, False otherwise.
         """
-        doc = await self.get_by_id(document_id)
+        doc = await self.get_by_id(document_id, with_content=False, with_embedding=False)
         if not doc:
             logger.warning(f"Document not found: {document_id}")
             return False
@@ -126,37 +202,27 @@ class DocumentRepository:
             Documents linked to the specified file.
         """
         result = await self.db.execute(
-            select(Document).where(Document.file_id == file_id)
+            _with_payload(select(Document).where(Document.file_id == file_id))
         )
         return result.scalars().all()
 
-    async def get_all(self) -> List[Document]:
+    async def get_all(self, with_embedding: bool = True) -> List[Document]:
         """
         Retrieve all documents from the database.
 
+        Parameters
+        ----------
+        with_embedding : bool
+            Load the document embeddings.
+
         Returns
         -------
         List[Document]
             A list of all document entities.
         """
-        result = await self.db.execute(select(Document))
+        result = await self.db.execute(_with_payload(select(Document), embedding=with_embedding))
         return result.scalars().all()
 
-    async def create_theme_document_link(self, theme_id: str, document_id: str) -> None:
-        """
-        Create a link between a Theme and a Document in the ThemeDocument table.
-
-        Args:
-            theme_id: ID of the theme
-            document_id: ID of the document
-        """
-
-        theme_document = ThemeDocument(
-            theme_id=theme_id,
-            document_id=document_id
-        )
-        self.db.add(theme_document)
-        await  self.db.commit()
     async def delete_by_file_id(self, file_id: str) -> int:
         """
         Delete all documents linked to a file.
@@ -165,7 +231,10 @@ class DocumentRepository:
         -------
         int: Number of documents deleted.
         """
-        documents = await self.get_by_file_id(file_id)
+        result = await self.db.execute(
+            select(Document).where(Document.file_id == file_id)
+        )
+        documents = result.scalars().all()
         count = len(documents)
         for doc in documents:
             await self.db.delete(doc)
@@ -178,7 +247,7 @@ class DocumentRepository:
         Retrieve documents by a list of IDs.
         """
         result = await self.db.execute(
-            select(Document).where(Document.id.in_(ids))
+            _with_payload(select(Document).where(Document.id.in_(ids)))
         )
         return result.scalars().all()
 
@@ -186,26 +255,59 @@ class DocumentRepository:
         """
         Retrieve all documents, optionally filtered by owner.
         """
-        stmt = select(Document)
+        stmt = _with_payload(select(Document))
         if owner_id:
             stmt = stmt.where(Document.owner_id == owner_id)
 
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def iter_documents(
+            self,
+            filter_criteria: Optional[Dict[str, Any]] = None,
+            batch_size: int = 500
+    ) -> AsyncIterator[Document]:
+        """
+        Stream documents matching the filter criteria through a server-side cursor.
+
+        Parameters
+        ----------
+        filter_criteria : Optional[Dict[str, Any]]
+            Column/value pairs to match, plus an optional "metadata" dict matched
+            by containment; unknown columns are ignored.
+        batch_size : int
+            Number of rows fetched from the cursor per round trip.
+
+        Yields
+        ------
+        Document
+            Matching documents in ID order.
+        """
+        stmt = _with_payload(select(Document)).order_by(Document.id)
+
+        if filter_criteria:
+            conditions = _filter_conditions(filter_criteria)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
+
+        result = await self.db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+        async for document in result:
+            yield document
+
     async def update_document(
             self, document_id: str, content: str, embedding: List[float], metadata: Dict[str, Any]
     ) -> bool:
         """
         Update document fields.
         """
-        doc = await self.get_by_id(document_id)
+        # Every payload column is overwritten, so none is loaded
+        doc = await self.get_by_id(document_id, with_content=False, with_embedding=False)
         if not doc:
             return False
 
         doc.content = content
         doc.embedding = embedding
-        doc.metadata = metadata
+        doc.extra_metadata = metadata or {}
 
         await self.db.commit()
         return True
@@ -217,10 +319,7 @@ class DocumentRepository:
         stmt = select(func.count()).select_from(Document)
 
         if filter_criteria:
-            conditions = []
-            for key, value in filter_criteria.items():
-                if hasattr(Document, key):
-                    conditions.append(getattr(Document, key) == value)
+            conditions = _filter_conditions(filter_criteria)
             if conditions:
                 stmt = stmt.where(and_(*conditions))
 
@@ -232,7 +331,8 @@ class DocumentRepository:
             embedding: Optional[List[float]],
             limit: int = 10,
             owner_id: Optional[str] = None,
-            theme_id: Optional[str] = None
+            theme_id: Optional[str] = None,
+            ef_search: Optional[int] = None
     ) -> List[Document]:
         """
         Search for similar documents using a vector embedding.
@@ -250,6 +350,10 @@ class DocumentRepository:
             Filter results by owner ID
         theme_id : Optional[str]
             Filter results by theme ID
+        ef_search : Optional[int]
+            Size of the HNSW candidate list for this query. Higher values raise
+            recall at the cost of latency; None picks one from the size of the
+            documents table.
 
         Returns
         -------
@@ -259,7 +363,7 @@ class DocumentRepository:
         try:
             # If no embedding provided, return most recent documents
             if embedding is None:
-                query = select(Document).order_by(Document.created_at.desc())
+                query = _with_payload(select(Document)).order_by(Document.created_at.desc())
 
                 # Apply owner filter if provided
                 if owner_id:
@@ -267,10 +371,7 @@ class DocumentRepository:
 
                 # Apply theme filter if provided
                 if theme_id:
-                    query = query.join(
-                        ThemeDocument,
-                        Document.id == ThemeDocument.document_id
-                    ).where(ThemeDocument.theme_id == theme_id)
+                    query = query.where(Document.theme_id == theme_id)
 
                 query = query.limit(limit)
                 result = await self.db.execute(query)
@@ -278,28 +379,26 @@ class DocumentRepository:
 
             # For vector similarity search
             from sqlalchemy import text
-            from sqlalchemy.sql import column
-            import numpy as np
 
-            # Convert embedding to SQL-compatible array string
-            embedding_str = str(embedding).replace('[', '{').replace(']', '}')
+            # pgvector text literal: '[x1,x2,...]'
+            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
 
             # Build SQL query for vector similarity
-            # This uses PostgreSQL's vector operators with the pgvector extension
-            sql = """
-            SELECT d.*, 
-                   (d.embedding <=> :embedding) as similarity
+            # This uses PostgreSQL's vector operators with the pgvector extension,
+            # comparing halfvec to halfvec so the HNSW index serves the ORDER BY.
+            distance = f"(d.embedding <=> CAST(:embedding AS halfvec({EMBEDDING_DIMENSION})))"
+
+            sql = f"""
+            SELECT d.*,
+                   GREATEST(0.0, 1.0 - {distance}) as similarity
             FROM documents d
             """
 
             params = {"embedding": embedding_str, "limit": limit}
 
-            # Add theme join if needed
+            # Add theme filter if needed
             if theme_id:
-                sql += """
-                JOIN theme_documents td ON d.id = td.document_id
-                WHERE td.theme_id = :theme_id
-                """
+                sql += " WHERE d.theme_id = :theme_id"
                 params["theme_id"] = theme_id
 
                 # Add owner filter if provided with theme
@@ -311,25 +410,28 @@ class DocumentRepository:
                 sql += " WHERE d.owner_id = :owner_id"
                 params["owner_id"] = owner_id
 
-            # Order by similarity and limit results
-            sql += """
-            ORDER BY similarity ASC
+            # Order by raw distance (ascending) so the planner can use the HNSW index
+            sql += f"""
+            ORDER BY {distance} ASC
             LIMIT :limit
             """
 
-            result = await self.db.execute(text(sql), params)
-            documents = result.all()
-
-            # Attach similarity score to each document
-            for doc in documents:
-                # Access similarity from the query result
-                similarity_value = getattr(doc, 'similarity', None)
-                if similarity_value is not None:
-                    # Convert similarity to a score between 0-1 (lower distance = higher score)
-                    # pgvector <=> operator returns a distance, so we convert it to similarity
-                    doc.similarity = 1.0 - min(1.0, float(similarity_value))
-
-            return documents
+            if not ef_search:
+                ef_search = ef_search_for_rows(await estimated_row_count(self.db, Document.__tablename__))
+
+            # Type the key and vector columns so raw rows decode them as the ORM does
+            stmt = text(sql).columns(
+                id=GUID(), file_id=GUID(), owner_id=GUID(), theme_id=GUID(),
+                embedding=Document.__table__.c.embedding.type,
+                extra_metadata=Document.__table__.c.extra_metadata.type, similarity=Float()
+            )
+            # Filters are applied to the graph's candidates; iterative scans keep
+            # walking the graph until LIMIT rows pass them, in distance order
+            iterative_scan = "strict_order" if owner_id or theme_id else None
+            async with vector_search_scope(self.db, ef_search=ef_search, iterative_scan=iterative_scan):
+                result = await self.db.execute(stmt, params)
+            # Rows expose `similarity` (cosine similarity, 0-1) next to the document columns
+            return result.all()
 
         except Exception as e:
             logger.error(f"Error in search_similar: {str(e)}", exc_info=True)
@@ -350,16 +452,13 @@ class DocumentRepository:
         List[Document]
             Latest documents matching the filters
         """
-        query = select(Document).order_by(Document.created_at.desc())
+        query = _with_payload(select(Document)).order_by(Document.created_at.desc())
 
         if owner_id:
             query = query.where(Document.owner_id == owner_id)
 
         if theme_id:
-            query = query.join(
-                ThemeDocument,
-                Document.id == ThemeDocument.document_id
-            ).where(ThemeDocument.theme_id == theme_id)
+            query = query.where(Document.theme_id == theme_id)
 
         query = query.limit(limit)
         result = await self.db.execute(query)
@@ -3,7 +3,7 @@ from typing import Optional
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.infrastructure.database.db_models import File, ThemeFile, Document
+from app.infrastructure.database.db_models import File, Document
 from app.utils.logger_util import get_logger
 
 logger = get_logger(__name__)
@@ -66,32 +66,6 @@ class FileRepository:
         result = await self.db.execute(select(File).where(File.owner_id == owner_id))
         return result.scalars().all()
 
-    async def link_file_to_theme(self, file_id: str, theme_id: str) -> None:
-        """
-        Link a file to a theme by creating an association in the database.
-
-        Parameters
-        ----------
-        file_id : str
-            The unique identifier of the file to link.
-        theme_id : str
-            The unique identifier of the theme to link the file to.
-
-        Returns
-        -------
-        None
-
-        Notes
-        -----
-        This method creates a new record in the `ThemeFile` table to establish
-        the relationship between the file and the theme.
-        """
-        from app.infrastructure.database.db_models import ThemeFile
-
-        link = ThemeFile(file_id=file_id, theme_id=theme_id)
-        self.db.add(link)
-        await self.db.commit()
-
     async def create_file(
         self,
         filename: str,
@@ -144,7 +118,7 @@ class FileRepository:
 
     async def delete_file(self, file_id: str) -> bool:
         """
-        Delete a file and all related data: documents, theme links, and metadata.
+        Delete a file and all related data: documents and their metadata.
 
         Args:
             file_id (str): The ID of the file to delete.
@@ -154,17 +128,12 @@ class FileRepository:
         """
 
         try:
-            # 1. Delete Theme-File junctions
-            await self.db.execute(
-                delete(ThemeFile).where(ThemeFile.file_id == file_id)
-            )
-
-            # 2. Delete Documents linked to this file (will cascade delete their metadata)
+            # 1. Delete Documents linked to this file (will cascade delete their metadata)
             await self.db.execute(
                 delete(Document).where(Document.file_id == file_id)
             )
 
-            # 3. Delete the File itself
+            # 2. Delete the File itself
             await self.db.execute(
                 delete(File).where(File.id == file_id)
             )
@@ -6,7 +6,7 @@ from sqlalchemy import select, delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import and_
 
-from app.infrastructure.database.db_models import Session  # You'll need to create this model
+from app.infrastructure.database.db_models import Session, describe_user_agent
 from utils.logger_util import get_logger
 
 logger = get_logger(__name__)
@@ -78,6 +78,7 @@ class SessionRepository:
                 created_at=datetime.utcnow(),
                 user_agent=user_agent,
                 ip_address=ip_address,
+                **describe_user_agent(user_agent),
             )
             self.db.add(new_session)
             await self.db.commit()
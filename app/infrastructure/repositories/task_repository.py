@@ -1,13 +1,41 @@
+from datetime import datetime
 from typing import Optional, List, Dict, Any, Sequence
-import json
 
-from sqlalchemy import select, delete, update
+from sqlalchemy import func, select, delete, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database.db_models import ProcessingTask
+from app.infrastructure.database.db_models import ProcessingTask, ProcessingTaskLog
 from app.utils.logger_util import get_logger
 logger = get_logger(__name__)
 
+# Format of the `timestamp` field of task log entries
+LOG_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def log_entries(db_task: ProcessingTask) -> List[Dict[str, str]]:
+    """
+    Return the log of a task as `{"timestamp", "message"}` entries, oldest first.
+    """
+    return [
+        {"timestamp": entry.logged_at.strftime(LOG_TIMESTAMP_FORMAT), "message": entry.message}
+        for entry in db_task.log_entries
+    ]
+
+
+def _log_rows(logs: List[Dict[str, Any]], first_seq: int) -> List[Dict[str, Any]]:
+    """
+    Build processing_task_logs values for log entries numbered from `first_seq`.
+    """
+    return [
+        {
+            "seq": seq,
+            "message": entry["message"],
+            "logged_at": datetime.strptime(entry["timestamp"], LOG_TIMESTAMP_FORMAT),
+        }
+        for seq, entry in enumerate(logs, start=first_seq)
+    ]
+
 
 class TaskRepository:
     """
@@ -24,8 +52,11 @@ class TaskRepository:
         """
         Retrieve a task by its unique ID.
         """
+        # populate_existing: logs appended by update() reach a task already in the session
         result = await self.db.execute(
-            select(ProcessingTask).where(ProcessingTask.id == task_id)
+            select(ProcessingTask)
+            .where(ProcessingTask.id == task_id)
+            .execution_options(populate_existing=True)
         )
         return result.scalar_one_or_none()
 
@@ -66,9 +97,9 @@ class TaskRepository:
             started_at=task.started_at,
             completed_at=task.completed_at,
             error_message=task.error_message,
-            logs=json.dumps(task.logs),
-            task_metadata=json.dumps(task.metadata),
-            steps=json.dumps(task.steps),
+            log_entries=[ProcessingTaskLog(**row) for row in _log_rows(task.logs, 0)],
+            task_metadata=task.metadata,
+            steps=task.steps,
             current_step=task.current_step
         )
         self.db.add(db_task)
@@ -92,6 +123,9 @@ class TaskRepository:
     ) -> bool:
         """
         Update an existing task record in the DB by passing raw fields (no domain object).
+
+        `logs` is the full log of the task. Entries already stored are left
+        alone; only the ones after them are inserted, in one batch.
         """
         stmt = (
             update(ProcessingTask)
@@ -102,13 +136,23 @@ class TaskRepository:
                 started_at=started_at,
                 completed_at=completed_at,
                 error_message=error_message,
-                logs=json.dumps(logs),
-                task_metadata=json.dumps(task_metadata),
-                steps=json.dumps(steps),
+                task_metadata=task_metadata,
+                steps=steps,
                 current_step=current_step,
             )
         )
         result = await self.db.execute(stmt)
+        if result.rowcount > 0 and logs:
+            stored = await self.db.scalar(
+                select(func.coalesce(func.max(ProcessingTaskLog.seq) + 1, 0))
+                .where(ProcessingTaskLog.task_id == task_id)
+            )
+            if len(logs) > stored:
+                # A concurrent writer may have taken the same positions; its entries win
+                await self.db.execute(
+                    insert(ProcessingTaskLog).on_conflict_do_nothing(index_elements=["task_id", "seq"]),
+                    [{"task_id": task_id, **row} for row in _log_rows(logs[stored:], stored)]
+                )
         await self.db.commit()
         return result.rowcount > 0
 
@@ -4,12 +4,12 @@ from datetime import datetime
 from sqlalchemy import select, update, delete, and_, func  # ADDED func for counting
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, noload, selectinload
 
-from app.infrastructure.database.db_models import Theme, ThemeDocument, Document, ProcessingTask, ThemeShare
+from app.infrastructure.database.db_models import Theme, Document, ProcessingTask, ThemeShare
 from app.utils.logger_util import get_logger
 from domain.interfaces.theme_repository import ThemeRepositoryInterface
-from app.infrastructure.database.db_models import File, ThemeFile
+from app.infrastructure.database.db_models import File
 logger = get_logger(__name__)
 
 class ThemeRepository(ThemeRepositoryInterface):
@@ -94,7 +94,10 @@ class ThemeRepository(ThemeRepositoryInterface):
             List[Theme]: List of matching Theme objects.
         """
         try:
-            query = select(Theme).options(selectinload(Theme.documents))
+            # Only document IDs are needed (for counts); skip payload and relationships
+            query = select(Theme).options(
+                selectinload(Theme.documents).options(load_only(Document.id), noload("*"))
+            )
 
             if owner_id:
                 if include_public:
@@ -146,37 +149,27 @@ class ThemeRepository(ThemeRepositoryInterface):
             bool: True if deletion succeeded, False otherwise.
         """
         try:
-            # 1. Delete ThemeDocument links (many-to-many table)
-            await self.db.execute(
-                delete(ThemeDocument).where(ThemeDocument.theme_id == theme_id)
-            )
-
-            # 2. Delete Documents (because they depend on Files and Theme)
+            # 1. Delete Documents (because they depend on Files and Theme)
             await self.db.execute(
                 delete(Document).where(Document.theme_id == theme_id)
             )
 
-            # 3. Delete ThemeFile links (many-to-many table)
-            await self.db.execute(
-                delete(ThemeFile).where(ThemeFile.theme_id == theme_id)
-            )
-
-            # 4. Delete Files (now it's safe because no Documents depend on them)
+            # 2. Delete Files (now it's safe because no Documents depend on them)
             await self.db.execute(
                 delete(File).where(File.theme_id == theme_id)
             )
 
-            # 5. Delete Tasks (optional, not blocked but good cleanup)
+            # 3. Delete Tasks (optional, not blocked but good cleanup)
             await self.db.execute(
                 delete(ProcessingTask).where(ProcessingTask.theme_id == theme_id)
             )
 
-            # 6. Delete Shares (optional, not blocked but good cleanup)
+            # 4. Delete Shares (optional, not blocked but good cleanup)
             await self.db.execute(
                 delete(ThemeShare).where(ThemeShare.theme_id == theme_id)
             )
 
-            # 7. Finally delete the Theme
+            # 5. Finally delete the Theme
             result = await self.db.execute(
                 delete(Theme).where(Theme.id == theme_id)
             )
@@ -192,6 +185,8 @@ class ThemeRepository(ThemeRepositoryInterface):
         """
         Associate a document with a theme.
 
+        A document belongs to one theme, so this moves it from its current theme.
+
         Args:
             theme_id (str): ID of the theme.
             document_id (str): ID of the document to associate.
@@ -200,33 +195,13 @@ class ThemeRepository(ThemeRepositoryInterface):
             bool: True if successfully associated, False otherwise.
         """
         try:
-            # Verify document exists
             result = await self.db.execute(
-                select(Document).where(Document.id == document_id)
-            )
-            if not result.scalar_one_or_none():
-                return False
-
-            # Check if already associated
-            existing = await self.db.execute(
-                select(ThemeDocument).where(
-                    and_(
-                        ThemeDocument.theme_id == theme_id,
-                        ThemeDocument.document_id == document_id
-                    )
-                )
-            )
-            if existing.scalar_one_or_none():
-                return True
-
-            # Add new association
-            link = ThemeDocument(
-                theme_id=theme_id,
-                document_id=document_id
+                update(Document)
+                .where(Document.id == document_id)
+                .values(theme_id=theme_id)
             )
-            self.db.add(link)
             await self.db.commit()
-            return True
+            return result.rowcount > 0
         except SQLAlchemyError as e:
             logger.error(f"Error linking document {document_id} to theme {theme_id}: {e}")
             await self.db.rollback()
@@ -244,11 +219,10 @@ class ThemeRepository(ThemeRepositoryInterface):
             bool: True if disassociation succeeded, False otherwise.
         """
         try:
-            stmt = delete(ThemeDocument).where(
-                and_(
-                    ThemeDocument.theme_id == theme_id,
-                    ThemeDocument.document_id == document_id
-                )
+            stmt = (
+                update(Document)
+                .where(and_(Document.id == document_id, Document.theme_id == theme_id))
+                .values(theme_id=None)
             )
             result = await self.db.execute(stmt)
             await self.db.commit()
@@ -270,9 +244,7 @@ class ThemeRepository(ThemeRepositoryInterface):
         """
         try:
             result = await self.db.execute(
-                select(ThemeDocument.document_id).where(
-                    ThemeDocument.theme_id == theme_id
-                )
+                select(Document.id).where(Document.theme_id == theme_id)
             )
             return list(result.scalars())
         except SQLAlchemyError as e:
@@ -328,9 +300,7 @@ class ThemeRepository(ThemeRepositoryInterface):
         """
         try:
             result = await self.db.execute(
-                select(func.count(ThemeDocument.document_id)).where(
-                    ThemeDocument.theme_id == theme_id
-                )
+                select(func.count(Document.id)).where(Document.theme_id == theme_id)
             )
             return result.scalar_one_or_none() or 0
         except SQLAlchemyError as e:
@@ -341,6 +311,8 @@ class ThemeRepository(ThemeRepositoryInterface):
         """
         Associate a file with a theme.
 
+        A file belongs to one theme, so this moves it from its current theme.
+
         Args:
             theme_id (str): ID of the theme.
             file_id (str): ID of the file to associate.
@@ -350,33 +322,13 @@ class ThemeRepository(ThemeRepositoryInterface):
         """
 
         try:
-            # Verify file exists
             result = await self.db.execute(
-                select(File).where(File.id == file_id)
-            )
-            if not result.scalar_one_or_none():
-                return False
-
-            # Check if already associated
-            existing = await self.db.execute(
-                select(ThemeFile).where(
-                    and_(
-                        ThemeFile.theme_id == theme_id,
-                        ThemeFile.file_id == file_id
-                    )
-                )
+                update(File)
+                .where(File.id == file_id)
+                .values(theme_id=theme_id)
             )
-            if existing.scalar_one_or_none():
-                return True
-
-            # Add new association
-            link = ThemeFile(
-                theme_id=theme_id,
-                file_id=file_id
-            )
-            self.db.add(link)
             await self.db.commit()
-            return True
+            return result.rowcount > 0
         except SQLAlchemyError as e:
             logger.error(f"Error linking file {file_id} to theme {theme_id}: {e}")
             await self.db.rollback()
@@ -395,11 +347,10 @@ class ThemeRepository(ThemeRepositoryInterface):
         """
 
         try:
-            stmt = delete(ThemeFile).where(
-                and_(
-                    ThemeFile.theme_id == theme_id,
-                    ThemeFile.file_id == file_id
-                )
+            stmt = (
+                update(File)
+                .where(and_(File.id == file_id, File.theme_id == theme_id))
+                .values(theme_id=None)
             )
             result = await self.db.execute(stmt)
             await self.db.commit()
@@ -422,9 +373,7 @@ class ThemeRepository(ThemeRepositoryInterface):
 
         try:
             result = await self.db.execute(
-                select(File)
-                .join(ThemeFile, ThemeFile.file_id == File.id)
-                .where(ThemeFile.theme_id == theme_id)
+                select(File).where(File.theme_id == theme_id)
             )
             return list(result.scalars())
         except SQLAlchemyError as e:
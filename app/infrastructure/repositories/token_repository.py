@@ -1,16 +1,27 @@
 # app/infrastructure/database/repository/token_repository.py
+import hashlib
 import hmac
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from uuid import uuid4
 
 from app.infrastructure.database.db_models import Token
 from app.utils.logger_util import get_logger
 
 logger = get_logger(__name__)
 
+
+def _hash_token(token: str) -> bytes:
+    """
+    Digest a token for storage and lookup.
+
+    Tokens are stored and indexed as fixed 32-byte digests, so a database
+    dump does not expose usable tokens.
+    """
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=32).digest()
+
+
 class TokenRepository:
     """
     Repository class for managing token-related database operations.
@@ -51,8 +62,7 @@ class TokenRepository:
             The created token object.
         """
         db_token = Token(
-            id=str(uuid4()),
-            token=token,
+            token_hash=_hash_token(token),
             user_id=user_id,
             expires_at=expires_at
         )
@@ -78,7 +88,7 @@ class TokenRepository:
         """
         result = await self.db.execute(
             select(Token).where(
-                and_(Token.token == token, Token.user_id == user_id)
+                and_(Token.token_hash == _hash_token(token), Token.user_id == user_id)
             )
         )
         return result.scalar_one_or_none()
@@ -106,6 +116,30 @@ class TokenRepository:
             return True
         return False
 
+    async def clear_expired_tokens(self) -> int:
+        """
+        Delete all expired tokens from the database.
+
+        Returns
+        -------
+        int
+            The number of tokens deleted.
+        """
+        try:
+            stmt = delete(Token).where(Token.expires_at < datetime.utcnow())
+            result = await self.db.execute(stmt)
+            await self.db.commit()
+
+            deleted_count = result.rowcount
+            if deleted_count > 0:
+                logger.info(f"Cleared {deleted_count} expired tokens")
+
+            return deleted_count
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error clearing expired tokens: {e}")
+            return 0
+
     async def store_token(self, user_id: str, token: str, expires_at: datetime):
         """
         Store an access token in the database.
@@ -197,8 +231,7 @@ class TokenRepository:
         """
         try:
             db_token = Token(
-                id=str(uuid4()),
-                token=token,
+                token_hash=_hash_token(token),
                 user_id=user_id,
                 expires_at=expires_at,
                 token_type="reset"
@@ -231,7 +264,7 @@ class TokenRepository:
             result = await self.db.execute(
                 select(Token).where(
                     and_(
-                        Token.token == token,
+                        Token.token_hash == _hash_token(token),
                         Token.user_id == user_id,
                         Token.token_type == "reset",
                         Token.expires_at > datetime.utcnow(),
@@ -264,7 +297,7 @@ class TokenRepository:
             result = await self.db.execute(
                 select(Token).where(
                     and_(
-                        Token.token == token,
+                        Token.token_hash == _hash_token(token),
                         Token.user_id == user_id,
                     )
                 )
@@ -2,11 +2,11 @@
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from uuid import uuid4
 
 from starlette import status
 
 from app.infrastructure.database.db_models import User, Token
+from app.utils.ids import generate_uuid7
 from app.utils.security import get_password_hash, verify_password
 from app.utils.logger_util import get_logger
 
@@ -175,7 +175,7 @@ class UserRepository:
         """
         hashed_password = get_password_hash(password)
         user = User(
-            id=str(uuid4()),
+            id=generate_uuid7(),
             username=username,
             email=email,
             hashed_password=hashed_password,
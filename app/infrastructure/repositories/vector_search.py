@@ -0,0 +1,92 @@
+# app/infrastructure/repositories/vector_search.py
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.logger_util import get_logger
+
+logger = get_logger(__name__)
+
+# Values accepted by pgvector's hnsw.iterative_scan setting (pgvector >= 0.8)
+ITERATIVE_SCAN_MODES = ("off", "strict_order", "relaxed_order")
+
+# Planner row estimates per table; they only pick a tier, so minutes-old values do
+_ROW_ESTIMATES: TTLCache = TTLCache(maxsize=64, ttl=300)
+
+
+def ef_search_for_rows(row_count: int) -> int:
+    """
+    Pick an HNSW ef_search for a table of `row_count` rows.
+
+    Larger graphs need a longer candidate list to keep recall at the same
+    level: 40 (the pgvector default) below 100k rows, 100 below 1M, 200 above.
+    """
+    if row_count < 100_000:
+        return 40
+    if row_count < 1_000_000:
+        return 100
+    return 200
+
+
+async def estimated_row_count(session: AsyncSession, table_name: str) -> int:
+    """
+    Return the planner's row estimate for a table, without scanning it.
+    """
+    if table_name not in _ROW_ESTIMATES:
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name}
+        )
+        # reltuples is -1 for tables that were never analyzed
+        _ROW_ESTIMATES[table_name] = max(result.scalar() or 0, 0)
+    return _ROW_ESTIMATES[table_name]
+
+
+@asynccontextmanager
+async def vector_search_scope(
+        session: AsyncSession,
+        ef_search: Optional[int] = None,
+        iterative_scan: Optional[str] = None
+) -> AsyncIterator[AsyncSession]:
+    """
+    Set the HNSW search settings for the vector queries run inside the block.
+
+    The settings are applied with SET LOCAL, so they last until the end of the
+    current transaction and never leak to other users of the pooled connection.
+    Run the `ORDER BY embedding <=> ... LIMIT k` query inside the block.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Session whose transaction runs the vector query.
+    ef_search : Optional[int]
+        Size of the HNSW candidate list; None keeps the server setting.
+    iterative_scan : Optional[str]
+        One of ITERATIVE_SCAN_MODES. Lets filtered queries keep scanning the
+        graph until LIMIT rows pass the filter. Ignored on pgvector versions
+        without the setting.
+
+    Yields
+    ------
+    AsyncSession
+        The same session.
+    """
+    # SET does not take bind parameters, so values are validated and inlined
+    if ef_search:
+        await session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+
+    if iterative_scan:
+        if iterative_scan not in ITERATIVE_SCAN_MODES:
+            raise ValueError(f"iterative_scan must be one of {ITERATIVE_SCAN_MODES}, got {iterative_scan!r}")
+        try:
+            # A savepoint keeps the transaction usable if the setting is unknown
+            async with session.begin_nested():
+                await session.execute(text(f"SET LOCAL hnsw.iterative_scan = '{iterative_scan}'"))
+        except DBAPIError as e:
+            logger.debug(f"hnsw.iterative_scan is not supported by this pgvector version: {e}")
+
+    yield session
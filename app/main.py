@@ -6,6 +6,7 @@ middlewares, error handlers, templates, and static files.
 It also provides an entry point to run the app using Uvicorn.
 """
 
+import asyncio
 import os
 from fastapi import FastAPI, APIRouter, Request, HTTPException, Depends
 from fastapi.responses import HTMLResponse
@@ -23,7 +24,9 @@ from api.websockets.task_updates import handle_task_websocket
 from app.config import settings
 from app.api.middlewares import setup_middlewares
 from application.services.auth_service import AuthService
-from infrastructure.repositories import get_async_db
+from infrastructure.repositories import AsyncSessionLocal, get_async_db
+from infrastructure.repositories.session_repository import SessionRepository
+from infrastructure.repositories.token_repository import TokenRepository
 from utils.logger_util import get_logger
 from utils.security import COOKIE_NAME
 
@@ -96,6 +99,38 @@ async def root(request: Request, db: AsyncSession = Depends(get_async_db)):
         logger.error(f"Error in root redirect: {e}")
         return RedirectResponse(url="/auth/login", status_code=HTTP_302_FOUND)
 
+async def clear_expired_auth_records():
+    """
+    Periodically delete expired tokens and sessions.
+
+    Keeps the token and session tables, and the indexes authentication
+    lookups walk, limited to live rows.
+    """
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await TokenRepository(db).clear_expired_tokens()
+                await SessionRepository(db).clear_expired_sessions()
+        except Exception as e:
+            logger.error(f"Error clearing expired auth records: {e}")
+        await asyncio.sleep(settings.EXPIRED_AUTH_CLEANUP_INTERVAL)
+
+
+@app.on_event("startup")
+async def start_expired_auth_cleanup():
+    """Start the cleanup of expired tokens and sessions."""
+    if settings.EXPIRED_AUTH_CLEANUP_INTERVAL > 0:
+        app.state.expired_auth_cleanup = asyncio.create_task(clear_expired_auth_records())
+
+
+@app.on_event("shutdown")
+async def stop_expired_auth_cleanup():
+    """Stop the cleanup of expired tokens and sessions."""
+    task = getattr(app.state, "expired_auth_cleanup", None)
+    if task:
+        task.cancel()
+
+
 @app.get("/health", include_in_schema=False)
 async def health_check():
     """
@@ -1,7 +1,10 @@
 # app/modules/auth/security.py
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Callable
 
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
@@ -17,6 +20,11 @@ logger = get_logger(__name__)
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Claims of recently verified tokens, shared by all JWTAuth instances (services
+# are built per request). Keyed by a digest so full tokens are not kept around;
+# entries also expire with the token itself.
+_VERIFIED_CLAIMS: TTLCache = TTLCache(maxsize=8192, ttl=60)
+
 
 class JWTAuth(AuthInterface):
     """
@@ -111,17 +119,36 @@ class JWTAuth(AuthInterface):
         """
         Verify and decode a JWT token.
 
+        Successful verifications are cached for up to a minute (never past
+        the token's expiry), so repeated requests with the same token skip
+        the signature check. Invalid tokens are never cached.
+
         Args:
             token (str): The JWT token.
 
         Returns:
             Optional[Dict[str, Any]]: Token payload if valid, None otherwise
         """
-        return jwt_decode(
+        cache_key = (
+            self.secret_key,
+            self.algorithm,
+            hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest(),
+        )
+        payload = _VERIFIED_CLAIMS.get(cache_key)
+        if payload is not None:
+            if payload.get("exp") is None or payload["exp"] > time.time():
+                return dict(payload)
+            _VERIFIED_CLAIMS.pop(cache_key, None)
+
+        payload = jwt_decode(
             token=token,
             secret_key=self.secret_key,
             algorithms=[self.algorithm]
         )
+        if payload is not None:
+            _VERIFIED_CLAIMS[cache_key] = payload
+            payload = dict(payload)
+        return payload
 
     async def get_current_user(
             self,
@@ -1,8 +1,8 @@
 # app/modules/embedding/cached_embedding.py
-from typing import List
+from typing import List, Optional
 import hashlib
 from domain.entities.document import Document
-from domain.interfaces.embedding import EmbeddingInterface
+from domain.interfaces.embedding import EmbeddingInterface, EmbeddingMatrix, EmbeddingVector
 from app.infrastructure.cache.redis_cache import RedisCache
 
 
@@ -32,16 +32,18 @@ class CachedEmbeddingService(EmbeddingInterface):
         self.cache_service = cache_service
         self.ttl = ttl
 
+    async def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> EmbeddingMatrix:
+        """Generate embeddings for a batch of texts with the wrapped service."""
+        return await self.embedding_service.embed_batch(texts, batch_size)
+
     async def embed_documents(self, documents: List[Document]) -> List[Document]:
         """Generate embeddings for documents, using cache when available."""
-        docs_to_embed = []
+        # Check cache for all documents in one round trip
+        cached_embeddings = await self.cache_service.get_embeddings([doc.id for doc in documents])
 
-        # Check cache for each document
-        for doc in documents:
-            cache_key = f"embedding:{doc.id}"
-            cached_embedding = await self.cache_service.get(cache_key)
-
-            if cached_embedding:
+        docs_to_embed = []
+        for doc, cached_embedding in zip(documents, cached_embeddings):
+            if cached_embedding is not None:
                 doc.embedding = cached_embedding
             else:
                 docs_to_embed.append(doc)
@@ -51,27 +53,27 @@ class CachedEmbeddingService(EmbeddingInterface):
             await self.embedding_service.embed_documents(docs_to_embed)
 
             # Store new embeddings in cache
-            for doc in docs_to_embed:
-                cache_key = f"embedding:{doc.id}"
-                await self.cache_service.set(cache_key, doc.embedding, ttl=self.ttl)
+            await self.cache_service.store_embeddings(
+                {doc.id: doc.embedding for doc in docs_to_embed}, ttl=self.ttl
+            )
 
         return documents
 
-    async def embed_query(self, query: str) -> List[float]:
+    async def embed_query(self, query: str) -> EmbeddingVector:
         """Generate embedding for a query, using cache when available."""
         # Create a cache key based on query content
         query_hash = hashlib.md5(query.encode()).hexdigest()
-        cache_key = f"query_embedding:{query_hash}"
+        cache_key = f"query:{query_hash}"
 
         # Check cache
-        cached_embedding = await self.cache_service.get(cache_key)
-        if cached_embedding:
+        cached_embedding = await self.cache_service.get_embedding(cache_key)
+        if cached_embedding is not None:
             return cached_embedding
 
         # Generate new embedding if not in cache
         embedding = await self.embedding_service.embed_query(query)
 
         # Store in cache
-        await self.cache_service.set(cache_key, embedding, ttl=self.ttl)
+        await self.cache_service.store_embedding(cache_key, embedding, ttl=self.ttl)
 
         return embedding
\ No newline at end of file
@@ -1,10 +1,12 @@
 # app/modules/embedding/instructor.py
-from typing import List
+from typing import List, Optional
 import os
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from application.services.base_embedding_service import BaseEmbeddingService
+from domain.interfaces.embedding import EmbeddingMatrix, EmbeddingVector
 from utils.logger_util import get_logger
 
 logger = get_logger(__name__)
@@ -57,42 +59,35 @@ class InstructorEmbedding(BaseEmbeddingService):
         self.model.set_pooling_include_prompt(False)
         logger.info(f"✅ INSTRUCTOR model initialized successfully")
 
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> EmbeddingMatrix:
         """
         Generate embeddings for a list of text inputs.
 
         Args:
             texts: List of text strings to embed
+            batch_size: Texts per forward pass, defaults to `self.batch_size`
 
         Returns:
-            List of embedding vectors for the input texts
+            Float32 matrix with one embedding row per input text
         """
         if not texts:
-            return []
+            return np.empty((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
 
-        results = []
-        # Process in batches
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i:i + self.batch_size]
-
-            try:
-                # Create instruction pairs for each text in the batch
-                instruction_pairs = [[self.instruction, text] for text in batch]
-
-                # Generate embeddings
-                batch_embeddings = self.model.encode(instruction_pairs)
-
-                # Convert numpy arrays to lists
-                batch_embeddings = [emb.tolist() for emb in batch_embeddings]
-                results.extend(batch_embeddings)
-
-            except Exception as e:
-                logger.error(f"Error generating INSTRUCTOR embeddings: {str(e)}")
-                raise
+        try:
+            # Create instruction pairs for each text; the model batches internally
+            instruction_pairs = [[self.instruction, text] for text in texts]
+            embeddings = self.model.encode(
+                instruction_pairs,
+                batch_size=batch_size or self.batch_size,
+                convert_to_numpy=True
+            )
+            return embeddings.astype(np.float32, copy=False)
 
-        return results
+        except Exception as e:
+            logger.error(f"Error generating INSTRUCTOR embeddings: {str(e)}")
+            raise
 
-    async def embed_query(self, query: str) -> List[float]:
+    async def embed_query(self, query: str) -> EmbeddingVector:
         """
         Generate an embedding for a query string using the INSTRUCTOR model.
 
@@ -100,36 +95,15 @@ class InstructorEmbedding(BaseEmbeddingService):
             query: The query string to be embedded
 
         Returns:
-            List of floats representing the embedding of the query
+            Float32 embedding vector of the query
         """
         # Create instruction pair for the query
         instruction_pair = [[self.query_instruction, query]]
 
         try:
             # Generate embedding
-            embedding = self.model.encode(instruction_pair)
-            return embedding[0].tolist()
+            embedding = self.model.encode(instruction_pair, convert_to_numpy=True)
+            return embedding[0].astype(np.float32, copy=False)
         except Exception as e:
             logger.error(f"Error generating query embedding: {str(e)}")
             raise
-
-    async def embed_text(self, text: str) -> List[float]:
-        """
-        Generate an embedding for a text string using the INSTRUCTOR model.
-
-        Args:
-            text: The text string to be embedded
-
-        Returns:
-            List of floats representing the embedding of the text
-        """
-        # Create instruction pair for the text
-        instruction_pair = [[self.instruction, text]]
-
-        try:
-            # Generate embedding
-            embedding = self.model.encode(instruction_pair)
-            return embedding[0].tolist()
-        except Exception as e:
-            logger.error(f"Error generating text embedding: {str(e)}")
-            raise
\ No newline at end of file
@@ -1,9 +1,11 @@
 # app/modules/embedding/onnx.py
 import os
-from typing import List
+from typing import List, Optional
+import numpy as np
 import openai
 
 from application.services.base_embedding_service import BaseEmbeddingService
+from domain.interfaces.embedding import EmbeddingMatrix
 from utils.logger_util import get_logger
 
 logger = get_logger(__name__)
@@ -41,23 +43,25 @@ class OpenAIEmbedding(BaseEmbeddingService):
         openai.api_key = self.api_key
         logger.info(f"Initialized OpenAI embedding with model: {model_name}")
 
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> EmbeddingMatrix:
         """
         Generate embeddings for a list of texts using OpenAI's API.
 
         Args:
             texts: List of text strings to embed
+            batch_size: Texts per API call, defaults to `self.batch_size`
 
         Returns:
-            List of embedding vectors (as lists of floats)
+            Float32 matrix with one embedding row per input text
         """
         if not texts:
-            return []
+            return np.empty((0, 0), dtype=np.float32)
 
+        batch_size = batch_size or self.batch_size
         results = []
         # Process in batches to avoid API limits
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i:i + self.batch_size]
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
 
             try:
                 # Call the OpenAI API
@@ -74,23 +78,4 @@ class OpenAIEmbedding(BaseEmbeddingService):
                 logger.error(f"Error generating OpenAI embeddings: {str(e)}")
                 raise
 
-        return results
-
-    async def embed_text(self, text: str) -> List[float]:
-        """
-        Generate an embedding for a text string using OpenAI's API.
-
-        Implementation optimized for single text input.
-
-        Args:
-            text: The text string to be embedded
-
-        Returns:
-            List of floats representing the embedding of the text
-        """
-        response = await openai.Embedding.acreate(
-            model=self.model_name,
-            input=text
-        )
-
-        return response["data"][0]["embedding"]
\ No newline at end of file
+        return np.asarray(results, dtype=np.float32)
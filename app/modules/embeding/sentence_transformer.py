@@ -1,8 +1,10 @@
 # app/modules/embedding/sentence_transformer.py
-from typing import List
+from typing import List, Optional
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from application.services.base_embedding_service import BaseEmbeddingService
+from domain.interfaces.embedding import EmbeddingMatrix
 from utils.logger_util import get_logger
 
 logger = get_logger(__name__)
@@ -33,49 +35,29 @@ class SentenceTransformerEmbedding(BaseEmbeddingService):
         self.model = SentenceTransformer(model_name)
         logger.info(f"SentenceTransformer model loaded successfully")
 
-    async def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def embed_batch(self, texts: List[str], batch_size: Optional[int] = None) -> EmbeddingMatrix:
         """
         Generate embeddings for a list of text inputs.
 
         Args:
             texts: List of text strings to embed
+            batch_size: Texts per forward pass, defaults to `self.batch_size`
 
         Returns:
-            List of embedding vectors for the input texts
+            Float32 matrix with one embedding row per input text
         """
         if not texts:
-            return []
+            return np.empty((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
 
         try:
-            # Process in batches
-            results = []
-            for i in range(0, len(texts), self.batch_size):
-                batch = texts[i:i + self.batch_size]
-
-                # Generate embeddings
-                batch_embeddings = self.model.encode(batch)
-
-                # Convert numpy arrays to lists
-                batch_embeddings = [emb.tolist() for emb in batch_embeddings]
-                results.extend(batch_embeddings)
-
-            return results
+            # A single encode call; the model batches internally
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size or self.batch_size,
+                convert_to_numpy=True
+            )
+            return embeddings.astype(np.float32, copy=False)
 
         except Exception as e:
             logger.error(f"Error generating SentenceTransformer embeddings: {str(e)}")
             raise
-
-    async def embed_text(self, text: str) -> List[float]:
-        """
-        Generate an embedding for a text string.
-
-        Implementation optimized for single text input.
-
-        Args:
-            text: The text string to be embedded
-
-        Returns:
-            List of floats representing the embedding of the text
-        """
-        embedding = self.model.encode(text)
-        return embedding.tolist()
\ No newline at end of file
@@ -2,6 +2,7 @@ import os
 import pickle
 from typing import List, Dict, Any
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 from chromadb.api import Collection
 from domain.entities.document import Document
@@ -100,6 +101,42 @@ class ChromaVectorIndex(IndexInterface):
         for doc in docs_with_embeddings:
             self.documents[doc.id] = doc
 
+    async def add_vectors_from_ndarray(self, matrix: np.ndarray, document_ids: List[str],
+                                       contents: List[str] = None, metadata: List[Dict] = None) -> None:
+        """
+        Add a float32 matrix directly to the Chroma collection with document information.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            C-contiguous float32 embedding matrix of shape (n, d)
+        document_ids : List[str]
+            List of document IDs corresponding to the rows
+        contents : List[str], optional
+            List of document contents
+        metadata : List[Dict], optional
+            List of metadata dictionaries for each document
+        """
+        self._check_matrix(matrix)
+        if len(matrix) == 0:
+            return
+
+        ids = list(document_ids[:len(matrix)])
+        contents = [contents[i] if contents and i < len(contents) else "" for i in range(len(ids))]
+        metadatas = [metadata[i] if metadata and i < len(metadata) else {} for i in range(len(ids))]
+
+        # The Chroma client only accepts nested lists
+        self.collection.add(
+            ids=ids,
+            embeddings=matrix.tolist(),
+            metadatas=metadatas,
+            documents=contents
+        )
+
+        # Update local cache, keeping row views of the matrix as embeddings
+        for doc_id, row, content, meta in zip(ids, matrix, contents, metadatas):
+            self.documents[doc_id] = Document(id=doc_id, content=content, metadata=meta, embedding=row)
+
     async def search(self, query_embedding: List[float], k: int = 5) -> List[Dict[str, Any]]:
         """
         Search the collection for documents similar to the query embedding.
@@ -120,36 +157,70 @@ class ChromaVectorIndex(IndexInterface):
         if len(self.documents) == 0:
             return []
 
+        results = await self.search_batch(np.asarray([query_embedding], dtype=np.float32), k)
+        return results[0]
+
+    async def search_batch(self, query_matrix: np.ndarray, k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Search the collection for every query in a matrix with a single Chroma call.
+
+        Parameters
+        ----------
+        query_matrix : np.ndarray
+            Query embeddings of shape (nq, d).
+        k : int, optional
+            The number of top similar documents to return per query (default is 5).
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            One result list per query row, in the same order.
+        """
+        query_matrix = np.asarray(query_matrix, dtype=np.float32).reshape(-1, self.embedding_dimension)
+        if len(self.documents) == 0:
+            return [[] for _ in range(len(query_matrix))]
+
         # Execute similarity search in Chroma
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_matrix.tolist(),
             n_results=k
         )
 
-        # Process results (Chroma returns lists of IDs, metadata, distances, etc.)
-        matched_ids = results["ids"][0]
-        matched_metadatas = results["metadatas"][0]
-        matched_docs = results["documents"][0]
-        distances = results["distances"][0]  # By default, this is Euclidean distance
-
-        search_results = []
-        for i, doc_id in enumerate(matched_ids):
-            # Convert Euclidean distance to a rough similarity (1 - normalized distance)
-            dist = float(distances[i])
-            score = 1.0 - dist / 2.0
-
-            # Retrieve from local cache if needed
-            doc_obj = self.documents.get(doc_id)
-            content = matched_docs[i] if doc_obj is None else doc_obj.content
-
-            search_results.append({
-                "id": doc_id,
-                "content": content,
-                "metadata": matched_metadatas[i],
-                "score": score
-            })
-
-        return search_results
+        # Process results (Chroma returns one list of IDs, metadata, distances, etc. per query)
+        batch_results = []
+        for matched_ids, matched_metadatas, matched_docs, distances in zip(
+                results["ids"], results["metadatas"], results["documents"], results["distances"]
+        ):
+            search_results = []
+            for i, doc_id in enumerate(matched_ids):
+                # Convert Euclidean distance to a rough similarity (1 - normalized distance)
+                dist = float(distances[i])
+                score = 1.0 - dist / 2.0
+
+                # Retrieve from local cache if needed
+                doc_obj = self.documents.get(doc_id)
+                content = matched_docs[i] if doc_obj is None else doc_obj.content
+
+                search_results.append({
+                    "id": doc_id,
+                    "content": content,
+                    "metadata": matched_metadatas[i],
+                    "score": score
+                })
+            batch_results.append(search_results)
+
+        return batch_results
+
+    async def train(self, training_matrix: np.ndarray) -> None:
+        """
+        No-op: Chroma builds and trains its index internally.
+
+        Parameters
+        ----------
+        training_matrix : np.ndarray
+            Training vectors of shape (n, d), ignored.
+        """
+        return None
 
     async def delete_document(self, doc_id: str) -> None:
         """
@@ -2,7 +2,8 @@ import os
 import pickle
 import numpy as np
 import faiss
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from application.services.micro_batcher import MicroBatcher
 from domain.entities.document import Document
 from domain.interfaces.indexing import IndexInterface
 
@@ -11,12 +12,24 @@ class FaissVectorIndex(IndexInterface):
     """
     Implementation of a FAISS vector index for similarity search.
 
-    This class implements the IndexInterface using a FAISS Flat index (L2 distance).
+    This class implements the IndexInterface using a FAISS Flat index (L2 distance),
+    optionally storing compressed codes instead of raw float vectors:
+
+    - ``sq8``: 8-bit scalar quantization (4x smaller)
+    - ``pq``: IVF with product quantization, ``pq_subvectors`` codes of ``pq_bits`` each
+    - ``binary``: one sign bit per dimension, searched by Hamming distance (32x smaller)
+
+    Quantized indexes are trained once `min_training_points` vectors have
+    been added (at least ``max(nlist, 2 ** pq_bits)`` for ``pq``), unless
+    `train` is called beforehand with a representative sample. Until then the
+    vectors are buffered and searched exactly.
 
     Attributes
     ----------
     dimension : int
         The dimension of the vectors to be indexed.
+    quantization : str
+        The vector compression scheme ("none", "sq8", "pq" or "binary").
     index : faiss.Index
         The FAISS index object.
     documents : Dict[str, Document]
@@ -29,7 +42,15 @@ class FaissVectorIndex(IndexInterface):
         A running counter for assigning indices to documents.
     """
 
-    def __init__(self, dimension: int = 1536):
+    def __init__(
+            self,
+            dimension: int = 1536,
+            quantization: str = "none",
+            pq_subvectors: int = 16,
+            pq_bits: int = 8,
+            nlist: int = 1024,
+            min_training_points: int = 1000
+    ):
         """
         Initialize the FAISS index.
 
@@ -37,13 +58,98 @@ class FaissVectorIndex(IndexInterface):
         ----------
         dimension : int
             The dimension of the vectors to be indexed (default is 1536).
+        quantization : str, optional
+            Vector compression: "none", "sq8", "pq" or "binary" (default is "none").
+        pq_subvectors : int, optional
+            Number of PQ sub-quantizers; must divide `dimension` (default is 16).
+        pq_bits : int, optional
+            Bits per PQ code (default is 8).
+        nlist : int, optional
+            Number of IVF lists for the PQ index (default is 1024).
+        min_training_points : int, optional
+            Vectors to buffer before training the sq8 or pq quantizer on them;
+            pq also needs at least `nlist` and ``2 ** pq_bits`` (default is 1000).
         """
         self.dimension = dimension
-        self.index = faiss.IndexFlatL2(self.dimension)
+        self.quantization = quantization
+        self.index = self._create_index(dimension, quantization, pq_subvectors, pq_bits, nlist)
+        # A quantizer trained on a few vectors clips or misassigns every later one.
+        # IVF also needs a point per list and PQ one per centroid of each sub-quantizer
+        if quantization == "pq":
+            min_training_points = max(min_training_points, nlist, 2 ** pq_bits)
+        self.min_training_points = min_training_points
+        # Vectors added before the index is trained, in insertion order
+        self._untrained: List[np.ndarray] = []
         self.documents: Dict[str, Document] = {}
         self.id_to_index: Dict[str, int] = {}
         self.index_to_id: Dict[int, str] = {}
         self.current_index = 0
+        # Concurrent single-query searches are stacked into one FAISS call
+        self._search_batcher = MicroBatcher(self._search_pending, max_batch_size=64, max_wait_ms=5)
+
+    @staticmethod
+    def _create_index(dimension: int, quantization: str, pq_subvectors: int, pq_bits: int, nlist: int):
+        """
+        Build the FAISS index for the configured quantization scheme.
+        """
+        if quantization == "none":
+            return faiss.IndexFlatL2(dimension)
+        if quantization == "sq8":
+            return faiss.index_factory(dimension, "SQ8")
+        if quantization == "pq":
+            return faiss.index_factory(dimension, f"IVF{nlist},PQ{pq_subvectors}x{pq_bits}")
+        if quantization == "binary":
+            if dimension % 8:
+                raise ValueError(f"Binary quantization needs a dimension divisible by 8, got {dimension}")
+            return faiss.IndexBinaryFlat(dimension)
+        raise ValueError(f"Unsupported quantization: {quantization}")
+
+    def _encode(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Convert float32 vectors to the representation the index stores.
+        """
+        if self.quantization == "binary":
+            # One bit per dimension: the sign of each component
+            return np.packbits(matrix > 0, axis=1)
+        return matrix
+
+    async def train(self, training_matrix: np.ndarray) -> None:
+        """
+        Train the quantizer on a representative sample of vectors.
+
+        A no-op for the flat and binary indexes, which need no training.
+
+        Parameters
+        ----------
+        training_matrix : np.ndarray
+            Training vectors of shape (n, d).
+        """
+        if self.index.is_trained:
+            return
+
+        self.index.train(np.ascontiguousarray(training_matrix, dtype=np.float32))
+
+        # Vectors buffered while untrained keep their positions
+        if self._untrained:
+            untrained, self._untrained = np.concatenate(self._untrained), []
+            self.index.add(self._encode(untrained))
+
+    @property
+    def _untrained_count(self) -> int:
+        """Number of vectors buffered until the index is trained."""
+        return sum(len(matrix) for matrix in self._untrained)
+
+    async def _add_to_index(self, embeddings: np.ndarray) -> None:
+        """
+        Add a float32 matrix to the index, buffering it until there are enough vectors to train on.
+        """
+        if self.index.is_trained:
+            self.index.add(self._encode(embeddings))
+            return
+
+        self._untrained.append(embeddings)
+        if self._untrained_count >= self.min_training_points:
+            await self.train(np.concatenate(self._untrained))
 
     async def add_documents(self, documents: List[Document]) -> None:
         """
@@ -62,7 +168,7 @@ class FaissVectorIndex(IndexInterface):
         embeddings = np.array([doc.embedding for doc in docs_with_embeddings], dtype=np.float32)
 
         # Add to FAISS index
-        self.index.add(embeddings)
+        await self._add_to_index(embeddings)
 
         # Update local cache and mappings
         for doc in docs_with_embeddings:
@@ -75,6 +181,8 @@ class FaissVectorIndex(IndexInterface):
         """
         Search the FAISS index for similar documents.
 
+        Concurrent calls are coalesced into a single batched search.
+
         Parameters
         ----------
         query_embedding : List[float]
@@ -87,28 +195,79 @@ class FaissVectorIndex(IndexInterface):
         List[Dict[str, Any]]
             A list of dictionaries with document IDs, content, metadata, and similarity scores.
         """
-        if self.index.ntotal == 0:
+        if self.index.ntotal == 0 and not self._untrained:
             return []
 
-        # Convert query to float32
-        query_np = np.array([query_embedding], dtype=np.float32)
+        return await self._search_batcher.submit((query_embedding, k))
+
+    async def search_batch(self, query_matrix: np.ndarray, k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Search the FAISS index for every query in a matrix with one index call.
 
-        distances, indices = self.index.search(query_np, min(k, self.index.ntotal))
+        Parameters
+        ----------
+        query_matrix : np.ndarray
+            Query embeddings of shape (nq, d).
+        k : int, optional
+            The number of top similar documents to return per query (default is 5).
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            One result list per query row, in the same order.
+        """
+        queries = np.ascontiguousarray(query_matrix, dtype=np.float32).reshape(-1, self.dimension)
+        if self._untrained:
+            distances, indices = self._search_untrained(queries, k)
+        elif self.index.ntotal == 0:
+            return [[] for _ in range(len(queries))]
+        else:
+            distances, indices = self.index.search(self._encode(queries), min(k, self.index.ntotal))
+
+        # Convert distances to a rough similarity
+        if self.quantization == "binary":
+            scores = 1.0 - distances / self.dimension
+        else:
+            scores = 1.0 - distances / 2.0
+
+        return [self._build_results(row_scores, row_indices)
+                for row_scores, row_indices in zip(scores, indices)]
+
+    def _search_untrained(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact squared L2 search over the vectors buffered before training.
+        """
+        vectors = np.concatenate(self._untrained)
+        distances = (
+                (queries ** 2).sum(axis=1)[:, None]
+                - 2.0 * queries @ vectors.T
+                + (vectors ** 2).sum(axis=1)[None, :]
+        )
+        indices = np.argsort(distances, axis=1)[:, :min(k, len(vectors))]
+        return np.take_along_axis(distances, indices, axis=1), indices
+
+    async def _search_pending(self, requests: List[Tuple[List[float], int]]) -> List[List[Dict[str, Any]]]:
+        """
+        Run the searches queued by `search` as one batch at the largest requested k.
+        """
+        query_matrix = np.vstack([np.asarray(query, dtype=np.float32) for query, _ in requests])
+        batch_results = await self.search_batch(query_matrix, max(k for _, k in requests))
+        return [results[:k] for results, (_, k) in zip(batch_results, requests)]
 
-        # Build results
+    def _build_results(self, scores: np.ndarray, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Map one row of FAISS scores and indices to result dictionaries.
+        """
         results = []
-        for dist, idx in zip(distances[0], indices[0]):
+        for score, idx in zip(scores, indices):
             doc_id = self.index_to_id.get(int(idx))
             if doc_id and doc_id in self.documents:
-                # Convert L2 distance to a rough similarity
-                score = 1.0 - float(dist) / 2.0
-
                 doc = self.documents[doc_id]
                 results.append({
                     "id": doc_id,
                     "content": doc.content,
                     "metadata": doc.metadata,
-                    "score": score
+                    "score": float(score)
                 })
 
         return results
@@ -145,7 +304,10 @@ class FaissVectorIndex(IndexInterface):
             The file path where the index should be saved.
         """
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        faiss.write_index(self.index, f"{path}.index")
+        if self.quantization == "binary":
+            faiss.write_index_binary(self.index, f"{path}.index")
+        else:
+            faiss.write_index(self.index, f"{path}.index")
 
         # Save the local mappings
         with open(f"{path}.mappings", "wb") as f:
@@ -153,7 +315,8 @@ class FaissVectorIndex(IndexInterface):
                 "documents": self.documents,
                 "id_to_index": self.id_to_index,
                 "index_to_id": self.index_to_id,
-                "current_index": self.current_index
+                "current_index": self.current_index,
+                "untrained": self._untrained
             }, f)
 
     async def load_index(self, path: str) -> None:
@@ -165,7 +328,10 @@ class FaissVectorIndex(IndexInterface):
         path : str
             The file path from where the index should be loaded.
         """
-        self.index = faiss.read_index(f"{path}.index")
+        if self.quantization == "binary":
+            self.index = faiss.read_index_binary(f"{path}.index")
+        else:
+            self.index = faiss.read_index(f"{path}.index")
 
         # Load local mappings
         with open(f"{path}.mappings", "rb") as f:
@@ -174,34 +340,36 @@ class FaissVectorIndex(IndexInterface):
             self.id_to_index = data["id_to_index"]
             self.index_to_id = data["index_to_id"]
             self.current_index = data["current_index"]
+            self._untrained = data.get("untrained", [])
 
-    async def add_vectors(self, vectors: List[List[float]], document_ids: List[str],
-                          contents: List[str] = None, metadata: List[Dict] = None) -> None:
+    async def add_vectors_from_ndarray(self, matrix: np.ndarray, document_ids: List[str],
+                                       contents: List[str] = None, metadata: List[Dict] = None) -> None:
         """
-        Add vectors directly to the index with associated document information.
+        Add a float32 matrix directly to the index with associated document information.
+
+        The matrix is handed to FAISS as is, and each stored Document keeps a
+        row view of it as its embedding, so the vectors are never copied.
 
         Parameters
         ----------
-        vectors : List[List[float]]
-            List of embedding vectors to add to the index
+        matrix : np.ndarray
+            C-contiguous float32 embedding matrix of shape (n, d)
         document_ids : List[str]
-            List of document IDs corresponding to the vectors
+            List of document IDs corresponding to the rows
         contents : List[str], optional
             List of document contents
         metadata : List[Dict], optional
             List of metadata dictionaries for each document
         """
-        if not vectors or len(vectors) == 0:
+        self._check_matrix(matrix)
+        if len(matrix) == 0:
             return
 
-        # Convert to float32 np array
-        embeddings = np.array(vectors, dtype=np.float32)
-
         # Add to FAISS index
-        self.index.add(embeddings)
+        await self._add_to_index(matrix)
 
         # Create and store Document objects
-        for i, (vec, doc_id) in enumerate(zip(vectors, document_ids)):
+        for i, (row, doc_id) in enumerate(zip(matrix, document_ids)):
             content = contents[i] if contents and i < len(contents) else ""
             meta = metadata[i] if metadata and i < len(metadata) else {}
 
@@ -209,10 +377,10 @@ class FaissVectorIndex(IndexInterface):
                 id=doc_id,
                 content=content,
                 metadata=meta,
-                embedding=vec
+                embedding=row
             )
 
             self.documents[doc_id] = doc
             self.id_to_index[doc_id] = self.current_index
             self.index_to_id[self.current_index] = doc_id
-            self.current_index += 1
\ No newline at end of file
+            self.current_index += 1
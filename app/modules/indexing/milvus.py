@@ -1,6 +1,7 @@
 from typing import List, Dict, Any
 import os
 import pickle
+import numpy as np
 from pymilvus import (
     connections,
     utility,
@@ -125,6 +126,41 @@ class MilvusVectorIndex(IndexInterface):
         # Flush to ensure data is persisted
         self.collection.flush()
 
+    async def add_vectors_from_ndarray(self, matrix: np.ndarray, document_ids: List[str],
+                                       contents: List[str] = None, metadata: List[Dict] = None) -> None:
+        """
+        Add a float32 matrix directly to the collection with document information.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            C-contiguous float32 embedding matrix of shape (n, d)
+        document_ids : List[str]
+            List of document IDs corresponding to the rows
+        contents : List[str], optional
+            List of document contents
+        metadata : List[Dict], optional
+            List of metadata dictionaries for each document
+        """
+        self._check_matrix(matrix)
+        if len(matrix) == 0:
+            return
+
+        ids = list(document_ids[:len(matrix)])
+        metadatas = [metadata[i] if metadata and i < len(metadata) else {} for i in range(len(ids))]
+
+        # Rows are passed as views of the matrix; pymilvus serializes them directly
+        rows = list(matrix[:len(ids)])
+        self.collection.insert([ids, rows, metadatas])
+
+        # Cache documents
+        for i, (doc_id, row, meta) in enumerate(zip(ids, rows, metadatas)):
+            content = contents[i] if contents and i < len(contents) else ""
+            self.documents[doc_id] = Document(id=doc_id, content=content, metadata=meta, embedding=row)
+
+        # Flush to ensure data is persisted
+        self.collection.flush()
+
     async def search(self, query_embedding: List[float], k: int = 5) -> List[Dict[str, Any]]:
         """
         Search for documents similar to the query embedding.
@@ -141,6 +177,27 @@ class MilvusVectorIndex(IndexInterface):
         List[Dict[str, Any]]
             A list of dictionaries containing the IDs, content, metadata, and scores of similar documents.
         """
+        results = await self.search_batch(np.asarray([query_embedding], dtype=np.float32), k)
+        return results[0]
+
+    async def search_batch(self, query_matrix: np.ndarray, k: int = 5) -> List[List[Dict[str, Any]]]:
+        """
+        Search for every query in a matrix with a single Milvus request.
+
+        Parameters
+        ----------
+        query_matrix : np.ndarray
+            Query embeddings of shape (nq, d).
+        k : int, optional
+            The number of top similar documents to return per query (default is 5).
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            One result list per query row, in the same order.
+        """
+        query_matrix = np.asarray(query_matrix, dtype=np.float32).reshape(-1, self.dimension)
+
         # Load collection into memory for searching
         self.collection.load()
 
@@ -149,15 +206,16 @@ class MilvusVectorIndex(IndexInterface):
 
         # Execute search
         results = self.collection.search(
-            data=[query_embedding],
+            data=query_matrix.tolist(),
             anns_field="embedding",
             param=search_params,
             limit=k,
             output_fields=["id", "metadata"]
         )
 
-        search_results = []
+        batch_results = []
         for hits in results:
+            search_results = []
             for hit in hits:
                 doc_id = hit.entity.get("id")
                 doc = self.documents.get(doc_id)
@@ -171,11 +229,23 @@ class MilvusVectorIndex(IndexInterface):
                         "metadata": doc.metadata,
                         "score": score
                     })
+            batch_results.append(search_results)
 
         # Release collection from memory if desired
         self.collection.release()
 
-        return search_results
+        return batch_results
+
+    async def train(self, training_matrix: np.ndarray) -> None:
+        """
+        No-op: Milvus builds and trains its index internally.
+
+        Parameters
+        ----------
+        training_matrix : np.ndarray
+            Training vectors of shape (n, d), ignored.
+        """
+        return None
 
     async def delete_document(self, doc_id: str) -> None:
         """
@@ -1,6 +1,7 @@
 # app/modules/llm/base.py
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional
 
 from domain.interfaces.llm import LLMInterface
 from app.utils.logger_util import get_logger
@@ -74,6 +75,21 @@ class BaseLLM(LLMInterface, ABC):
         """
         pass
 
+    @staticmethod
+    async def _iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """
+        Consume a blocking iterator from a worker thread, one item at a time.
+
+        Lets synchronous token streams (llama.cpp, transformers streamers) feed
+        an async generator without blocking the event loop between tokens.
+        """
+        sentinel = object()
+        while True:
+            item = await asyncio.to_thread(next, iterator, sentinel)
+            if item is sentinel:
+                return
+            yield item
+
     def estimate_tokens(self, text: str) -> int:
         """
         Estimate the number of tokens in the provided text.
@@ -1,6 +1,6 @@
 # app/modules/llm/gguf.py
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 
 from app.modules.llm.base import BaseLLM
 from app.utils.logger_util import get_logger
@@ -91,6 +91,35 @@ class GGUFLLM(BaseLLM):
             logger.error(f"Error generating text with GGUF model {self.model_name}: {str(e)}")
             return {"text": f"Error: {str(e)}", "error": str(e)}
 
+    async def stream(
+            self,
+            prompt: str,
+            max_tokens: int = 1024,
+            temperature: float = 0.7,
+            top_p: float = 0.9,
+            stop_sequences: Optional[List[str]] = None,
+            **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text from the GGUF model as llama.cpp decodes it."""
+        if self.model is None:
+            raise RuntimeError("GGUF Model not loaded properly")
+
+        params = {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "stream": True
+        }
+        if stop_sequences:
+            params["stop"] = stop_sequences
+
+        # llama.cpp's streaming call is lazy; each chunk is decoded on a worker thread
+        completion = self.model(prompt, **params)
+        async for chunk in self._iterate_in_thread(iter(completion)):
+            text = chunk["choices"][0]["text"]
+            if text:
+                yield text
+
     def estimate_tokens(self, text: str) -> int:
         """Estimate tokens for GGUF models."""
         if self.model and hasattr(self.model, "tokenize"):
@@ -1,7 +1,8 @@
 # app/modules/llm/huggingface.py
+import asyncio
 import os
 import torch
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional
 
 from app.modules.llm.base import BaseLLM
 from app.utils.logger_util import get_logger
@@ -116,6 +117,43 @@ class HuggingFaceLLM(BaseLLM):
             logger.error(f"Error generating text with HuggingFace model {self.model_name}: {str(e)}")
             return {"text": f"Error: {str(e)}", "error": str(e)}
 
+    async def stream(
+            self,
+            prompt: str,
+            max_tokens: int = 1024,
+            temperature: float = 0.7,
+            top_p: float = 0.9,
+            stop_sequences: Optional[List[str]] = None,
+            **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream text from the HuggingFace model as it is generated."""
+        from transformers import TextIteratorStreamer
+
+        if self.pipeline is None:
+            raise RuntimeError("HuggingFace pipeline not properly initialized")
+
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        gen_kwargs = {
+            "max_new_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "do_sample": temperature > 0,
+            "pad_token_id": self.tokenizer.eos_token_id,
+            "num_return_sequences": 1,
+            "streamer": streamer,
+        }
+        if stop_sequences:
+            gen_kwargs["stopping_criteria"] = self._create_stopping_criteria(stop_sequences, prompt)
+
+        # Generation runs on a worker thread and pushes decoded text into the streamer
+        generation = asyncio.create_task(asyncio.to_thread(self.pipeline, prompt, **gen_kwargs))
+        try:
+            async for text in self._iterate_in_thread(iter(streamer)):
+                if text:
+                    yield text
+        finally:
+            await generation
+
     def _create_stopping_criteria(self, stop_sequences: List[str], prompt: str):
         """Create stopping criteria for the generation based on stop sequences."""
         from transformers.generation.stopping_criteria import StoppingCriteriaList, StoppingCriteria
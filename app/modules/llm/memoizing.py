@@ -0,0 +1,94 @@
+# app/modules/llm/memoizing.py
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from domain.interfaces.llm import LLMInterface
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.utils.logger_util import get_logger
+
+logger = get_logger(__name__)
+
+
+class MemoizingLLM(LLMInterface):
+    """
+    Cache wrapper for LLM handlers that memoizes deterministic generations.
+
+    Results of `generate` are stored in Redis under a hash of the prompt and
+    every generation parameter. Only greedy calls (temperature 0) are cached:
+    sampled outputs are meant to differ between calls and always reach the
+    model. Error results are never cached, and a failing cache falls back
+    to the model. Any other attribute is read from the wrapped handler.
+    """
+
+    def __init__(self, llm: LLMInterface, cache_service: RedisCache, ttl: int = 86400):
+        """
+        Initialize with the underlying LLM handler and cache.
+
+        Args:
+            llm: The LLM handler to wrap
+            cache_service: Redis cache for storing generations
+            ttl: Time-to-live for cached generations in seconds
+        """
+        self.llm = llm
+        self.cache_service = cache_service
+        self.ttl = ttl
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes missing on the wrapper (model_name, estimate_tokens, ...)
+        return getattr(self.__dict__["llm"], name)
+
+    @staticmethod
+    def _cache_key(prompt: str, params: Dict[str, Any]) -> str:
+        """Build the cache key from the prompt and generation parameters."""
+        payload = json.dumps([prompt, params], sort_keys=True, default=str, ensure_ascii=False)
+        return f"llm:{hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()}"
+
+    async def generate(
+            self,
+            prompt: str,
+            max_tokens: int = 1024,
+            temperature: float = 0.7,
+            top_p: float = 0.9,
+            stop_sequences: Optional[List[str]] = None,
+            **kwargs
+    ) -> Dict[str, Any]:
+        """Generate text with the wrapped handler, using the cache for greedy calls."""
+        params = dict(
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stop_sequences=stop_sequences,
+            **kwargs
+        )
+        if temperature:
+            return await self.llm.generate(prompt, **params)
+
+        params["model"] = getattr(self.llm, "model_name", None)
+        cache_key = self._cache_key(prompt, params)
+        # The cache is an optimization; if Redis is unreachable, ask the model
+        try:
+            cached = await self.cache_service.get(cache_key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed for {cache_key}: {str(e)}")
+            cached = None
+        if cached is not None:
+            logger.debug(f"LLM cache hit: {cache_key}")
+            return cached
+
+        del params["model"]
+        result = await self.llm.generate(prompt, **params)
+        # Handlers report failures in the result; those must be retried, not replayed
+        if isinstance(result, dict) and "error" in result:
+            return result
+
+        try:
+            await self.cache_service.set(cache_key, result, ttl=self.ttl)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed for {cache_key}: {str(e)}")
+        return result
+
+    async def stream(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream generated text from the wrapped handler; streams are not cached."""
+        async for text in self.llm.stream(prompt, **kwargs):
+            yield text
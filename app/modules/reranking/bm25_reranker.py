@@ -48,21 +48,5 @@ class BM25Reranker(RerankingService):
         # Get scores
         scores = bm25.get_scores(tokenized_query)
 
-        # Create result with document, score, and metadata
-        results = []
-        for i, (doc, score) in enumerate(zip(documents, scores)):
-            result = {
-                "content": doc,
-                "score": float(score),
-                "metadata": metadata[i] if metadata else {}
-            }
-            results.append(result)
-
-        # Sort by score in descending order
-        results = sorted(results, key=lambda x: x["score"], reverse=True)
-
-        # Limit to top_k if specified
-        if top_k and top_k > 0:
-            results = results[:top_k]
-
-        return results
\ No newline at end of file
+        # Keep the top_k best-scoring documents, best first
+        return self._rank_results(documents, scores, metadata, top_k)
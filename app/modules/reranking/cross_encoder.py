@@ -1,4 +1,5 @@
 # app/modules/reranking/cross_encoder.py
+import asyncio
 from typing import List, Dict, Any, Optional
 import torch
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
@@ -13,7 +14,9 @@ class CrossEncoderReranker(RerankingService):
     Reranker using Cross-Encoder models from HuggingFace.
     """
 
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"):
+    independent_scores = True
+
+    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2", batch_size: int = 32):
         """
         Initialize the Cross-Encoder reranker with the specified model.
 
@@ -21,8 +24,11 @@ class CrossEncoderReranker(RerankingService):
         ----------
         model_name : str, optional
             The name of the cross-encoder model, by default "cross-encoder/ms-marco-MiniLM-L-6-v2"
+        batch_size : int, optional
+            Number of (query, document) pairs per forward pass, by default 32
         """
         self.model_name = model_name
+        self.batch_size = batch_size
         logger.info(f"Loading Cross-Encoder model: {model_name}")
 
         # Load model and tokenizer
@@ -33,7 +39,62 @@ class CrossEncoderReranker(RerankingService):
 
         logger.info(f"Cross-Encoder model loaded on {self.device}")
 
-    def rerank(
+    def _encode_batch(self, queries: List[str], documents: List[str]) -> Dict[str, torch.Tensor]:
+        """Tokenize a batch of (query, document) pairs and start the copy to the device."""
+        inputs = self.tokenizer(
+            queries,
+            documents,
+            padding=True,
+            truncation=True,
+            return_tensors="pt",
+            max_length=512
+        )
+        if self.device == "cuda":
+            return {name: tensor.pin_memory().to(self.device, non_blocking=True) for name, tensor in inputs.items()}
+        return dict(inputs)
+
+    def _score_batch(self, inputs: Dict[str, torch.Tensor]) -> List[float]:
+        """Run the model on an encoded batch and return one score per pair."""
+        with torch.no_grad():
+            return self.model(**inputs).logits.flatten().cpu().tolist()
+
+    async def _score_pairs(self, queries: List[str], documents: List[str]) -> List[float]:
+        """
+        Score aligned (query, document) pairs in batches of `batch_size`.
+
+        Tokenization and the host-to-device copy of the next batch run while
+        the current batch is on the model (double buffering through a two-slot
+        queue), both off the event loop.
+        """
+        batches: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def produce() -> None:
+            try:
+                for start in range(0, len(documents), self.batch_size):
+                    end = start + self.batch_size
+                    inputs = await asyncio.to_thread(self._encode_batch, queries[start:end], documents[start:end])
+                    await batches.put(inputs)
+            except Exception as e:
+                await batches.put(e)
+                return
+            await batches.put(None)
+
+        producer = asyncio.create_task(produce())
+        scores: List[float] = []
+        try:
+            while True:
+                inputs = await batches.get()
+                if inputs is None:
+                    break
+                if isinstance(inputs, Exception):
+                    raise inputs
+                scores.extend(await asyncio.to_thread(self._score_batch, inputs))
+        finally:
+            producer.cancel()
+
+        return scores
+
+    async def rerank(
             self,
             query: str,
             documents: List[str],
@@ -43,6 +104,9 @@ class CrossEncoderReranker(RerankingService):
         """
         Rerank documents using the cross-encoder model.
 
+        Documents are scored in batches of `batch_size`, with the next batch
+        tokenized and copied to the device while the current one runs.
+
         Parameters
         ----------
         query : str
@@ -62,36 +126,44 @@ class CrossEncoderReranker(RerankingService):
         if not documents:
             return []
 
-        # Create pairs of query and documents
-        pairs = [[query, doc] for doc in documents]
+        scores = await self._score_pairs([query] * len(documents), documents)
 
-        # Encode and get scores
-        with torch.no_grad():
-            inputs = self.tokenizer(
-                pairs,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-                max_length=512
-            ).to(self.device)
-
-            scores = self.model(**inputs).logits.flatten().cpu().numpy()
-
-        # Create result with document, score, and metadata
-        results = []
-        for i, (doc, score) in enumerate(zip(documents, scores)):
-            result = {
-                "content": doc,
-                "score": float(score),
-                "metadata": metadata[i] if metadata else {}
-            }
-            results.append(result)
-
-        # Sort by score in descending order
-        results = sorted(results, key=lambda x: x["score"], reverse=True)
-
-        # Limit to top_k if specified
-        if top_k and top_k > 0:
-            results = results[:top_k]
-
-        return results
\ No newline at end of file
+        # Keep the top_k best-scoring documents, best first
+        return self._rank_results(documents, scores, metadata, top_k)
+
+    async def rerank_batch(
+            self,
+            queries: List[str],
+            documents: List[List[str]],
+            top_k: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Rerank the document lists of several queries in shared forward passes.
+
+        The (query, document) pairs of all queries are packed into one stream
+        of `batch_size` batches, so small per-query lists still fill the model.
+
+        Parameters
+        ----------
+        queries : List[str]
+            The query texts
+        documents : List[List[str]]
+            The documents to rerank for each query, aligned with `queries`
+        top_k : Optional[int], optional
+            Number of top results to return per query, by default None
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            Reranked documents with scores, one list per query
+        """
+        pair_queries = [query for query, docs in zip(queries, documents) for _ in docs]
+        pair_documents = [doc for docs in documents for doc in docs]
+        scores = await self._score_pairs(pair_queries, pair_documents) if pair_documents else []
+
+        batch_results = []
+        offset = 0
+        for docs in documents:
+            batch_results.append(self._rank_results(docs, scores[offset:offset + len(docs)], top_k=top_k))
+            offset += len(docs)
+        return batch_results
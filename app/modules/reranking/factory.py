@@ -1,15 +1,20 @@
 # app/modules/reranking/factory.py
+from functools import lru_cache
 from typing import Optional
 
 from modules.reranking.cross_encoder import CrossEncoderReranker
 from domain.interfaces.reranking import RerankingService
 from app.modules.reranking.bm25_reranker import BM25Reranker
+from app.modules.reranking.onnx_reranker import OnnxCrossEncoderReranker
 from app.config import settings
 
 
 class RerankerFactory:
     """
     Factory class for creating reranker instances.
+
+    Instances are memoized per reranker type, so model weights and tokenizers
+    are loaded once per process and shared across requests.
     """
 
     @staticmethod
@@ -19,7 +24,7 @@ class RerankerFactory:
 
         Args:
             reranker_type: The type of reranker to create.
-                Options: 'cross-encoder', 'bm25', or None (uses default from settings).
+                Options: 'cross-encoder', 'onnx-int8', 'bm25', or None (uses default from settings).
 
         Returns:
             An instance of a RerankingService.
@@ -28,10 +33,23 @@ class RerankerFactory:
             ValueError: If the reranker type is not supported.
         """
         reranker_type = reranker_type or getattr(settings, 'RERANKER_TYPE', 'bm25')
+        return RerankerFactory._create_reranker(reranker_type)
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _create_reranker(reranker_type: str) -> RerankingService:
+        """
+        Instantiate a reranker; cached so each type is only built once.
+        """
         if reranker_type == 'cross-encoder':
             model_name = getattr(settings, 'CROSS_ENCODER_MODEL', 'cross-encoder/ms-marco-MiniLM-L-6-v2')
-            return CrossEncoderReranker(model_name=model_name)
+            return CrossEncoderReranker(model_name=model_name, batch_size=settings.RERANKER_BATCH_SIZE)
+        elif reranker_type == 'onnx-int8':
+            return OnnxCrossEncoderReranker(
+                model_path=settings.ONNX_RERANKER_MODEL_PATH,
+                batch_size=settings.RERANKER_BATCH_SIZE,
+                model_id=getattr(settings, 'CROSS_ENCODER_MODEL', None)
+            )
         elif reranker_type == 'bm25':
             return BM25Reranker()
         else:
@@ -1,8 +1,10 @@
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 import json
 import os
 import numpy as np
+from cachetools import TTLCache
 
 from domain.entities.document import Document
 from domain.interfaces.document_store import DocumentStoreInterface
@@ -11,6 +13,23 @@ from domain.interfaces.embedding import EmbeddingInterface
 from infrastructure.repositories.document_repository import DocumentRepository
 from utils.logger_util import get_logger
 
+# Themes confirmed to hold no documents, shared by every store in the process.
+# Storing a document for a theme evicts it; the TTL bounds other write paths
+_EMPTY_THEMES: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+# Write counters per theme, also shared process-wide. Caches of searches and
+# answers put them in their keys, so any write through a store makes earlier
+# entries unreachable; the None key counts writes to every theme
+_THEME_VERSIONS: Dict[Optional[str], int] = defaultdict(int)
+
+
+def _theme_written(theme_id: Optional[str]) -> None:
+    """Record a write to a theme's documents: it is no longer empty and its version moves on."""
+    _EMPTY_THEMES.pop(theme_id, None)
+    _THEME_VERSIONS[None] += 1
+    if theme_id is not None:
+        _THEME_VERSIONS[theme_id] += 1
+
 
 class DocumentStore(DocumentStoreInterface):
     """
@@ -41,7 +60,8 @@ class DocumentStore(DocumentStoreInterface):
             owner_id: Optional[str] = None,
             theme_id: Optional[str] = None,
             threshold: float = 0.7,
-            metadata_filters: Optional[Dict[str, Any]] = None
+            metadata_filters: Optional[Dict[str, Any]] = None,
+            ef_search: Optional[int] = None
     ) -> List[Document]:
         """
         Perform semantic search using a pre-computed query embedding.
@@ -53,6 +73,7 @@ class DocumentStore(DocumentStoreInterface):
             theme_id: Optional filter for document theme
             threshold: Minimum similarity score (0-1) for results
             metadata_filters: Optional dictionary of metadata key-value pairs to filter on
+            ef_search: Optional HNSW candidate list size used by the index scan
 
         Returns:
             List[Document]: List of matching Document objects with similarity scores
@@ -63,7 +84,8 @@ class DocumentStore(DocumentStoreInterface):
                 embedding=query_embedding,
                 limit=limit * 2,  # Get more than needed to allow for filtering
                 owner_id=owner_id,
-                theme_id=theme_id
+                theme_id=theme_id,
+                ef_search=ef_search
             )
 
             # Convert to Document entities with similarity scores
@@ -117,9 +139,10 @@ class DocumentStore(DocumentStoreInterface):
             # Create directory if it doesn't exist
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Convert document to serializable dict
+            # Convert document to serializable dict; the database ID, not the
+            # entity's pre-insert ID, names the cached document
             doc_dict = {
-                "id": document.id,
+                "id": document_id,
                 "content": document.content,
                 "owner_id": document.owner_id,
                 "metadata": document.metadata,
@@ -158,11 +181,11 @@ class DocumentStore(DocumentStoreInterface):
             if doc_dict.get("has_embedding", False):
                 embedding_path = self.storage_path / owner_id / theme_id / f"{document_id}.embedding.npy"
                 if embedding_path.exists():
-                    embedding = np.load(embedding_path).tolist()
+                    embedding = np.load(embedding_path).astype(np.float32, copy=False)
 
-            # Create Document object
+            # Create Document object, keyed by the ID it was requested by
             document = Document(
-                id=doc_dict["id"],
+                id=document_id,
                 content=doc_dict["content"],
                 owner_id=doc_dict["owner_id"],
                 metadata=doc_dict.get("metadata", {}),
@@ -192,7 +215,7 @@ class DocumentStore(DocumentStoreInterface):
 
     async def store_document(self, document: Document) -> str:
         """
-        Store a document with its embedding, link it to a theme if theme_id provided.
+        Store a document with its embedding.
 
         Args:
             document: Document entity to store
@@ -214,16 +237,50 @@ class DocumentStore(DocumentStoreInterface):
             theme_id=document.theme_id,
             metadata=document.metadata
         )
-        if document.theme_id:
-            await self.document_repository.create_theme_document_link(
+        _theme_written(document.theme_id)
+        # Save content to file system for faster retrieval
+        self._save_document_to_disk(doc_id, document)
+
+        return doc_id
+
+    async def store_documents(self, documents: List[Document]) -> List[str]:
+        """
+        Store many documents with one embedding call and one batched insert.
+
+        Args:
+            documents: Document entities to store
+
+        Returns:
+            List[str]: IDs of the stored documents, in input order
+        """
+        if not documents:
+            return []
+
+        # Embed every document that has no embedding yet in a single batch
+        missing = [document for document in documents if document.embedding is None]
+        if missing:
+            embeddings = await self.embedding_service.get_embeddings([document.content for document in missing])
+            for document, embedding in zip(missing, embeddings):
+                document.embedding = embedding
+
+        doc_ids = await self.document_repository.create_documents([
+            dict(
+                content=document.content,
+                embedding=document.embedding,
+                owner_id=document.owner_id,
+                file_id=document.file_id,
                 theme_id=document.theme_id,
-                document_id=doc_id
+                metadata=document.metadata
             )
+            for document in documents
+        ])
 
         # Save content to file system for faster retrieval
-        self._save_document_to_disk(doc_id, document)
+        for doc_id, document in zip(doc_ids, documents):
+            _theme_written(document.theme_id)
+            self._save_document_to_disk(doc_id, document)
 
-        return doc_id
+        return doc_ids
 
     async def get(self, document_id: str, owner_id: str, theme_id: str) -> Optional[Document]:
         """
@@ -370,6 +427,35 @@ class DocumentStore(DocumentStoreInterface):
 
         return documents
 
+    async def iter_documents(
+            self,
+            filter_criteria: Optional[Dict[str, Any]] = None,
+            batch_size: int = 500
+    ) -> AsyncIterator[Document]:
+        """
+        Stream documents matching the filter criteria without loading them all (Interface method).
+
+        Documents are read from the database in batches of `batch_size` and are
+        not written to the disk cache.
+
+        Args:
+            filter_criteria: Column/value pairs to match, e.g. {"theme_id": ...}
+            batch_size: Number of documents fetched per database round trip
+
+        Yields:
+            Document: Matching documents in ID order
+        """
+        async for db_doc in self.document_repository.iter_documents(filter_criteria, batch_size):
+            yield Document(
+                id=db_doc.id,
+                content=db_doc.content,
+                embedding=db_doc.embedding,
+                owner_id=db_doc.owner_id,
+                metadata=self._extract_metadata(db_doc),
+                created_at=db_doc.created_at.isoformat(),
+                updated_at=db_doc.updated_at.isoformat()
+            )
+
     async def search_documents(
             self,
             query: str,
@@ -445,6 +531,7 @@ class DocumentStore(DocumentStoreInterface):
 
         # Delete from disk cache if exists
         if deleted:
+            _theme_written(theme_id)
             self._delete_document_from_disk(document_id,owner_id, theme_id)
 
         return deleted
@@ -473,6 +560,7 @@ class DocumentStore(DocumentStoreInterface):
 
         # Update disk cache if successful
         if updated:
+            _theme_written(document.theme_id)
             self._save_document_to_disk(document.id, document)
 
         return updated
@@ -516,6 +604,54 @@ class DocumentStore(DocumentStoreInterface):
                 # If all else fails, return 0
                 return 0
 
+    def is_theme_known_empty(self, theme_id: str) -> bool:
+        """
+        Check whether a theme was recently confirmed to hold no documents.
+
+        Args:
+            theme_id: ID of the theme
+
+        Returns:
+            bool: True if searching the theme can be skipped
+        """
+        return theme_id in _EMPTY_THEMES
+
+    def theme_version(self, theme_id: Optional[str]) -> int:
+        """
+        Return a counter that changes whenever a theme's documents are written.
+
+        Args:
+            theme_id: ID of the theme, or None for the documents of all themes
+
+        Returns:
+            int: The current version; cached results keyed on an older one are stale
+        """
+        return _THEME_VERSIONS.get(theme_id, 0)
+
+    async def check_theme_empty(self, theme_id: str) -> bool:
+        """
+        Count a theme's documents and remember the theme if it has none.
+
+        An empty search result alone does not mean the theme is empty, since
+        filtered approximate search can come back short; only a zero count
+        marks it.
+
+        Args:
+            theme_id: ID of the theme
+
+        Returns:
+            bool: True if the theme holds no documents
+        """
+        try:
+            empty = await self.document_repository.count_documents({"theme_id": theme_id}) == 0
+        except Exception as e:
+            self.logger.error(f"Error counting documents of theme {theme_id}: {str(e)}")
+            return False
+
+        if empty:
+            _EMPTY_THEMES[theme_id] = True
+        return empty
+
     def _delete_document_from_disk(self, document_id: str, owner_id: str, theme_id: str) -> None:
         """Delete document from disk cache."""
         file_path = Path(self.storage_path) / owner_id / theme_id / f"{document_id}.json"
@@ -533,6 +669,11 @@ class DocumentStore(DocumentStoreInterface):
         if hasattr(db_document, "metadata") and isinstance(db_document.metadata, dict):
             return db_document.metadata.copy()
 
+        # JSONB metadata column of the documents table (ORM and raw rows alike)
+        extra_metadata = getattr(db_document, "extra_metadata", None)
+        if isinstance(extra_metadata, dict):
+            return dict(extra_metadata)
+
         # Otherwise try to extract from document_metadata list of key-value pairs
         metadata = {}
         try:
@@ -557,9 +698,9 @@ class DocumentStore(DocumentStoreInterface):
         Returns:
             float: Cosine similarity score (0-1)
         """
-        # Convert to numpy arrays
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        # View as float32, the precision the vectors are stored in; arrays are not copied
+        vec1 = np.asarray(embedding1, dtype=np.float32)
+        vec2 = np.asarray(embedding2, dtype=np.float32)
 
         # Calculate cosine similarity
         dot_product = np.dot(vec1, vec2)
@@ -570,7 +711,7 @@ class DocumentStore(DocumentStoreInterface):
         if norm1 == 0 or norm2 == 0:
             return 0.0
 
-        return dot_product / (norm1 * norm2)
+        return float(dot_product / (norm1 * norm2))
 
     def _matches_metadata_filters(self, document: Document, filters: Dict[str, Any]) -> bool:
         """
@@ -0,0 +1,64 @@
+import argparse
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateIndex
+
+from app.infrastructure.database.db_models import ConversationContext, Document
+from app.infrastructure.repositories import engine
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# HNSW builds are much faster when the graph fits in maintenance memory
+MAINTENANCE_WORK_MEM = "2GB"
+MAX_PARALLEL_MAINTENANCE_WORKERS = 7
+
+
+def vector_indexes():
+    """
+    Return the HNSW indexes declared on the models.
+    """
+    return [
+        index
+        for model in (Document, ConversationContext)
+        for index in model.__table__.indexes
+        if index.dialect_options["postgresql"]["using"] == "hnsw"
+    ]
+
+
+async def build_vector_indexes(maintenance_work_mem: str, parallel_workers: int) -> None:
+    """
+    Create the missing HNSW indexes with build settings raised for this session.
+
+    Parameters
+    ----------
+    maintenance_work_mem : str
+        Memory available to each index build, e.g. "2GB".
+    parallel_workers : int
+        Maximum number of parallel workers for each index build.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(text(f"SET LOCAL maintenance_work_mem = '{maintenance_work_mem}'"))
+        await conn.execute(text(f"SET LOCAL max_parallel_maintenance_workers = {int(parallel_workers)}"))
+        for index in vector_indexes():
+            logger.info(f"Building {index.name} on {index.table.name}")
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def main() -> None:
+    """
+    Entry point for building the vector indexes.
+    """
+    parser = argparse.ArgumentParser(description="Build the HNSW indexes of the embedding columns")
+    parser.add_argument("--maintenance-work-mem", default=MAINTENANCE_WORK_MEM)
+    parser.add_argument("--parallel-workers", type=int, default=MAX_PARALLEL_MAINTENANCE_WORKERS)
+    args = parser.parse_args()
+
+    asyncio.run(build_vector_indexes(args.maintenance_work_mem, args.parallel_workers))
+    logger.info("Vector indexes are built.")
+
+
+if __name__ == "__main__":
+    main()
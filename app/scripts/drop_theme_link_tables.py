@@ -0,0 +1,58 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.infrastructure.repositories import engine
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# Links that point to another theme than the row's own theme_id; these
+# memberships cannot be kept once each row has a single theme
+STRAY_LINKS_QUERY = """
+SELECT
+    (SELECT count(*) FROM theme_documents td JOIN documents d ON d.id = td.document_id
+     WHERE d.theme_id IS DISTINCT FROM td.theme_id),
+    (SELECT count(*) FROM theme_files tf JOIN files f ON f.id = tf.file_id
+     WHERE f.theme_id IS DISTINCT FROM tf.theme_id)
+"""
+
+MIGRATION_STATEMENTS = [
+    # Removing a document or file from its theme now clears theme_id
+    "ALTER TABLE documents ALTER COLUMN theme_id DROP NOT NULL",
+    "ALTER TABLE files ALTER COLUMN theme_id DROP NOT NULL",
+    "DROP TABLE theme_documents",
+    "DROP TABLE theme_files",
+]
+
+
+async def drop_theme_link_tables() -> None:
+    """
+    Drop the theme_documents and theme_files link tables.
+
+    Documents and files keep their theme in their own theme_id column, which
+    every query now reads. Links to a different theme are counted and logged
+    before the tables are dropped.
+    """
+    async with engine.begin() as conn:
+        stray_documents, stray_files = (await conn.execute(text(STRAY_LINKS_QUERY))).one()
+        if stray_documents or stray_files:
+            logger.warning(
+                f"Dropping {stray_documents} document and {stray_files} file link(s) "
+                f"that point to another theme than the row's theme_id"
+            )
+        for statement in MIGRATION_STATEMENTS:
+            await conn.execute(text(statement))
+
+
+def main() -> None:
+    """
+    Entry point for dropping the theme link tables.
+    """
+    asyncio.run(drop_theme_link_tables())
+    logger.info("Theme membership is stored in documents.theme_id and files.theme_id only.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.infrastructure.repositories import AsyncSessionLocal
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# The schema is not managed by a migration tool, so the column and its index
+# are created here when missing
+MIGRATION_STATEMENTS = [
+    "ALTER TABLE documents ADD COLUMN IF NOT EXISTS extra_metadata JSONB NOT NULL DEFAULT '{}'::jsonb",
+    "CREATE INDEX IF NOT EXISTS ix_documents_extra_metadata_gin ON documents USING gin (extra_metadata)",
+]
+
+# Keys already present in extra_metadata win over the legacy rows
+FOLD_STATEMENT = """
+UPDATE documents d
+SET extra_metadata = m.metadata || d.extra_metadata
+FROM (
+    SELECT document_id, jsonb_object_agg(key, value) AS metadata
+    FROM document_metadata
+    GROUP BY document_id
+) m
+WHERE m.document_id = d.id
+"""
+
+
+async def migrate_document_metadata() -> int:
+    """
+    Fold the key/value rows of `document_metadata` into `documents.extra_metadata`.
+
+    The legacy table is left untouched so that a rollback can still read it.
+    Running the migration again is harmless.
+
+    Returns
+    -------
+    int
+        Number of documents whose metadata was updated.
+    """
+    async with AsyncSessionLocal() as db:
+        for statement in MIGRATION_STATEMENTS:
+            await db.execute(text(statement))
+        result = await db.execute(text(FOLD_STATEMENT))
+        await db.commit()
+    return result.rowcount
+
+
+def main() -> None:
+    """
+    Entry point for the document metadata migration.
+    """
+    updated = asyncio.run(migrate_document_metadata())
+    logger.info(f"Folded legacy metadata into {updated} document(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.infrastructure.repositories import engine
+from app.utils.logger_util import get_logger
+from app.scripts.build_vector_indexes import (
+    MAINTENANCE_WORK_MEM, MAX_PARALLEL_MAINTENANCE_WORKERS, build_vector_indexes
+)
+
+# Configure logger
+logger = get_logger(__name__)
+
+# Indexes built with vector opclasses cannot survive the type change; they are
+# dropped and rebuilt with halfvec_cosine_ops
+MIGRATION_STATEMENTS = [
+    "DROP INDEX IF EXISTS ix_documents_embedding_halfvec_hnsw",
+    "DROP INDEX IF EXISTS ix_documents_embedding_hnsw",
+    "DROP INDEX IF EXISTS ix_conversation_contexts_embedding_hnsw",
+    "ALTER TABLE documents ALTER COLUMN embedding TYPE halfvec(768) USING embedding::halfvec(768)",
+    "ALTER TABLE conversation_contexts ALTER COLUMN embedding TYPE halfvec(768) USING embedding::halfvec(768)",
+]
+
+
+async def migrate_embeddings_to_halfvec() -> None:
+    """
+    Convert the embedding columns from vector(768) to halfvec(768).
+
+    Rewrites both tables in one transaction, then rebuilds their HNSW indexes.
+    """
+    async with engine.begin() as conn:
+        for statement in MIGRATION_STATEMENTS:
+            await conn.execute(text(statement))
+    await build_vector_indexes(MAINTENANCE_WORK_MEM, MAX_PARALLEL_MAINTENANCE_WORKERS)
+
+
+def main() -> None:
+    """
+    Entry point for the halfvec migration.
+    """
+    asyncio.run(migrate_embeddings_to_halfvec())
+    logger.info("Embedding columns are stored as halfvec(768).")
+
+
+if __name__ == "__main__":
+    main()
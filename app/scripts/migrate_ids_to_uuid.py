@@ -0,0 +1,73 @@
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.schema import AddConstraint
+
+from app.infrastructure.database.db_models import GUID, Base
+from app.infrastructure.repositories import engine
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# Foreign keys pin the type of the column they reference, so they are dropped
+# while the key columns change type and recreated from the models afterwards.
+# Keys declared by tables outside the models (such as the legacy link tables)
+# that reference a model table are dropped too, and not recreated
+FOREIGN_KEYS_QUERY = """
+SELECT conrelid::regclass::text AS table_name, conname
+FROM pg_constraint
+WHERE contype = 'f'
+  AND (conrelid::regclass::text = ANY(:tables) OR confrelid::regclass::text = ANY(:tables))
+"""
+
+
+async def migrate_ids_to_uuid() -> None:
+    """
+    Convert the text ID columns to native uuid and let the server generate primary keys.
+
+    Every GUID column of the models is converted with `USING col::uuid`, which
+    accepts both the dashed and the 32-hex spelling. Primary keys with a
+    server default get it set. Runs in one transaction; converting columns
+    that are already uuid is harmless.
+
+    Run `drop_theme_link_tables.py` first. If the legacy `theme_documents`
+    and `theme_files` tables still exist, their foreign keys into the model
+    tables are dropped here so the conversion can proceed, but their own
+    text columns are left as they are.
+    """
+    tables = Base.metadata.sorted_tables
+    async with engine.begin() as conn:
+        result = await conn.execute(text(FOREIGN_KEYS_QUERY), {"tables": [table.name for table in tables]})
+        for table_name, constraint_name in result.all():
+            await conn.execute(text(f'ALTER TABLE {table_name} DROP CONSTRAINT "{constraint_name}"'))
+
+        for table in tables:
+            for column in table.columns:
+                if not isinstance(column.type, GUID):
+                    continue
+                await conn.execute(text(
+                    f'ALTER TABLE {table.name} ALTER COLUMN "{column.name}" TYPE uuid USING "{column.name}"::uuid'
+                ))
+                if column.primary_key and column.server_default is not None:
+                    await conn.execute(text(
+                        f'ALTER TABLE {table.name} ALTER COLUMN "{column.name}" '
+                        f'SET DEFAULT {column.server_default.arg.text}'
+                    ))
+            logger.info(f"Converted ID columns of {table.name}")
+
+        for table in tables:
+            for constraint in table.foreign_key_constraints:
+                await conn.execute(AddConstraint(constraint))
+
+
+def main() -> None:
+    """
+    Entry point for the UUID migration.
+    """
+    asyncio.run(migrate_ids_to_uuid())
+    logger.info("ID columns are stored as uuid.")
+
+
+if __name__ == "__main__":
+    main()
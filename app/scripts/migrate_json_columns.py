@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.infrastructure.repositories import engine
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# Columns that held JSON documents as text, per table
+JSON_COLUMNS = {
+    "processing_tasks": ["task_metadata", "steps"],
+    "messages": ["references", "message_metadata"],
+    "conversation_contexts": ["conversation_metadata"],
+}
+
+
+async def migrate_json_columns() -> None:
+    """
+    Convert the JSON text columns to JSONB in place.
+
+    Every value is parsed once by PostgreSQL during the rewrite. The
+    conversion fails, and the transaction rolls back, if a value is not
+    valid JSON.
+    """
+    async with engine.begin() as conn:
+        for table, columns in JSON_COLUMNS.items():
+            alterations = ", ".join(
+                f'ALTER COLUMN "{column}" TYPE JSONB USING "{column}"::jsonb' for column in columns
+            )
+            await conn.execute(text(f"ALTER TABLE {table} {alterations}"))
+            logger.info(f"Converted {table}: {', '.join(columns)}")
+
+
+def main() -> None:
+    """
+    Entry point for the JSONB migration.
+    """
+    asyncio.run(migrate_json_columns())
+    logger.info("JSON columns are stored as JSONB.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import asyncio
+
+from sqlalchemy import select, text, update
+
+from app.infrastructure.database.db_models import Session, describe_user_agent
+from app.infrastructure.repositories import AsyncSessionLocal
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# The schema is not managed by a migration tool, so the columns and their index
+# are created here when missing
+MIGRATION_STATEMENTS = [
+    "ALTER TABLE sessions ADD COLUMN IF NOT EXISTS device VARCHAR",
+    "ALTER TABLE sessions ADD COLUMN IF NOT EXISTS browser VARCHAR",
+    "ALTER TABLE sessions ADD COLUMN IF NOT EXISTS os VARCHAR",
+    "CREATE INDEX IF NOT EXISTS ix_sessions_browser ON sessions (browser)",
+]
+
+
+async def migrate_session_user_agents() -> int:
+    """
+    Add the parsed user agent columns to `sessions` and fill them for existing rows.
+
+    Rows that already have a device are skipped, so running the migration
+    again is harmless.
+
+    Returns
+    -------
+    int
+        Number of sessions that were filled.
+    """
+    async with AsyncSessionLocal() as db:
+        for statement in MIGRATION_STATEMENTS:
+            await db.execute(text(statement))
+
+        result = await db.execute(
+            select(Session.id, Session.user_agent)
+            .where(Session.user_agent.isnot(None), Session.device.is_(None))
+        )
+        rows = result.all()
+        if rows:
+            # Bulk UPDATE by primary key: one executemany for all rows
+            await db.execute(
+                update(Session),
+                [{"id": session_id, **describe_user_agent(user_agent)} for session_id, user_agent in rows]
+            )
+        await db.commit()
+    return len(rows)
+
+
+def main() -> None:
+    """
+    Entry point for the session user agent migration.
+    """
+    updated = asyncio.run(migrate_session_user_agents())
+    logger.info(f"Filled user agent columns for {updated} session(s).")
+
+
+if __name__ == "__main__":
+    main()
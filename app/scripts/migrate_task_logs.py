@@ -0,0 +1,54 @@
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateTable
+
+from app.infrastructure.database.db_models import ProcessingTaskLog
+from app.infrastructure.repositories import engine
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# Works whether logs is still text or was already converted to jsonb
+COPY_STATEMENT = """
+INSERT INTO processing_task_logs (task_id, seq, message, logged_at)
+SELECT t.id,
+       e.ordinality - 1,
+       e.value->>'message',
+       to_timestamp(e.value->>'timestamp', 'YYYY-MM-DD HH24:MI:SS')::timestamp
+FROM processing_tasks t,
+     jsonb_array_elements(t.logs::jsonb) WITH ORDINALITY AS e(value, ordinality)
+WHERE t.logs IS NOT NULL
+"""
+
+
+async def migrate_task_logs() -> int:
+    """
+    Move the JSON log arrays of `processing_tasks` into `processing_task_logs` rows.
+
+    Creates the table, copies every entry in order and drops the old column,
+    all in one transaction.
+
+    Returns
+    -------
+    int
+        Number of log entries copied.
+    """
+    async with engine.begin() as conn:
+        await conn.execute(CreateTable(ProcessingTaskLog.__table__, if_not_exists=True))
+        result = await conn.execute(text(COPY_STATEMENT))
+        await conn.execute(text("ALTER TABLE processing_tasks DROP COLUMN logs"))
+    return result.rowcount
+
+
+def main() -> None:
+    """
+    Entry point for the task log migration.
+    """
+    copied = asyncio.run(migrate_task_logs())
+    logger.info(f"Moved {copied} task log entries to processing_task_logs.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.infrastructure.repositories import AsyncSessionLocal
+from app.infrastructure.repositories.token_repository import _hash_token
+from app.utils.logger_util import get_logger
+
+# Configure logger
+logger = get_logger(__name__)
+
+# The schema is not managed by a migration tool, so the digest column is added here
+ADD_COLUMN_STATEMENT = "ALTER TABLE tokens ADD COLUMN IF NOT EXISTS token_hash BYTEA"
+
+# Only present until the migration has run once
+HAS_TOKEN_COLUMN_STATEMENT = """
+SELECT 1 FROM information_schema.columns
+WHERE table_name = 'tokens' AND column_name = 'token'
+"""
+
+BACKFILL_STATEMENT = "UPDATE tokens SET token_hash = :token_hash WHERE id = :id"
+
+# Matches `Token.token_hash` (unique, not null, indexed); the plaintext column goes last
+FINALIZE_STATEMENTS = [
+    "ALTER TABLE tokens ALTER COLUMN token_hash SET NOT NULL",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_tokens_token_hash ON tokens (token_hash)",
+    "ALTER TABLE tokens DROP COLUMN IF EXISTS token",
+]
+
+
+async def migrate_token_hashes() -> int:
+    """
+    Replace the plaintext `tokens.token` column with its `token_hash` digest.
+
+    Existing tokens are hashed with the same function the token repository
+    looks them up with, so issued tokens stay valid. Everything runs in one
+    transaction, and running the migration again is harmless.
+
+    Returns
+    -------
+    int
+        Number of tokens that were hashed.
+    """
+    async with AsyncSessionLocal() as db:
+        await db.execute(text(ADD_COLUMN_STATEMENT))
+
+        rows = []
+        if (await db.execute(text(HAS_TOKEN_COLUMN_STATEMENT))).first() is not None:
+            result = await db.execute(text("SELECT id, token FROM tokens WHERE token_hash IS NULL"))
+            rows = result.all()
+            if rows:
+                # One executemany for all rows
+                await db.execute(
+                    text(BACKFILL_STATEMENT),
+                    [{"id": token_id, "token_hash": _hash_token(token)} for token_id, token in rows]
+                )
+
+        for statement in FINALIZE_STATEMENTS:
+            await db.execute(text(statement))
+        await db.commit()
+    return len(rows)
+
+
+def main() -> None:
+    """
+    Entry point for the token hash migration.
+    """
+    hashed = asyncio.run(migrate_token_hashes())
+    logger.info(f"Hashed {hashed} token(s) and dropped the plaintext column.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from app.application.services.chunking_service import ChunkingService
+
+
+class TestChunkTextOffsets(unittest.TestCase):
+    def setUp(self):
+        self.service = ChunkingService(default_chunk_size=200, default_chunk_overlap=50)
+        rng = random.Random(0)
+        lines = [
+            " ".join(rng.choice(["alpha", "beta", "gamma", "delta"]) for _ in range(rng.randint(1, 12)))
+            for _ in range(60)
+        ]
+        self.text = "\n".join(lines)
+
+    def assert_offsets_cover(self, text, offsets, chunk_size):
+        self.assertEqual(offsets[0][0], 0)
+        self.assertEqual(offsets[-1][1], len(text))
+        for start, end in offsets:
+            self.assertTrue(0 <= start < end <= len(text))
+            self.assertLessEqual(end - start, chunk_size)
+        for (prev_start, prev_end), (start, end) in zip(offsets, offsets[1:]):
+            # Chunks advance and leave no gap: the next one starts inside or right after the previous
+            self.assertGreater(start, prev_start)
+            self.assertGreater(end, prev_end)
+            self.assertLessEqual(start, prev_end)
+
+    def test_offsets_cover_text_with_overlap(self):
+        offsets = self.service.chunk_text_offsets(self.text)
+
+        self.assertGreater(len(offsets), 1)
+        self.assert_offsets_cover(self.text, offsets, 200)
+        # An overlap starts at a separator, or `chunk_overlap` back when its window holds none
+        for (_, prev_end), (start, _) in zip(offsets, offsets[1:]):
+            self.assertGreaterEqual(start, prev_end - 50)
+            if start != prev_end - 50:
+                self.assertEqual(self.text[start], "\n")
+                self.assertNotIn("\n", self.text[prev_end - 50:start])
+
+    def test_offsets_without_overlap_are_contiguous(self):
+        service = ChunkingService(default_chunk_size=200, default_chunk_overlap=0)
+
+        offsets = service.chunk_text_offsets(self.text)
+
+        self.assert_offsets_cover(self.text, offsets, 200)
+        for (_, prev_end), (start, _) in zip(offsets, offsets[1:]):
+            self.assertEqual(start, prev_end)
+
+    def test_chunk_text_slices_offsets(self):
+        offsets = self.service.chunk_text_offsets(self.text)
+
+        self.assertEqual(self.service.chunk_text(self.text), [self.text[start:end] for start, end in offsets])
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(self.service.chunk_text_offsets("short text"), [(0, 10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
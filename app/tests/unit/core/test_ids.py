@@ -0,0 +1,37 @@
+import unittest
+import uuid
+
+from app.utils.ids import _UUIDPool, generate_uuid4, generate_uuid4_hex
+
+
+class TestUUIDPool(unittest.TestCase):
+    def test_batch_has_version_and_variant_bits(self):
+        pool = _UUIDPool()
+        hex_ids = [pool.next_hex() for _ in range(_UUIDPool.BATCH_SIZE + 1)]
+
+        for hex_id in hex_ids:
+            value = uuid.UUID(hex=hex_id)
+            self.assertEqual(len(hex_id), 32)
+            self.assertEqual(value.version, 4)
+            self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertEqual(len(set(hex_ids)), len(hex_ids))
+
+    def test_clear_drops_remaining_ids(self):
+        pool = _UUIDPool()
+        pool.next_hex()
+
+        pool.clear()
+
+        self.assertEqual(len(pool._ids), 0)
+        self.assertEqual(uuid.UUID(hex=pool.next_hex()).version, 4)
+
+    def test_generate_uuid4_is_canonical(self):
+        value = generate_uuid4()
+
+        self.assertEqual(str(uuid.UUID(value)), value)
+        self.assertEqual(uuid.UUID(value).version, 4)
+        self.assertEqual(uuid.UUID(hex=generate_uuid4_hex()).variant, uuid.RFC_4122)
+
+
+if __name__ == "__main__":
+    unittest.main()
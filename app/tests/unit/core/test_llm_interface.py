@@ -0,0 +1,47 @@
+import asyncio
+import unittest
+
+from domain.interfaces.llm import LLMInterface
+
+
+class DictLLM(LLMInterface):
+    """Backend without incremental decoding, returning results like the handlers do."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def generate(self, prompt, context=None, max_tokens=None, **kwargs):
+        self.calls.append((prompt, max_tokens))
+        return self.result
+
+
+def collect(llm, prompt, **kwargs):
+    async def run():
+        return [chunk async for chunk in llm.stream(prompt, **kwargs)]
+
+    return asyncio.run(run())
+
+
+class TestDefaultStream(unittest.TestCase):
+    def test_yields_generate_text_as_one_chunk(self):
+        llm = DictLLM({"text": "full answer", "model": "m"})
+
+        self.assertEqual(collect(llm, "prompt", max_tokens=16), ["full answer"])
+        self.assertEqual(llm.calls, [("prompt", 16)])
+
+    def test_plain_string_result(self):
+        self.assertEqual(collect(DictLLM("text"), "prompt"), ["text"])
+
+    def test_error_result_raises(self):
+        llm = DictLLM({"text": "Error: out of memory", "error": "out of memory"})
+
+        with self.assertRaises(RuntimeError):
+            collect(llm, "prompt")
+
+    def test_single_streaming_entry_point(self):
+        self.assertFalse(hasattr(LLMInterface, "generate_text_stream"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock
+
+from application.services.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_concurrent_submits_share_one_batch(self):
+        batch_fn = AsyncMock(side_effect=lambda items: [item * 2 for item in items])
+
+        async def run():
+            batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+            finally:
+                await batcher.close()
+
+        results = asyncio.run(run())
+
+        # Every caller gets its own result back
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+        batch_fn.assert_awaited_once_with([0, 1, 2, 3, 4])
+
+    def test_batches_are_capped_at_max_batch_size(self):
+        batch_fn = AsyncMock(side_effect=lambda items: list(items))
+
+        async def run():
+            batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait_ms=50)
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+            finally:
+                await batcher.close()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [0, 1, 2, 3, 4])
+        self.assertEqual([call.args[0] for call in batch_fn.await_args_list], [[0, 1], [2, 3], [4]])
+
+    def test_batch_error_reaches_every_caller(self):
+        batch_fn = AsyncMock(side_effect=RuntimeError("model failed"))
+
+        async def run():
+            batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+            finally:
+                await batcher.close()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+    def test_result_count_mismatch_is_an_error(self):
+        batch_fn = AsyncMock(return_value=[1])
+
+        async def run():
+            batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+            try:
+                return await asyncio.gather(*(batcher.submit(i) for i in range(2)), return_exceptions=True)
+            finally:
+                await batcher.close()
+
+        results = asyncio.run(run())
+
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    def test_worker_survives_a_failed_batch(self):
+        batch_fn = AsyncMock(side_effect=[RuntimeError("model failed"), ["ok"]])
+
+        async def run():
+            batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=1)
+            try:
+                first = await asyncio.gather(batcher.submit("first"), return_exceptions=True)
+                return first + [await batcher.submit("second")]
+            finally:
+                await batcher.close()
+
+        first, second = asyncio.run(run())
+
+        self.assertIsInstance(first, RuntimeError)
+        self.assertEqual(second, "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
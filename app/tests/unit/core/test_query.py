@@ -0,0 +1,248 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from core.use_cases import query as query_module
+from core.use_cases.query import RAGQueryProcessor
+from domain.entities.document import Document
+from domain.entities.query import Query
+from domain.interfaces.llm import LLMInterface
+from domain.interfaces.reranking import RerankingService
+
+
+class RecordingReranker(RerankingService):
+    """Scores each document by its length, recording every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def rerank(self, query, documents, metadata=None, top_k=None):
+        self.calls.append(list(documents))
+        return self._rank_results(documents, [float(len(doc)) for doc in documents], metadata, top_k)
+
+
+class PairwiseReranker(RecordingReranker):
+    """Recording reranker whose scores do not depend on the other documents."""
+
+    independent_scores = True
+
+    def __init__(self, model_name):
+        super().__init__()
+        self.model_name = model_name
+
+
+def make_processor(reranker: RerankingService) -> RAGQueryProcessor:
+    return RAGQueryProcessor(
+        document_store=MagicMock(),
+        embedding_service=MagicMock(),
+        llm_provider=MagicMock(),
+        reranking_service=reranker,
+        embedding_batcher=MagicMock(),
+        response_cache=MagicMock(),
+    )
+
+
+class TestRerankDocuments(unittest.TestCase):
+    def setUp(self):
+        query_module._RERANK_SCORE_CACHE.clear()
+        self.documents = [Document(id=f"doc-{i}", content="x" * (i + 1)) for i in range(70)]
+
+    def tearDown(self):
+        query_module._RERANK_SCORE_CACHE.clear()
+
+    def test_whole_pool_is_reranked_in_one_call(self):
+        reranker = RecordingReranker()
+        processor = make_processor(reranker)
+
+        docs, scores = asyncio.run(processor._rerank_documents("query", self.documents, reranker, top_k=5))
+
+        self.assertEqual(len(reranker.calls), 1)
+        self.assertEqual(len(reranker.calls[0]), 70)
+        self.assertEqual([doc.id for doc in docs], [f"doc-{i}" for i in range(69, 64, -1)])
+        self.assertEqual(scores, [70.0, 69.0, 68.0, 67.0, 66.0])
+
+    def test_min_score_filters_before_top_k(self):
+        reranker = RecordingReranker()
+        processor = make_processor(reranker)
+
+        docs, scores = asyncio.run(
+            processor._rerank_documents("query", self.documents[:10], reranker, top_k=5, min_score=8.0)
+        )
+
+        self.assertEqual(scores, [10.0, 9.0, 8.0])
+        # The shared documents keep their own metadata
+        self.assertNotIn("rerank_score", self.documents[9].metadata or {})
+
+
+class TestRerankScoreCache(unittest.TestCase):
+    def setUp(self):
+        query_module._RERANK_SCORE_CACHE.clear()
+        self.documents = [Document(id=f"doc-{i}", content="x" * (i + 1)) for i in range(10)]
+
+    def tearDown(self):
+        query_module._RERANK_SCORE_CACHE.clear()
+
+    def rerank(self, reranker):
+        return asyncio.run(make_processor(reranker)._rerank_documents("query", self.documents, reranker, top_k=3))
+
+    def test_pool_dependent_scores_are_not_cached(self):
+        reranker = RecordingReranker()
+
+        self.rerank(reranker)
+        self.rerank(reranker)
+
+        self.assertEqual(len(reranker.calls), 2)
+        self.assertEqual(len(query_module._RERANK_SCORE_CACHE), 0)
+
+    def test_independent_scores_are_reused(self):
+        reranker = PairwiseReranker("model-a")
+
+        first = self.rerank(reranker)
+        second = self.rerank(reranker)
+
+        self.assertEqual(len(reranker.calls), 1)
+        self.assertEqual(first[1], second[1])
+
+    def test_models_of_one_class_do_not_share_scores(self):
+        self.rerank(PairwiseReranker("model-a"))
+        other = PairwiseReranker("model-b")
+
+        self.rerank(other)
+
+        self.assertEqual(len(other.calls), 1)
+
+
+class TestRetrievalCache(unittest.TestCase):
+    def setUp(self):
+        self.processor = make_processor(RecordingReranker())
+        self.processor.response_cache.get.return_value = None
+        self.store = self.processor.document_store
+        self.store.is_theme_known_empty.return_value = False
+        self.store.theme_version.return_value = 0
+        self.store.semantic_search = AsyncMock(return_value=[Document(id="doc-1", content="answer")])
+        self.processor._embed_query = AsyncMock(return_value=np.ones(4, dtype=np.float32))
+
+    def prepare(self, theme_id="theme-1"):
+        asyncio.run(self.processor._prepare_generation(Query(text="how does it work"), None, theme_id, None))
+
+    def test_repeated_query_reuses_search(self):
+        self.prepare()
+        self.prepare()
+
+        self.assertEqual(self.store.semantic_search.await_count, 1)
+
+    def test_theme_write_invalidates_search(self):
+        self.prepare()
+        # Storing or deleting a document of the theme moves its version on
+        self.store.theme_version.return_value = 1
+        self.prepare()
+
+        self.assertEqual(self.store.semantic_search.await_count, 2)
+        self.store.theme_version.assert_called_with("theme-1")
+
+
+class StreamingLLM(LLMInterface):
+    """Yields fixed chunks, recording the prompt and how far the consumer read."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.prompts = []
+        self.yielded = 0
+        self.closed = False
+
+    async def generate(self, prompt, context=None, max_tokens=None):
+        raise AssertionError("the streaming pipeline must not call generate")
+
+    async def stream(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        try:
+            for chunk in self.chunks:
+                self.yielded += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+class TestProcessQueryStream(unittest.TestCase):
+    def make_processor(self, llm):
+        processor = RAGQueryProcessor(
+            document_store=MagicMock(),
+            embedding_service=MagicMock(),
+            llm_provider=llm,
+            reranking_service=RecordingReranker(),
+            embedding_batcher=MagicMock(),
+            response_cache=MagicMock(),
+        )
+        processor._prepare_generation = AsyncMock(return_value={
+            "relevant_docs": [],
+            "system_prompt": "SYSTEM",
+            "metadata": {"document_count": 0},
+            "query_embedding": None,
+            "cache_scope": None,
+        })
+        processor._build_documents_payload = MagicMock(return_value=[])
+        return processor
+
+    def collect(self, processor):
+        async def run():
+            return [event async for event in processor.process_query_stream(Query(text="question"))]
+
+        return asyncio.run(run())
+
+    def test_tokens_are_forwarded_from_llm_stream(self):
+        llm = StreamingLLM(["Hel", "lo", "!"])
+
+        events = self.collect(self.make_processor(llm))
+
+        self.assertEqual([event["type"] for event in events], ["documents", "token", "token", "token", "final"])
+        self.assertEqual([event["text"] for event in events if event["type"] == "token"], ["Hel", "lo", "!"])
+        self.assertEqual(events[-1]["response"], "Hello!")
+        self.assertEqual(llm.prompts, ["SYSTEM\n\nquestion"])
+        self.assertTrue(llm.closed)
+
+    def test_consumer_disconnect_closes_llm_stream(self):
+        llm = StreamingLLM(["a", "b", "c", "d"])
+        processor = self.make_processor(llm)
+
+        async def run():
+            events = processor.process_query_stream(Query(text="question"))
+            first = await anext(events)
+            token = await anext(events)
+            # What the ASGI server does when the client goes away
+            await events.aclose()
+            # Checked before asyncio.run finalizes leftover generators itself
+            return first, token, llm.closed
+
+        first, token, closed = asyncio.run(run())
+
+        self.assertEqual((first["type"], token["text"]), ("documents", "a"))
+        self.assertTrue(closed)
+        self.assertLess(llm.yielded, 4)
+
+    def test_disconnect_before_first_chunk_cancels_pending_work(self):
+        llm = StreamingLLM(["a"])
+        processor = self.make_processor(llm)
+
+        async def run():
+            events = processor.process_query_stream(Query(text="question"))
+            await anext(events)
+            await events.aclose()
+            return llm.closed
+
+        self.assertTrue(asyncio.run(run()))
+
+    def test_failure_closes_llm_stream(self):
+        llm = StreamingLLM(["a", "b"])
+        processor = self.make_processor(llm)
+        processor._build_documents_payload.side_effect = RuntimeError("boom")
+
+        events = self.collect(processor)
+
+        self.assertEqual([event["type"] for event in events], ["final"])
+        self.assertTrue(llm.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
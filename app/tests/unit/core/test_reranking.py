@@ -0,0 +1,42 @@
+import unittest
+
+from domain.interfaces.reranking import RerankingService
+
+
+class TestRankResults(unittest.TestCase):
+    def setUp(self):
+        self.documents = ["a", "b", "c", "d", "e", "f"]
+        self.scores = [0.2, 0.9, 0.5, 0.9, -1.0, 0.7]
+        self.metadata = [{"index": i} for i in range(len(self.documents))]
+
+    def test_top_k_best_first(self):
+        results = RerankingService._rank_results(self.documents, self.scores, self.metadata, top_k=3)
+
+        # Ties keep input order
+        self.assertEqual([result["content"] for result in results], ["b", "d", "f"])
+        self.assertEqual([result["score"] for result in results], [0.9, 0.9, 0.7])
+        self.assertEqual([result["metadata"]["index"] for result in results], [1, 3, 5])
+
+    def test_top_k_matches_full_sort(self):
+        full = RerankingService._rank_results(self.documents, self.scores)
+
+        for top_k in range(1, len(self.documents)):
+            with self.subTest(top_k=top_k):
+                self.assertEqual(
+                    RerankingService._rank_results(self.documents, self.scores, top_k=top_k), full[:top_k]
+                )
+
+    def test_without_top_k_returns_all_sorted(self):
+        results = RerankingService._rank_results(self.documents, self.scores)
+
+        self.assertEqual([result["content"] for result in results], ["b", "d", "f", "c", "a", "e"])
+        self.assertEqual(results[0]["metadata"], {})
+
+    def test_top_k_larger_than_documents(self):
+        results = RerankingService._rank_results(self.documents, self.scores, top_k=10)
+
+        self.assertEqual(len(results), len(self.documents))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from application.services import semantic_response_cache
+from application.services.semantic_response_cache import SemanticResponseCache, get_shared_response_cache
+
+
+def unit(*values):
+    return np.asarray(values, dtype=np.float32)
+
+
+class TestSemanticResponseCache(unittest.TestCase):
+    def test_similar_query_hits(self):
+        cache = SemanticResponseCache(capacity=4, threshold=0.95)
+        cache.put(unit(1.0, 0.0, 0.0), {"response": "a"}, scope="theme-1")
+
+        self.assertEqual(cache.get(unit(1.0, 0.05, 0.0), scope="theme-1"), {"response": "a"})
+        self.assertIsNone(cache.get(unit(0.0, 1.0, 0.0), scope="theme-1"))
+
+    def test_scopes_do_not_mix(self):
+        cache = SemanticResponseCache(capacity=4)
+        cache.put(unit(1.0, 0.0), {"response": "a"}, scope=("theme-1", None, 0))
+
+        self.assertIsNone(cache.get(unit(1.0, 0.0), scope=("theme-2", None, 0)))
+        # A newer data version is a different scope, so older answers stop matching
+        self.assertIsNone(cache.get(unit(1.0, 0.0), scope=("theme-1", None, 1)))
+
+    def test_expired_entries_miss(self):
+        cache = SemanticResponseCache(capacity=4, ttl=0.0)
+        cache.put(unit(1.0, 0.0), {"response": "a"})
+
+        self.assertIsNone(cache.get(unit(1.0, 0.0)))
+
+    def test_oldest_entry_is_overwritten(self):
+        cache = SemanticResponseCache(capacity=2)
+        for i, vector in enumerate([unit(1.0, 0.0, 0.0), unit(0.0, 1.0, 0.0), unit(0.0, 0.0, 1.0)]):
+            cache.put(vector, {"response": i})
+
+        self.assertIsNone(cache.get(unit(1.0, 0.0, 0.0)))
+        self.assertEqual(cache.get(unit(0.0, 0.0, 1.0)), {"response": 2})
+
+    def test_scope_registry_stays_bounded(self):
+        cache = SemanticResponseCache(capacity=8)
+        for version in range(100):
+            cache.put(unit(1.0, 0.0), {"response": version}, scope=("theme-1", version))
+
+        self.assertLessEqual(len(cache._scope_ids), cache.capacity)
+        self.assertEqual(cache.get(unit(1.0, 0.0), scope=("theme-1", 99)), {"response": 99})
+        self.assertEqual(cache.get(unit(1.0, 0.0), scope=("theme-1", 92)), {"response": 92})
+        self.assertIsNone(cache.get(unit(1.0, 0.0), scope=("theme-1", 91)))
+
+    def test_clear(self):
+        cache = SemanticResponseCache(capacity=4)
+        cache.put(unit(1.0, 0.0), {"response": "a"}, scope="theme-1")
+
+        cache.clear()
+
+        self.assertIsNone(cache.get(unit(1.0, 0.0), scope="theme-1"))
+        self.assertEqual(cache._scope_ids, {})
+
+
+class TestSharedResponseCache(unittest.TestCase):
+    def tearDown(self):
+        semantic_response_cache._SHARED_CACHE = None
+
+    def test_one_cache_per_process(self):
+        self.assertIs(get_shared_response_cache(), get_shared_response_cache())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from core.use_cases.theme import ThemeUseCase
+from domain.entities.document import Document
+from modules.storage import document_store
+from modules.storage.document_store import DocumentStore
+
+
+class TestDocumentStoreDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repository = MagicMock()
+        self.repository.get_documents = AsyncMock(return_value=[])
+        self.store = DocumentStore(self.repository, MagicMock(), Path(self.temp_dir.name))
+
+        # The entity carries its pre-insert ID; the database assigned another one
+        self.document = Document(
+            content="Cached chunk",
+            owner_id="owner-1",
+            theme_id="theme-1",
+            metadata={"source": "a.txt"},
+        )
+        self.db_id = "0f8e7d6c5b4a39281706f5e4d3c2b1a0"
+        self.store._save_document_to_disk(self.db_id, self.document)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip_keeps_database_id(self):
+        loaded = self.store._load_document_from_disk(self.db_id, "owner-1", "theme-1")
+
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.id, self.db_id)
+        self.assertEqual(loaded.content, "Cached chunk")
+        self.assertEqual(loaded.metadata, {"source": "a.txt"})
+
+    def test_get_documents_serves_cache_hits_by_requested_id(self):
+        documents = asyncio.run(self.store.get_documents([self.db_id], "owner-1", "theme-1"))
+
+        self.assertEqual([document.id for document in documents], [self.db_id])
+        self.repository.get_documents.assert_not_called()
+
+    def test_theme_documents_include_cache_hits(self):
+        theme_repository = MagicMock()
+        theme_repository.get_theme_documents = AsyncMock(return_value=[self.db_id])
+        theme_repository.get_theme = AsyncMock(return_value=MagicMock(owner_id="owner-1"))
+        use_case = ThemeUseCase(theme_repository, self.store, MagicMock())
+
+        documents = asyncio.run(use_case.get_theme_documents("theme-1"))
+
+        self.assertEqual([document.id for document in documents], [self.db_id])
+
+
+class TestDocumentStoreEmptyThemes(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repository = MagicMock()
+        self.repository.count_documents = AsyncMock(return_value=0)
+        self.repository.create_documents = AsyncMock(return_value=["doc-1"])
+        self.store = DocumentStore(self.repository, MagicMock(), Path(self.temp_dir.name))
+        document_store._EMPTY_THEMES.clear()
+
+    def tearDown(self):
+        document_store._EMPTY_THEMES.clear()
+        self.temp_dir.cleanup()
+
+    def test_zero_count_marks_theme_empty(self):
+        self.assertTrue(asyncio.run(self.store.check_theme_empty("theme-1")))
+
+        self.assertTrue(self.store.is_theme_known_empty("theme-1"))
+        self.repository.count_documents.assert_awaited_once_with({"theme_id": "theme-1"})
+
+    def test_populated_theme_is_not_marked(self):
+        self.repository.count_documents.return_value = 3
+
+        self.assertFalse(asyncio.run(self.store.check_theme_empty("theme-1")))
+        self.assertFalse(self.store.is_theme_known_empty("theme-1"))
+
+    def test_count_failure_is_not_marked(self):
+        self.repository.count_documents.side_effect = RuntimeError("db down")
+
+        self.assertFalse(asyncio.run(self.store.check_theme_empty("theme-1")))
+        self.assertFalse(self.store.is_theme_known_empty("theme-1"))
+
+    def test_storing_documents_evicts_theme(self):
+        asyncio.run(self.store.check_theme_empty("theme-1"))
+        document = Document(content="chunk", owner_id="owner-1", theme_id="theme-1", embedding=[0.1, 0.2])
+
+        asyncio.run(self.store.store_documents([document]))
+
+        self.assertFalse(self.store.is_theme_known_empty("theme-1"))
+
+
+class TestDocumentStoreThemeVersions(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repository = MagicMock()
+        self.repository.create_documents = AsyncMock(return_value=["doc-1"])
+        self.repository.delete_document = AsyncMock(return_value=True)
+        self.store = DocumentStore(self.repository, MagicMock(), Path(self.temp_dir.name))
+        document_store._THEME_VERSIONS.clear()
+
+    def tearDown(self):
+        document_store._THEME_VERSIONS.clear()
+        self.temp_dir.cleanup()
+
+    def store_in(self, theme_id):
+        document = Document(content="chunk", owner_id="owner-1", theme_id=theme_id, embedding=[0.1, 0.2])
+        asyncio.run(self.store.store_documents([document]))
+
+    def test_store_moves_only_that_theme_and_the_global_version(self):
+        before = [self.store.theme_version(theme) for theme in ("theme-1", "theme-2", None)]
+
+        self.store_in("theme-1")
+
+        after = [self.store.theme_version(theme) for theme in ("theme-1", "theme-2", None)]
+        self.assertNotEqual(after[0], before[0])
+        self.assertEqual(after[1], before[1])
+        self.assertNotEqual(after[2], before[2])
+
+    def test_delete_moves_theme_version(self):
+        before = self.store.theme_version("theme-1")
+
+        asyncio.run(self.store.delete_document("doc-1", "owner-1", "theme-1"))
+
+        self.assertNotEqual(self.store.theme_version("theme-1"), before)
+
+    def test_missing_document_delete_keeps_version(self):
+        self.repository.delete_document.return_value = False
+        before = self.store.theme_version("theme-1")
+
+        asyncio.run(self.store.delete_document("doc-1", "owner-1", "theme-1"))
+
+        self.assertEqual(self.store.theme_version("theme-1"), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
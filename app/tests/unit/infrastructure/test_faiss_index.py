@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from modules.indexing.faiss_hnsw import FaissVectorIndex
+
+
+class TestFaissQuantizationRecall(unittest.TestCase):
+    DIMENSION = 32
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.vectors = rng.standard_normal((500, self.DIMENSION)).astype(np.float32)
+        self.ids = [f"doc-{i}" for i in range(len(self.vectors))]
+
+    def build_index(self, quantization: str) -> FaissVectorIndex:
+        index = FaissVectorIndex(
+            dimension=self.DIMENSION,
+            quantization=quantization,
+            pq_subvectors=8,
+            pq_bits=4,
+            nlist=8,
+            min_training_points=256,
+        )
+
+        async def add():
+            # A single vector first: the quantizer must not be trained on it alone
+            await index.add_vectors_from_ndarray(self.vectors[:1], self.ids[:1])
+            await index.add_vectors_from_ndarray(self.vectors[1:], self.ids[1:])
+
+        asyncio.run(add())
+        return index
+
+    def recall(self, index: FaissVectorIndex, k: int) -> float:
+        queries = self.vectors[::10]
+        results = asyncio.run(index.search_batch(queries, k=k))
+        expected = self.ids[::10]
+        hits = sum(doc_id in [result["id"] for result in row] for doc_id, row in zip(expected, results))
+        return hits / len(expected)
+
+    def test_recall_per_quantization(self):
+        # PQ codes only approximate distances, so it is checked over a wider k
+        for quantization, k, min_recall in [("none", 1, 1.0), ("sq8", 1, 1.0), ("binary", 1, 1.0), ("pq", 10, 0.9)]:
+            with self.subTest(quantization=quantization):
+                index = self.build_index(quantization)
+
+                self.assertEqual(index.index.ntotal, len(self.vectors))
+                self.assertGreaterEqual(self.recall(index, k), min_recall)
+
+    def test_untrained_vectors_are_searched_exactly(self):
+        index = FaissVectorIndex(dimension=self.DIMENSION, quantization="sq8")
+        asyncio.run(index.add_vectors_from_ndarray(self.vectors[:50], self.ids[:50]))
+
+        self.assertFalse(index.index.is_trained)
+        self.assertEqual(index.index.ntotal, 0)
+        results = asyncio.run(index.search_batch(self.vectors[:50], k=1))
+        self.assertEqual([row[0]["id"] for row in results], self.ids[:50])
+
+    def test_pq_needs_a_point_per_list(self):
+        index = FaissVectorIndex(dimension=self.DIMENSION, quantization="pq", pq_subvectors=8, nlist=1024,
+                                 min_training_points=10)
+
+        self.assertEqual(index.min_training_points, 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from app.infrastructure.cleaners.markdown_cleaner import MarkdownCleaner, RE2_AVAILABLE
+
+
+class TestMarkdownCleaner(unittest.TestCase):
+    # Outputs of the original pass-per-construct cleaner
+    CASES = [
+        # Code hides the markup it starts or ends in
+        ('<`(a~<[##>]`>', ''),
+        ('~<<~b#`[\t~`', '<< b'),
+        ('`a ```b``` c', '`a c'),
+        ('# Title with `code` and [link](u)', 'Title with and link'),
+        # Tags are removed after links and headers, even across them
+        ('[a<b](u) c>', 'a'),
+        ('#\n<x\ny>z', 'z'),
+        ('[a # b](c)', 'a b'),
+        ('# [a\n](b) tail', 'a tail'),
+        ('**bold** _it_ ~~s~~ <br/>', 'bold it s'),
+        ('### [Link](u) here *x*', 'Link here x'),
+        ('plain text\n\twith  spaces', 'plain text with spaces'),
+    ]
+
+    def test_clean(self):
+        cleaner = MarkdownCleaner()
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(cleaner.clean(text), expected)
+
+    def test_clean_batch_matches_clean(self):
+        cleaner = MarkdownCleaner()
+        texts = [text for text, _ in self.CASES]
+
+        self.assertEqual(cleaner.clean_batch(texts), [expected for _, expected in self.CASES])
+
+    def test_clean_batch_equals_clean_per_text(self):
+        cleaner = MarkdownCleaner()
+        rng = random.Random(0)
+        alphabet = 'ab #`[]()<>*_~\n\t'
+        for _ in range(200):
+            texts = [
+                ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            with self.subTest(texts=texts):
+                self.assertEqual(cleaner.clean_batch(texts), [cleaner.clean(text) for text in texts])
+
+    def test_clean_batch_with_separator_in_text(self):
+        cleaner = MarkdownCleaner()
+        texts = ['a\x00*b*', '# c']
+
+        self.assertEqual(cleaner.clean_batch(texts), [cleaner.clean(text) for text in texts])
+        self.assertEqual(cleaner.clean_batch([]), [])
+
+    @unittest.skipUnless(RE2_AVAILABLE, "google-re2 is not installed")
+    def test_linear_time_matches_default_engine(self):
+        cleaner = MarkdownCleaner(linear_time=True)
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(cleaner.clean(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
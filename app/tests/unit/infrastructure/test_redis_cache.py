@@ -0,0 +1,118 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from infrastructure.cache.redis_cache import RedisCache, _EMBEDDING_PREFIX
+
+
+class FakeInvalidations:
+    """Pub/sub stand-in that delivers a fixed list of invalidation messages."""
+
+    def __init__(self, *payloads):
+        self.payloads = payloads
+
+    async def listen(self):
+        yield {"type": "subscribe", "data": 1}
+        for data in self.payloads:
+            yield {"type": "message", "data": data}
+
+
+def make_cache(**kwargs) -> RedisCache:
+    cache = RedisCache(redis_url="redis://localhost:6379/0", client_tracking=False, **kwargs)
+    cache.connected = True
+    cache.binary_client = MagicMock()
+    cache.binary_client.set = AsyncMock(return_value=True)
+    cache.binary_client.get = AsyncMock(return_value=None)
+    cache.binary_client.mget = AsyncMock(return_value=[])
+    cache.binary_client.pipeline.return_value.execute = AsyncMock(return_value=[True, True])
+    return cache
+
+
+class TestEmbeddingEncoding(unittest.TestCase):
+    def test_embeddings_are_stored_as_float32_bytes_under_versioned_prefix(self):
+        cache = make_cache()
+
+        asyncio.run(cache.store_embedding("doc-1", [0.5, 1.5], ttl=60))
+
+        key, raw = cache.binary_client.set.await_args.args
+        self.assertEqual(key, f"{_EMBEDDING_PREFIX}doc-1")
+        self.assertEqual(raw, np.asarray([0.5, 1.5], dtype=np.float32).tobytes())
+        self.assertEqual(cache.binary_client.set.await_args.kwargs, {"ex": 60})
+
+    def test_stored_bytes_round_trip(self):
+        cache = make_cache()
+        cache.binary_client.get.return_value = np.asarray([0.25, -1.0, 3.0], dtype=np.float32).tobytes()
+
+        embedding = asyncio.run(cache.get_embedding("doc-1"))
+
+        np.testing.assert_array_equal(embedding, [0.25, -1.0, 3.0])
+        cache.binary_client.get.assert_awaited_once_with(f"{_EMBEDDING_PREFIX}doc-1")
+
+    def test_value_of_malformed_size_is_a_miss(self):
+        cache = make_cache()
+        cache.binary_client.get.return_value = b"\x00" * 7
+
+        self.assertIsNone(asyncio.run(cache.get_embedding("doc-1")))
+        self.assertNotIn(f"{_EMBEDDING_PREFIX}doc-1", cache._embedding_lru)
+
+    def test_value_of_wrong_dimension_is_a_miss(self):
+        cache = make_cache(embedding_dimension=4)
+        cache.binary_client.mget.return_value = [
+            np.zeros(4, dtype=np.float32).tobytes(),
+            np.zeros(3, dtype=np.float32).tobytes(),
+            None,
+        ]
+
+        embeddings = asyncio.run(cache.get_embeddings(["a", "b", "c"]))
+
+        self.assertEqual(embeddings[0].shape, (4,))
+        self.assertEqual(embeddings[1:], [None, None])
+
+
+class TestOwnWriteInvalidation(unittest.TestCase):
+    def setUp(self):
+        self.cache = make_cache()
+        self.cache._tracking = True
+        self.key = f"{_EMBEDDING_PREFIX}doc-1"
+
+    def listen(self, *payloads):
+        self.cache._invalidations = FakeInvalidations(*payloads)
+        asyncio.run(self.cache._listen_invalidations())
+
+    def test_echo_of_own_write_keeps_local_vector(self):
+        asyncio.run(self.cache.store_embedding("doc-1", [1.0, 2.0]))
+
+        self.listen([self.key])
+
+        self.assertIn(self.key, self.cache._embedding_lru)
+
+    def test_write_by_another_client_evicts_local_vector(self):
+        asyncio.run(self.cache.store_embedding("doc-1", [1.0, 2.0]))
+
+        # The echo of our write, then another client's write of the same key
+        self.listen([self.key], [self.key])
+
+        self.assertNotIn(self.key, self.cache._embedding_lru)
+
+    def test_failed_write_expects_no_echo(self):
+        self.cache.binary_client.set.side_effect = ConnectionError("redis down")
+        asyncio.run(self.cache.store_embedding("doc-1", [1.0, 2.0]))
+
+        self.listen([self.key])
+
+        self.assertNotIn(self.key, self.cache._embedding_lru)
+
+    def test_flush_clears_local_vectors(self):
+        asyncio.run(self.cache.store_embeddings({"doc-1": [1.0], "doc-2": [2.0]}))
+        self.assertEqual(len(self.cache._own_writes), 2)
+
+        self.listen(None)
+
+        self.assertEqual(len(self.cache._embedding_lru), 0)
+        self.assertEqual(len(self.cache._own_writes), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
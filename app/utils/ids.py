@@ -0,0 +1,108 @@
+# utils/ids.py
+"""
+Identifier utilities for the RAG system.
+
+UUIDv7 values (RFC 9562) start with a millisecond timestamp, so IDs created
+one after another sort together and land on the same B-tree index pages
+instead of at random positions like UUIDv4.
+
+Random UUIDv4 values are minted in batches from one os.urandom call, for
+code that creates many IDs in a loop (chunking, bulk inserts).
+"""
+import os
+import time
+import uuid
+from collections import deque
+
+# Optional imports - install these packages if needed
+try:
+    from uuid_utils import uuid7 as _fast_uuid7
+    UUID_UTILS_AVAILABLE = True
+except ImportError:
+    UUID_UTILS_AVAILABLE = False
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    Build a UUIDv7: 48-bit Unix time in milliseconds followed by 74 random bits.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 9562 variant
+    return uuid.UUID(int=value)
+
+
+def generate_uuid7() -> str:
+    """
+    Generate a time-ordered UUIDv7 string.
+
+    Returns
+    -------
+    str
+        The canonical 36-character UUID string.
+    """
+    if UUID_UTILS_AVAILABLE:
+        return str(_fast_uuid7())
+    return str(_uuid7())
+
+
+class _UUIDPool:
+    """
+    Pool of random UUIDv4 values as 32 hex characters.
+
+    Refills with one os.urandom call per batch and sets the version and
+    variant bits for the whole batch at once. deque.popleft is atomic, so
+    threads can share the pool without a lock; a refill race only mints an
+    extra batch.
+    """
+    __slots__ = ("_ids",)
+
+    BATCH_SIZE = 256
+
+    def __init__(self):
+        self._ids = deque()
+
+    def _refill(self) -> None:
+        raw = bytearray(os.urandom(16 * self.BATCH_SIZE))
+        raw[6::16] = bytes(b & 0x0F | 0x40 for b in raw[6::16])  # version 4
+        raw[8::16] = bytes(b & 0x3F | 0x80 for b in raw[8::16])  # RFC 4122 variant
+        hex_ids = raw.hex()
+        self._ids.extend([hex_ids[i:i + 32] for i in range(0, len(hex_ids), 32)])
+
+    def next_hex(self) -> str:
+        try:
+            return self._ids.popleft()
+        except IndexError:
+            self._refill()
+            return self._ids.popleft()
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+
+_UUID4_POOL = _UUIDPool()
+
+# A forked worker must not hand out the IDs left in its parent's pool
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_UUID4_POOL.clear)
+
+
+def generate_uuid4_hex() -> str:
+    """
+    Generate a random UUIDv4 as 32 hex characters.
+    """
+    return _UUID4_POOL.next_hex()
+
+
+def generate_uuid4() -> str:
+    """
+    Generate a random UUIDv4 string.
+
+    Returns
+    -------
+    str
+        The canonical 36-character UUID string, like str(uuid.uuid4()).
+    """
+    h = _UUID4_POOL.next_hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"